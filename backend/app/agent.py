@@ -5,20 +5,49 @@ This module handles interaction with Claude API, including tool definitions,
 system prompt management, and conversation handling.
 """
 
-import json
+import asyncio
+import hashlib
 import logging
+import os
 import random
-from typing import Dict, List, Any, Optional, Tuple
-from anthropic import Anthropic
+import re
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple, TypedDict, Union
+import orjson
+from anthropic import (
+    Anthropic,
+    AsyncAnthropic,
+    APIError,
+    APIConnectionError,
+    RateLimitError,
+    APITimeoutError
+)
+from .caching import TTLCache
 from .config import config
 from .constants import (
     DEFAULT_MAX_RETRIES,
     DEFAULT_API_TIMEOUT_SECONDS,
+    CHAT_RESPONSE_CACHE_TTL_SECONDS,
+    CHAT_RESPONSE_CACHE_MAX_ENTRIES,
+    GENERATION_RESPONSE_CACHE_TTL_SECONDS,
+    GENERATION_RESPONSE_CACHE_MAX_ENTRIES,
+    MAX_CONVERSATION_HISTORY_MESSAGES,
+    HISTORY_SUMMARY_MAX_LINES,
+    HISTORY_SUMMARY_LINE_CHARS,
+    TOOL_RESULT_KEEP_TURNS,
+    TOOL_TIMEOUT_SECONDS,
+    SLOW_TOOL_TIMEOUT_SECONDS,
+    TOOL_EXECUTOR_MAX_WORKERS,
     RETRY_BACKOFF_BASE,
     RECENT_QUESTIONS_DISPLAY_COUNT,
     MAX_QUESTIONS_IN_HISTORY,
     CUMULATIVE_REVIEW_CONCEPTS_COUNT,
     MAX_EXTERNAL_RESOURCES_TO_ATTACH,
+    VALID_QUESTION_TYPES,
     STAGE_PREVIEW,
     STAGE_START,
     STAGE_PRACTICE,
@@ -31,16 +60,26 @@ from .content_generators import (
     generate_diagnostic_request,
     generate_practice_request,
     generate_remediation_request,
-    generate_reinforcement_request
+    generate_reinforcement_request,
+    sanitize_user_input,
+    DEFAULT_STAGE_REQUEST
 )
 from .tools import (
     load_resource,
     load_assessment,
     load_concept_metadata,
+    load_concept_bundle,
     update_learner_model,
     calculate_mastery,
+    compute_mastery,
+    get_concept_calibration,
+    get_learner_model_signature,
     get_next_concept,
     load_learner_model,
+    load_external_resources,
+    read_resource_file,
+    select_personalized_teaching_moment,
+    should_show_confidence_rating,
     should_show_cumulative_review,
     select_concepts_for_cumulative,
     select_question_difficulty,
@@ -50,98 +89,116 @@ from .confidence import (
     calculate_calibration,
     get_calibration_feedback,
     should_intervene_on_confidence,
-    get_calibration_pattern_feedback,
-    calculate_overall_calibration
+    get_calibration_pattern_feedback
 )
 from .pedagogical_tools import (
     generate_contextualized_example,
     break_down_concept_application,
     compare_concepts
 )
+from .source_extraction import load_full_source_content
 
 logger = logging.getLogger(__name__)
 
+# Opening (```json or ```) and closing markdown fence around a generated object
+_CODE_FENCE_RE = re.compile(r"\A```[^\n]*\n?|\n?```\Z")
 
-def validate_diagnostic_content(content_obj: Dict) -> Tuple[bool, str]:
-    """
-    Validate diagnostic question content for structural integrity.
 
-    Checks:
-    - Multiple-choice: has exactly one correct answer, valid index, unique options
-    - Fill-blank: has correct answers matching number of blanks
-    - Dialogue: has question text
+def _validate_multiple_choice(content_obj: Dict) -> Optional[str]:
+    """Return an error message for invalid multiple-choice content, else None."""
+    if 'correctAnswer' not in content_obj:
+        return "Multiple-choice question missing 'correctAnswer' field"
 
-    Args:
-        content_obj: The parsed JSON content object
+    correct_answer = content_obj['correctAnswer']
+    if not isinstance(correct_answer, int):
+        return f"correctAnswer must be an integer, got {type(correct_answer).__name__}"
 
-    Returns:
-        Tuple of (is_valid: bool, error_message: str)
-    """
-    content_type = content_obj.get('type', '')
+    options = content_obj.get('options', [])
+    if not options:
+        return "Multiple-choice question missing 'options' array"
 
-    if content_type == 'multiple-choice':
-        # Validate multiple-choice question
-        if 'correctAnswer' not in content_obj:
-            return False, "Multiple-choice question missing 'correctAnswer' field"
+    if correct_answer < 0 or correct_answer >= len(options):
+        return f"correctAnswer index {correct_answer} out of bounds for {len(options)} options"
 
-        correct_answer = content_obj['correctAnswer']
-        if not isinstance(correct_answer, int):
-            return False, f"correctAnswer must be an integer, got {type(correct_answer).__name__}"
+    # Check for duplicate options
+    if len(set(options)) < len(options):
+        return "Multiple-choice question has duplicate options"
 
-        options = content_obj.get('options', [])
-        if not options:
-            return False, "Multiple-choice question missing 'options' array"
+    # Ensure scenario and question exist
+    if not content_obj.get('scenario'):
+        return "Multiple-choice question missing 'scenario' field (required for authentic context)"
 
-        if correct_answer < 0 or correct_answer >= len(options):
-            return False, f"correctAnswer index {correct_answer} out of bounds for {len(options)} options"
+    if not content_obj.get('question'):
+        return "Multiple-choice question missing 'question' field"
 
-        # Check for duplicate options
-        unique_options = set(options)
-        if len(unique_options) < len(options):
-            return False, "Multiple-choice question has duplicate options"
+    logger.debug("✓ Valid multiple-choice: %s unique options, correctAnswer=%s", len(options), correct_answer)
+    return None
 
-        # Ensure scenario and question exist
-        if 'scenario' not in content_obj or not content_obj['scenario']:
-            return False, "Multiple-choice question missing 'scenario' field (required for authentic context)"
 
-        if 'question' not in content_obj or not content_obj['question']:
-            return False, "Multiple-choice question missing 'question' field"
+def _validate_fill_blank(content_obj: Dict) -> Optional[str]:
+    """Return an error message for an invalid fill-blank exercise, else None."""
+    if 'correctAnswers' not in content_obj:
+        return "Fill-blank exercise missing 'correctAnswers' field"
 
-        logger.info(f"✓ Valid multiple-choice: {len(options)} unique options, correctAnswer={correct_answer}")
-        return True, ""
+    correct_answers = content_obj['correctAnswers']
+    if not isinstance(correct_answers, list):
+        return f"correctAnswers must be a list, got {type(correct_answers).__name__}"
 
-    elif content_type == 'fill-blank':
-        # Validate fill-blank exercise
-        if 'correctAnswers' not in content_obj:
-            return False, "Fill-blank exercise missing 'correctAnswers' field"
+    blanks = content_obj.get('blanks', [])
+    if not blanks:
+        return "Fill-blank exercise missing 'blanks' array"
 
-        correct_answers = content_obj['correctAnswers']
-        if not isinstance(correct_answers, list):
-            return False, f"correctAnswers must be a list, got {type(correct_answers).__name__}"
+    if len(correct_answers) != len(blanks):
+        return f"Fill-blank has {len(blanks)} blanks but {len(correct_answers)} correctAnswers"
 
-        blanks = content_obj.get('blanks', [])
-        if not blanks:
-            return False, "Fill-blank exercise missing 'blanks' array"
+    # Ensure sentence exists
+    if not content_obj.get('sentence'):
+        return "Fill-blank exercise missing 'sentence' field"
 
-        if len(correct_answers) != len(blanks):
-            return False, f"Fill-blank has {len(blanks)} blanks but {len(correct_answers)} correctAnswers"
+    logger.debug("✓ Valid fill-blank: %s blanks with matching answers", len(blanks))
+    return None
 
-        # Ensure sentence exists
-        if 'sentence' not in content_obj or not content_obj['sentence']:
-            return False, "Fill-blank exercise missing 'sentence' field"
 
-        logger.info(f"✓ Valid fill-blank: {len(blanks)} blanks with matching answers")
-        return True, ""
+def _validate_dialogue(content_obj: Dict) -> Optional[str]:
+    """Return an error message for an invalid dialogue question, else None."""
+    if not content_obj.get('question'):
+        return "Dialogue question missing 'question' field"
+
+    logger.debug("✓ Valid dialogue question")
+    return None
 
-    elif content_type == 'dialogue':
-        # Validate dialogue question
-        if 'question' not in content_obj or not content_obj['question']:
-            return False, "Dialogue question missing 'question' field"
 
-        logger.info(f"✓ Valid dialogue question")
+# Structural validators for diagnostic content, keyed by content type.
+# Non-diagnostic content types have no entry and are not validated.
+DIAGNOSTIC_VALIDATORS = {
+    'multiple-choice': _validate_multiple_choice,
+    'fill-blank': _validate_fill_blank,
+    'dialogue': _validate_dialogue,
+}
+
+
+def validate_diagnostic_content(content_obj: Dict) -> Tuple[bool, str]:
+    """
+    Validate diagnostic question content for structural integrity.
+
+    Checks:
+    - Multiple-choice: has exactly one correct answer, valid index, unique options
+    - Fill-blank: has correct answers matching number of blanks
+    - Dialogue: has question text
+
+    Args:
+        content_obj: The parsed JSON content object
+
+    Returns:
+        Tuple of (is_valid: bool, error_message: str)
+    """
+    validator = DIAGNOSTIC_VALIDATORS.get(content_obj.get('type', ''))
+    if validator is None:
         return True, ""
 
-    # Non-diagnostic content types don't need validation
+    error_msg = validator(content_obj)
+    if error_msg:
+        return False, error_msg
     return True, ""
 
 
@@ -158,21 +215,20 @@ def strip_video_content(content_obj: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Content object with videos removed
     """
-    if 'external_resources' in content_obj and content_obj['external_resources']:
-        # Filter out any resources with type: "video"
-        original_count = len(content_obj['external_resources'])
-        content_obj['external_resources'] = [
-            res for res in content_obj['external_resources']
-            if res.get('type') != 'video'
-        ]
-        removed_count = original_count - len(content_obj['external_resources'])
-
-        if removed_count > 0:
-            logger.info(f"🚫 Stripped {removed_count} video resource(s) from content")
-
+    resources = content_obj.get('external_resources')
+    # Most content has no videos; leave the list untouched in that case
+    if not resources or not any(res.get('type') == 'video' for res in resources):
+        return content_obj
+
+    # Filter out any resources with type: "video"
+    kept = [res for res in resources if res.get('type') != 'video']
+    logger.info("🚫 Stripped %s video resource(s) from content", len(resources) - len(kept))
+
+    if kept:
+        content_obj['external_resources'] = kept
+    else:
         # If no resources left, remove the field entirely
-        if not content_obj['external_resources']:
-            del content_obj['external_resources']
+        del content_obj['external_resources']
 
     return content_obj
 
@@ -238,11 +294,8 @@ Respond with ONLY a JSON object (no markdown):
 
 Score >= 0.5 means partial understanding. Keep everything SHORT and conversational."""
 
-        # Use a smaller model for faster evaluation
-        from anthropic import Anthropic
-        client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
-
-        response = client.messages.create(
+        # Use a smaller model for faster evaluation (shared client)
+        response = get_client().messages.create(
             model="claude-3-5-haiku-20241022",  # Use Haiku for fast evaluation
             max_tokens=300,
             timeout=15,
@@ -254,10 +307,9 @@ Score >= 0.5 means partial understanding. Keep everything SHORT and conversation
 
         # Parse the response
         response_text = response.content[0].text.strip()
-        logger.info(f"Dialogue evaluation response: {response_text[:200]}")
+        logger.info("Dialogue evaluation response: %s", response_text[:200])
 
         # Try to parse as JSON
-        import json
         try:
             # Remove any markdown code fences if present
             if response_text.startswith("```"):
@@ -266,7 +318,7 @@ Score >= 0.5 means partial understanding. Keep everything SHORT and conversation
                     response_text = response_text[4:]
                 response_text = response_text.strip()
 
-            result = json.loads(response_text)
+            result = orjson.loads(response_text)
 
             score = float(result.get("score", 0.5))
             is_correct = result.get("is_correct", score >= 0.5)
@@ -288,9 +340,9 @@ Score >= 0.5 means partial understanding. Keep everything SHORT and conversation
                 "dialogueComplete": should_complete
             }
 
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             # If JSON parsing fails, extract feedback from plain text
-            logger.warning(f"Failed to parse dialogue evaluation as JSON: {response_text[:100]}")
+            logger.warning("Failed to parse dialogue evaluation as JSON: %s", response_text[:100])
             return {
                 "is_correct": True,
                 "feedback": "Thank you for your explanation. Your response shows you're engaging with the material.",
@@ -300,7 +352,7 @@ Score >= 0.5 means partial understanding. Keep everything SHORT and conversation
             }
 
     except Exception as e:
-        logger.error(f"Error evaluating dialogue response: {e}")
+        logger.error("Error evaluating dialogue response: %s", e)
         # Default to neutral evaluation on error
         return {
             "is_correct": True,
@@ -311,21 +363,37 @@ Score >= 0.5 means partial understanding. Keep everything SHORT and conversation
         }
 
 
-# sanitize_user_input has been moved to content_generators.py
-# Import it if needed in this module for other functions
-from .content_generators import sanitize_user_input
+# Anthropic clients are created on first use so that importing this module
+# (tests, scripts) does not set up HTTP connection pools it never uses.
+# The async client is used by chat() so that FastAPI's event loop is not
+# blocked while waiting on Claude.
+_client: Optional[Anthropic] = None
+_async_client: Optional[AsyncAnthropic] = None
+
 
+def get_client() -> Anthropic:
+    """Return the shared synchronous Anthropic client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
+    return _client
 
-# Initialize Anthropic client
-client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
 
+def get_async_client() -> AsyncAnthropic:
+    """Return the shared async Anthropic client, creating it on first use."""
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncAnthropic(api_key=config.ANTHROPIC_API_KEY)
+    return _async_client
 
-def call_anthropic_with_retry(system_prompt: str, user_message: str, max_retries: int = DEFAULT_MAX_RETRIES, timeout: int = DEFAULT_API_TIMEOUT_SECONDS) -> Any:
+
+def call_anthropic_with_retry(system_prompt: Union[str, List[Dict[str, Any]]], user_message: str, max_retries: int = DEFAULT_MAX_RETRIES, timeout: int = DEFAULT_API_TIMEOUT_SECONDS) -> Any:
     """
     Call Anthropic API with retry logic and timeout.
 
     Args:
-        system_prompt: System prompt text
+        system_prompt: System prompt text, or a list of system text blocks
+            (e.g. from build_cached_system_prompt)
         user_message: User message text
         max_retries: Maximum number of retry attempts (default: 3)
         timeout: Timeout in seconds for each attempt (default: 30)
@@ -336,16 +404,13 @@ def call_anthropic_with_retry(system_prompt: str, user_message: str, max_retries
     Raises:
         Exception: If all retries fail
     """
-    import time
-    from anthropic import APIError, APIConnectionError, RateLimitError, APITimeoutError
-
     last_error = None
 
     for attempt in range(max_retries):
         try:
-            logger.info(f"API call attempt {attempt + 1}/{max_retries}")
+            logger.info("API call attempt %s/%s", attempt + 1, max_retries)
 
-            response = client.messages.create(
+            response = get_client().messages.create(
                 model=config.ANTHROPIC_MODEL,
                 max_tokens=4096,
                 timeout=timeout,
@@ -356,223 +421,470 @@ def call_anthropic_with_retry(system_prompt: str, user_message: str, max_retries
                 }]
             )
 
-            logger.info(f"API call successful on attempt {attempt + 1}")
+            logger.info("API call successful on attempt %s", attempt + 1)
             return response
 
         except (APIConnectionError, APITimeoutError, RateLimitError) as e:
             # Transient errors - retry with exponential backoff
             last_error = e
             wait_time = RETRY_BACKOFF_BASE ** attempt  # 2^0=1s, 2^1=2s, 2^2=4s
-            logger.warning(f"Transient API error on attempt {attempt + 1}: {type(e).__name__}: {str(e)}")
+            logger.warning("Transient API error on attempt %s: %s: %s", attempt + 1, type(e).__name__, e)
 
             if attempt < max_retries - 1:
-                logger.info(f"Retrying in {wait_time} seconds...")
+                logger.info("Retrying in %s seconds...", wait_time)
                 time.sleep(wait_time)
             else:
-                logger.error(f"All {max_retries} attempts failed")
+                logger.error("All %s attempts failed", max_retries)
                 raise Exception(f"API call failed after {max_retries} attempts: {type(e).__name__}: {str(e)}")
 
         except APIError as e:
             # Non-transient API errors - don't retry
-            logger.error(f"Non-transient API error: {type(e).__name__}: {str(e)}")
+            logger.error("Non-transient API error: %s: %s", type(e).__name__, e)
             raise Exception(f"API error: {type(e).__name__}: {str(e)}")
 
         except Exception as e:
             # Unexpected errors - don't retry
-            logger.error(f"Unexpected error during API call: {type(e).__name__}: {str(e)}")
+            logger.error("Unexpected error during API call: %s: %s", type(e).__name__, e)
             raise Exception(f"Unexpected error: {type(e).__name__}: {str(e)}")
 
     # Should never reach here, but just in case
     raise Exception(f"API call failed: {last_error}")
 
 
+async def call_anthropic_with_retry_async(system_prompt: Union[str, List[Dict[str, Any]]], user_message: str, max_retries: int = DEFAULT_MAX_RETRIES, timeout: int = DEFAULT_API_TIMEOUT_SECONDS) -> Any:
+    """
+    Async variant of call_anthropic_with_retry using the async client.
+
+    Backoff waits use asyncio.sleep, so retries do not block the event loop.
+
+    Args:
+        system_prompt: System prompt text, or a list of system text blocks
+            (e.g. from build_cached_system_prompt)
+        user_message: User message text
+        max_retries: Maximum number of retry attempts (default: 3)
+        timeout: Timeout in seconds for each attempt (default: 30)
+
+    Returns:
+        Anthropic API response object
+
+    Raises:
+        Exception: If all retries fail
+    """
+    last_error = None
+
+    for attempt in range(max_retries):
+        try:
+            logger.info("API call attempt %s/%s", attempt + 1, max_retries)
+
+            response = await get_async_client().messages.create(
+                model=config.ANTHROPIC_MODEL,
+                max_tokens=4096,
+                timeout=timeout,
+                system=system_prompt,
+                messages=[{
+                    "role": "user",
+                    "content": user_message
+                }]
+            )
+
+            logger.info("API call successful on attempt %s", attempt + 1)
+            return response
+
+        except (APIConnectionError, APITimeoutError, RateLimitError) as e:
+            last_error = e
+            wait_time = RETRY_BACKOFF_BASE ** attempt
+            logger.warning("Transient API error on attempt %s: %s: %s", attempt + 1, type(e).__name__, e)
+
+            if attempt < max_retries - 1:
+                logger.info("Retrying in %s seconds...", wait_time)
+                await asyncio.sleep(wait_time)
+            else:
+                logger.error("All %s attempts failed", max_retries)
+                raise Exception(f"API call failed after {max_retries} attempts: {type(e).__name__}: {str(e)}")
+
+        except APIError as e:
+            logger.error("Non-transient API error: %s: %s", type(e).__name__, e)
+            raise Exception(f"API error: {type(e).__name__}: {str(e)}")
+
+        except Exception as e:
+            logger.error("Unexpected error during API call: %s: %s", type(e).__name__, e)
+            raise Exception(f"Unexpected error: {type(e).__name__}: {str(e)}")
+
+    raise Exception(f"API call failed: {last_error}")
+
+
 # ============================================================================
 # System Prompt Management
 # ============================================================================
 
+# Prompt files are static in production but edited by hand during development,
+# so their contents are cached and only re-read when the file's mtime changes.
+_PROMPT_FILE_CACHE: Dict[Path, Tuple[int, str]] = {}
+_SYSTEM_PROMPT_CACHE: Optional[Tuple[Tuple[int, int], str]] = None
+
+# Rendered learner context keyed by learner file: (file signature, context)
+_LEARNER_CONTEXT_CACHE: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+
+
+def reload_prompts() -> None:
+    """
+    Drop all cached prompt text so the next call re-reads it from disk.
+
+    Prompt caches already refresh when files change; this is for cases where
+    a change should be picked up regardless (e.g. during development).
+    """
+    global _SYSTEM_PROMPT_CACHE
+    _PROMPT_FILE_CACHE.clear()
+    _SYSTEM_PROMPT_CACHE = None
+    _LEARNER_CONTEXT_CACHE.clear()
+
+
+def _read_prompt_file(path: Path) -> Tuple[int, str]:
+    """
+    Read a prompt file, reusing the cached contents while its mtime is unchanged.
+
+    Args:
+        path: Path to the prompt file
+
+    Returns:
+        Tuple of (mtime_ns, file contents)
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _PROMPT_FILE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached
+
+    with open(path, "r", encoding="utf-8") as f:
+        entry = (mtime, f.read())
+
+    _PROMPT_FILE_CACHE[path] = entry
+    logger.info("Loaded prompt file %s", path)
+    return entry
+
+
 def load_system_prompt() -> str:
     """
     Load the tutor agent system prompt and confidence addendum.
 
+    The combined prompt is cached and only rebuilt when either file changes.
+    In production the files are not edited in place, so once built the prompt
+    is returned without re-checking them; use reload_prompts() to refresh it.
+
     Returns:
         Complete system prompt as string
     """
-    try:
-        # Load main system prompt
-        with open(config.SYSTEM_PROMPT_FILE, "r", encoding="utf-8") as f:
-            main_prompt = f.read()
+    global _SYSTEM_PROMPT_CACHE
 
-        # Load confidence tracking addendum
-        with open(config.CONFIDENCE_PROMPT_FILE, "r", encoding="utf-8") as f:
-            confidence_addendum = f.read()
+    if _SYSTEM_PROMPT_CACHE is not None and config.ENVIRONMENT == "production":
+        return _SYSTEM_PROMPT_CACHE[1]
 
-        # Combine prompts
-        system_prompt = f"{main_prompt}\n\n{confidence_addendum}"
+    main_mtime, main_prompt = _read_prompt_file(config.SYSTEM_PROMPT_FILE)
+    confidence_mtime, confidence_addendum = _read_prompt_file(config.CONFIDENCE_PROMPT_FILE)
 
-        logger.info("Loaded system prompt")
-        return system_prompt
+    cache_key = (main_mtime, confidence_mtime)
+    if _SYSTEM_PROMPT_CACHE is None or _SYSTEM_PROMPT_CACHE[0] != cache_key:
+        # Combine prompts
+        _SYSTEM_PROMPT_CACHE = (cache_key, f"{main_prompt}\n\n{confidence_addendum}")
 
-    except Exception as e:
-        logger.error(f"Error loading system prompt: {e}")
-        raise
+    return _SYSTEM_PROMPT_CACHE[1]
 
 
 def load_content_generation_prompt(course_id: Optional[str] = None) -> str:
     """
     Load the content generation instructions.
 
+    File contents are cached and only re-read when the file changes.
+
     Args:
         course_id: Optional course ID to load course-specific prompt
 
     Returns:
         Content generation prompt as string
     """
-    try:
-        # Try to load course-specific prompt first
-        if course_id:
-            course_dir = config.get_course_dir(course_id)
-            course_prompt_file = course_dir / "content-generation-addendum.md"
-            if course_prompt_file.exists():
-                with open(course_prompt_file, "r", encoding="utf-8") as f:
-                    content_prompt = f.read()
-                logger.info(f"Loaded course-specific content generation prompt for {course_id}")
-                return content_prompt
-
-        # Fall back to default prompt
-        with open(config.CONTENT_GENERATION_PROMPT_FILE, "r", encoding="utf-8") as f:
-            content_prompt = f.read()
-
-        logger.info("Loaded default content generation prompt")
-        return content_prompt
+    # Try to load course-specific prompt first
+    if course_id:
+        course_dir = config.get_course_dir(course_id)
+        course_prompt_file = course_dir / "content-generation-addendum.md"
+        try:
+            # A single stat both checks existence and validates the cache
+            _, content_prompt = _read_prompt_file(course_prompt_file)
+        except FileNotFoundError:
+            pass
+        else:
+            return content_prompt
+
+    # Fall back to default prompt
+    _, content_prompt = _read_prompt_file(config.CONTENT_GENERATION_PROMPT_FILE)
+    return content_prompt
+
+
+# Learner profile descriptions used when building the learner context
+GRAMMAR_EXPERIENCE_DESCRIPTIONS = {
+    "loved": "Enthusiastic about grammar - can use technical terminology",
+    "okay": "Has basic grammar foundation - balance terminology with explanation",
+    "confused": "Found grammar confusing - use simple language and clear examples",
+    "forgotten": "Needs grammar refresher - build from basics"
+}
+
+LEARNING_STYLE_DESCRIPTIONS = {
+    "narrative": "Prefers story-based learning through scenarios, conversations, and contextual examples",
+    "dialogue": "Prefers Socratic discussion - being asked questions and explaining their thinking",
+    "interactive": "Prefers hands-on exploration - clicking, dragging, and discovering patterns",
+    "varied": "Enjoys variety - mix different content types (tables, examples, exercises)"
+}
+
+# Teaching guidance for each learning style
+CONTENT_FORMAT_PREFERENCES = {
+    "narrative": "Generate 'example-set' content with rich contextual examples and stories. Include 'lesson' content with narrative explanations connecting grammar to real usage. Avoid videos.\n",
+    "dialogue": "Generate 'dialogue' questions that ask the learner to explain their understanding. Use Socratic questioning. Let them articulate concepts in their own words. Avoid videos.\n",
+    "interactive": "Generate interactive widgets: 'paradigm-table', 'declension-explorer', 'word-order-manipulator'. Let them click, explore, and discover patterns hands-on. Avoid videos.\n",
+    "varied": "Vary the content types - alternate between paradigm tables, example sets with stories, dialogue questions, and fill-blank exercises. Keep it diverse. Avoid videos.\n"
+}
+DEFAULT_CONTENT_FORMAT_PREFERENCE = "Use written text content with clear examples. Avoid videos.\n"
+
+ROMANCE_LANGUAGES = ('spanish', 'french', 'italian', 'portuguese', 'romanian', 'catalan')
+INFLECTED_LANGUAGES = ('german', 'russian', 'greek', 'ancient greek', 'polish', 'finnish', 'hungarian', 'czech', 'latin', 'sanskrit', 'icelandic')
+
+# Fixed-shape sections of the learner context, filled with str.format_map
+LEARNER_CONTEXT_HEADER_TEMPLATE = "\n\n## Current Learner Context\n\n**Learner ID**: {learner_id}\n"
+
+SUBJECT_OBJECT_TEMPLATE = (
+    "- Subject/Object understanding: {understandsSubjectObject}\n"
+    "- Confidence level: {subjectObjectConfidence}\n"
+)
 
-    except Exception as e:
-        logger.error(f"Error loading content generation prompt: {e}")
-        raise
+INTERESTS_TEMPLATE = (
+    "**Interests**: {interests}\n"
+    "**Example Personalization**: Use examples related to {first_interest} when possible.\n"
+)
 
+LEARNING_PROGRESS_TEMPLATE = (
+    "\n### Learning Progress\n\n"
+    "**Current Concept**: {current_concept}\n"
+    "**Concepts Completed**: {concepts_completed}\n"
+    "**Total Assessments**: {total_assessments}\n"
+)
 
-def inject_learner_context(base_prompt: str, learner_id: str) -> str:
+CURRENT_CONCEPT_TEMPLATE = (
+    "**Current Concept Status**: {status}\n"
+    "**Assessments for Current Concept**: {assessment_count}\n"
+    "**Current Mastery Score**: {mastery_score:.2f}\n"
+)
+
+MASTERY_STATUS_TEMPLATE = "**Mastery Status**: {recommendation} - {reason}\n"
+
+# Appended only where tools are sent (chat); content generation shares the learner context but has no tools
+MASTERY_TOOL_HINT = (
+    "(Mastery Status is already calculated for the current concept; "
+    "use calculate_mastery only for other concepts)\n"
+)
+
+
+def build_learner_context(learner_id: str) -> str:
     """
-    Inject learner-specific context into system prompt.
+    Build the learner-specific section of the system prompt.
+
+    Kept separate from the base prompt so the static prefix can be
+    marked for prompt caching while this per-learner suffix varies.
+    The rendered context is cached until the learner model is saved again.
 
     Args:
-        base_prompt: Base system prompt
         learner_id: Learner identifier
 
     Returns:
-        System prompt with learner context
+        Learner context section (empty string if it cannot be built)
     """
     try:
+        learner_file = config.get_learner_file(learner_id)
+        signature = get_learner_model_signature(learner_id)
+        cached = _LEARNER_CONTEXT_CACHE.get(learner_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
         model = load_learner_model(learner_id)
 
         # Build learner context
-        context = f"\n\n## Current Learner Context\n\n"
-        context += f"**Learner ID**: {learner_id}\n"
+        parts = [LEARNER_CONTEXT_HEADER_TEMPLATE.format_map({"learner_id": learner_id})]
 
         # Add learner name if available
         if model.get("learner_name"):
-            context += f"**Learner Name**: {model['learner_name']}\n"
+            parts.append(f"**Learner Name**: {model['learner_name']}\n")
 
         # Add learner profile for personalization
         profile = model.get("profile", {})
         if profile:
-            context += f"\n### Learner Profile (for Personalization)\n\n"
+            parts.append("\n### Learner Profile (for Personalization)\n\n")
 
             if profile.get("background"):
-                context += f"**Background & Motivation**: {profile['background']}\n"
+                parts.append(f"**Background & Motivation**: {profile['background']}\n")
 
             if profile.get("priorKnowledge"):
                 pk = profile["priorKnowledge"]
-                context += f"\n**Prior Knowledge**:\n"
+                parts.append("\n**Prior Knowledge**:\n")
                 if pk.get("languageDetails"):
                     lang_text = pk['languageDetails'].lower()
-                    context += f"- Languages studied: {pk['languageDetails']}\n"
+                    parts.append(f"- Languages studied: {pk['languageDetails']}\n")
 
                     # Auto-detect Romance languages
-                    romance_languages = ['spanish', 'french', 'italian', 'portuguese', 'romanian', 'catalan']
-                    has_romance = pk.get("hasRomanceLanguage") or any(lang in lang_text for lang in romance_languages)
+                    has_romance = pk.get("hasRomanceLanguage") or any(lang in lang_text for lang in ROMANCE_LANGUAGES)
                     if has_romance:
-                        context += f"- Has studied Romance language - use cognates and comparisons!\n"
+                        parts.append("- Has studied Romance language - use cognates and comparisons!\n")
 
                     # Auto-detect inflected languages (with grammatical cases)
-                    inflected_languages = ['german', 'russian', 'greek', 'ancient greek', 'polish', 'finnish', 'hungarian', 'czech', 'latin', 'sanskrit', 'icelandic']
-                    has_inflected = pk.get("hasInflectedLanguage") or any(lang in lang_text for lang in inflected_languages)
+                    has_inflected = pk.get("hasInflectedLanguage") or any(lang in lang_text for lang in INFLECTED_LANGUAGES)
                     if has_inflected:
-                        context += f"- Has studied inflected language - familiar with cases!\n"
+                        parts.append("- Has studied inflected language - familiar with cases!\n")
                 elif pk.get("hasRomanceLanguage"):
-                    context += f"- Has studied Romance language (Spanish/French) - use cognates and comparisons!\n"
+                    parts.append("- Has studied Romance language (Spanish/French) - use cognates and comparisons!\n")
                 elif pk.get("hasInflectedLanguage"):
-                    context += f"- Has studied inflected language (German) - familiar with cases!\n"
+                    parts.append("- Has studied inflected language (German) - familiar with cases!\n")
 
                 if "understandsSubjectObject" in pk:
-                    context += f"- Subject/Object understanding: {pk.get('understandsSubjectObject')}\n"
-                    context += f"- Confidence level: {pk.get('subjectObjectConfidence', 'unknown')}\n"
+                    parts.append(SUBJECT_OBJECT_TEMPLATE.format_map({
+                        "understandsSubjectObject": pk["understandsSubjectObject"],
+                        "subjectObjectConfidence": pk.get("subjectObjectConfidence", "unknown")
+                    }))
 
             if profile.get("grammarExperience"):
-                exp_map = {
-                    "loved": "Enthusiastic about grammar - can use technical terminology",
-                    "okay": "Has basic grammar foundation - balance terminology with explanation",
-                    "confused": "Found grammar confusing - use simple language and clear examples",
-                    "forgotten": "Needs grammar refresher - build from basics"
-                }
-                context += f"\n**Grammar Comfort**: {exp_map.get(profile['grammarExperience'], profile['grammarExperience'])}\n"
+                parts.append(f"\n**Grammar Comfort**: {GRAMMAR_EXPERIENCE_DESCRIPTIONS.get(profile['grammarExperience'], profile['grammarExperience'])}\n")
 
             if profile.get("learningStyle"):
-                style_map = {
-                    "narrative": "Prefers story-based learning through scenarios, conversations, and contextual examples",
-                    "dialogue": "Prefers Socratic discussion - being asked questions and explaining their thinking",
-                    "interactive": "Prefers hands-on exploration - clicking, dragging, and discovering patterns",
-                    "varied": "Enjoys variety - mix different content types (tables, examples, exercises)"
-                }
-                context += f"**Learning Style**: {style_map.get(profile['learningStyle'], profile['learningStyle'])}\n"
+                parts.append(f"**Learning Style**: {LEARNING_STYLE_DESCRIPTIONS.get(profile['learningStyle'], profile['learningStyle'])}\n")
 
                 # Add specific teaching guidance based on learning style
-                context += f"\n**Content Format Preference**: "
-                if profile['learningStyle'] == "narrative":
-                    context += "Generate 'example-set' content with rich contextual examples and stories. Include 'lesson' content with narrative explanations connecting grammar to real usage. Avoid videos.\n"
-                elif profile['learningStyle'] == "dialogue":
-                    context += "Generate 'dialogue' questions that ask the learner to explain their understanding. Use Socratic questioning. Let them articulate concepts in their own words. Avoid videos.\n"
-                elif profile['learningStyle'] == "interactive":
-                    context += "Generate interactive widgets: 'paradigm-table', 'declension-explorer', 'word-order-manipulator'. Let them click, explore, and discover patterns hands-on. Avoid videos.\n"
-                elif profile['learningStyle'] == "varied":
-                    context += "Vary the content types - alternate between paradigm tables, example sets with stories, dialogue questions, and fill-blank exercises. Keep it diverse. Avoid videos.\n"
-                else:
-                    context += "Use written text content with clear examples. Avoid videos.\n"
+                parts.append("\n**Content Format Preference**: ")
+                parts.append(CONTENT_FORMAT_PREFERENCES.get(profile['learningStyle'], DEFAULT_CONTENT_FORMAT_PREFERENCE))
 
             if profile.get("interests"):
-                context += f"**Interests**: {profile['interests']}\n"
-                context += f"**Example Personalization**: Use examples related to {profile['interests'].split(',')[0].strip()} when possible.\n"
+                parts.append(INTERESTS_TEMPLATE.format_map({
+                    "interests": profile["interests"],
+                    "first_interest": profile["interests"].partition(",")[0].strip()
+                }))
 
-        context += f"\n### Learning Progress\n\n"
-        context += f"**Current Concept**: {model['current_concept']}\n"
-        context += f"**Concepts Completed**: {model['overall_progress']['concepts_completed']}\n"
-        context += f"**Total Assessments**: {model['overall_progress']['total_assessments']}\n"
+        parts.append(LEARNING_PROGRESS_TEMPLATE.format_map({
+            "current_concept": model["current_concept"],
+            **model["overall_progress"]
+        }))
 
         # Add current concept progress if exists
         current_concept = model["current_concept"]
         if current_concept in model["concepts"]:
             concept_data = model["concepts"][current_concept]
-            context += f"**Current Concept Status**: {concept_data['status']}\n"
-            context += f"**Assessments for Current Concept**: {len(concept_data['assessments'])}\n"
-            context += f"**Current Mastery Score**: {concept_data['mastery_score']:.2f}\n"
+            parts.append(CURRENT_CONCEPT_TEMPLATE.format_map({
+                "status": concept_data["status"],
+                "assessment_count": len(concept_data["assessments"]),
+                "mastery_score": concept_data["mastery_score"]
+            }))
+
+            # Precompute mastery so Claude does not need a calculate_mastery round trip
+            parts.append(MASTERY_STATUS_TEMPLATE.format_map(compute_mastery(current_concept, concept_data)))
 
             # Add calibration metrics if available
             if concept_data["confidence_history"]:
-                calibration_metrics = calculate_overall_calibration(concept_data["confidence_history"])
-                context += f"**Calibration Accuracy**: {calibration_metrics['overall_accuracy']:.2f}\n"
+                calibration_metrics = get_concept_calibration(concept_data)
+                parts.append(f"**Calibration Accuracy**: {calibration_metrics['overall_accuracy']:.2f}\n")
 
-        return base_prompt + context
+        context = "".join(parts)
+        _LEARNER_CONTEXT_CACHE[learner_file] = (signature, context)
+        return context
 
     except Exception as e:
-        logger.error(f"Error injecting learner context: {e}")
-        # Return base prompt if context injection fails
-        return base_prompt
+        logger.error("Error injecting learner context: %s", e)
+        # Fall back to the base prompt alone if context injection fails
+        return ""
+
+
+def inject_learner_context(base_prompt: str, learner_id: str) -> str:
+    """
+    Inject learner-specific context into system prompt.
+
+    Args:
+        base_prompt: Base system prompt
+        learner_id: Learner identifier
+
+    Returns:
+        System prompt with learner context
+    """
+    return base_prompt + build_learner_context(learner_id)
+
+
+def build_cached_system_prompt(base_prompt: str, learner_context: str,
+                               dynamic_context: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Build a structured system prompt with the static prefix marked for caching.
+
+    When dynamic_context is given, the learner context gets a cache
+    breakpoint of its own (it only changes when the learner model is saved)
+    and dynamic_context follows it uncached.
+
+    Args:
+        base_prompt: Static base system prompt (cached across requests)
+        learner_context: Per-learner context appended after the cached prefix
+        dynamic_context: Per-request context appended last (optional)
+
+    Returns:
+        List of system prompt text blocks for the Messages API
+    """
+    blocks = [{
+        "type": "text",
+        "text": base_prompt,
+        "cache_control": {"type": "ephemeral"}
+    }]
+    if learner_context:
+        block = {"type": "text", "text": learner_context}
+        if dynamic_context is not None:
+            block["cache_control"] = {"type": "ephemeral"}
+        blocks.append(block)
+    if dynamic_context:
+        blocks.append({"type": "text", "text": dynamic_context})
+    return blocks
+
+
+def mark_history_cache_breakpoint(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Mark the end of the conversation so far for prompt caching.
+
+    Each request (including every hop of the tool-use loop) re-sends the
+    whole history, so caching up to its last message lets the next request
+    reuse that prefix instead of re-processing it. The history itself is
+    not modified, so breakpoints never accumulate across requests.
+
+    Args:
+        messages: Conversation history to send
+
+    Returns:
+        A new list whose last message's final block carries cache_control
+    """
+    if not messages:
+        return messages
+
+    last = messages[-1]
+    content = last["content"]
+    if isinstance(content, str):
+        blocks = [{"type": "text", "text": content}]
+    else:
+        blocks = list(content)
+    if not blocks:
+        return messages
+    blocks[-1] = {**blocks[-1], "cache_control": {"type": "ephemeral"}}
+
+    return messages[:-1] + [{**last, "content": blocks}]
 
 
 # ============================================================================
 # Tool Definitions for Claude API
 # ============================================================================
 
-TOOL_DEFINITIONS = [
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+TOOL_DEFINITIONS = _freeze([
     {
         "name": "load_resource",
         "description": "Load a learning resource (text-explainer or examples) from the resource bank for a specific concept.",
@@ -625,6 +937,20 @@ TOOL_DEFINITIONS = [
             "required": ["concept_id"]
         }
     },
+    {
+        "name": "load_concept_bundle",
+        "description": "Load a concept's metadata, text-explainer and examples in one call. Prefer this over separate load_concept_metadata and load_resource calls when you need more than one of them.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "concept_id": {
+                    "type": "string",
+                    "description": "The concept identifier (e.g., 'concept-001')"
+                }
+            },
+            "required": ["concept_id"]
+        }
+    },
     {
         "name": "track_confidence",
         "description": "Calculate calibration between student's self-reported confidence and actual performance. Returns calibration analysis and feedback.",
@@ -806,161 +1132,270 @@ TOOL_DEFINITIONS = [
             "required": ["concept_id_a", "concept_id_b"]
         }
     }
-]
+])
+
+# Marking the last tool caches the whole tool block as part of the prompt prefix.
+# Both tuples are built once at import and shared read-only by every request.
+CACHED_TOOL_DEFINITIONS = TOOL_DEFINITIONS[:-1] + (
+    _freeze({**TOOL_DEFINITIONS[-1], "cache_control": {"type": "ephemeral"}}),
+)
 
 
 # ============================================================================
 # Tool Execution Handler
 # ============================================================================
 
-def execute_tool(tool_name: str, tool_input: Dict[str, Any], learner_id: Optional[str] = None) -> Dict[str, Any]:
-    """
-    Execute a tool call and return the result.
+class ToolResult(TypedDict, total=False):
+    """Envelope returned by every tool: data on success, error otherwise."""
+    success: bool
+    data: Any
+    error: str
+
+
+def _handle_load_resource(tool_input: Dict[str, Any], course_id: Optional[str]) -> ToolResult:
+    result = load_resource(
+        concept_id=tool_input["concept_id"],
+        resource_type=tool_input["resource_type"],
+        course_id=course_id
+    )
+    return {"success": True, "data": result}
+
+
+def _handle_load_assessment(tool_input: Dict[str, Any], course_id: Optional[str]) -> ToolResult:
+    result = load_assessment(
+        concept_id=tool_input["concept_id"],
+        assessment_type=tool_input["assessment_type"],
+        course_id=course_id
+    )
+    return {"success": True, "data": result}
+
+
+def _handle_load_concept_metadata(tool_input: Dict[str, Any], course_id: Optional[str]) -> ToolResult:
+    result = load_concept_metadata(
+        concept_id=tool_input["concept_id"],
+        course_id=course_id
+    )
+    return {"success": True, "data": result}
+
+
+def _handle_load_concept_bundle(tool_input: Dict[str, Any], course_id: Optional[str]) -> ToolResult:
+    result = load_concept_bundle(
+        concept_id=tool_input["concept_id"],
+        course_id=course_id
+    )
+    return {"success": True, "data": result}
+
+
+def _handle_track_confidence(tool_input: Dict[str, Any], course_id: Optional[str]) -> ToolResult:
+    calibration = calculate_calibration(
+        self_confidence=tool_input["self_confidence"],
+        actual_score=tool_input["actual_score"]
+    )
+    feedback = get_calibration_feedback(calibration)
+    return {
+        "success": True,
+        "data": {
+            "calibration": calibration,
+            "feedback": feedback
+        }
+    }
 
-    Args:
-        tool_name: Name of the tool to execute
-        tool_input: Input parameters for the tool
-        learner_id: Learner ID for course context (optional)
 
-    Returns:
-        Tool execution result
-    """
-    try:
-        # Get course_id from learner model if available
-        course_id = None
-        if learner_id:
-            try:
-                learner_model = load_learner_model(learner_id)
-                course_id = learner_model.get("current_course")
-            except Exception as e:
-                logger.warning(f"Could not load learner model for {learner_id}: {e}")
+def _handle_update_learner_model(tool_input: Dict[str, Any], course_id: Optional[str]) -> ToolResult:
+    update_learner_model(
+        learner_id=tool_input["learner_id"],
+        concept_id=tool_input["concept_id"],
+        assessment_data=tool_input["assessment_data"]
+    )
+    return {"success": True, "data": {"message": "Learner model updated successfully"}}
 
-        if tool_name == "load_resource":
-            result = load_resource(
-                concept_id=tool_input["concept_id"],
-                resource_type=tool_input["resource_type"],
-                course_id=course_id
-            )
-            return {"success": True, "data": result}
 
-        elif tool_name == "load_assessment":
-            result = load_assessment(
-                concept_id=tool_input["concept_id"],
-                assessment_type=tool_input["assessment_type"],
-                course_id=course_id
-            )
-            return {"success": True, "data": result}
+def _handle_calculate_mastery(tool_input: Dict[str, Any], course_id: Optional[str]) -> ToolResult:
+    result = calculate_mastery(
+        learner_id=tool_input["learner_id"],
+        concept_id=tool_input["concept_id"]
+    )
+    return {"success": True, "data": result}
 
-        elif tool_name == "load_concept_metadata":
-            result = load_concept_metadata(
-                concept_id=tool_input["concept_id"],
-                course_id=course_id
-            )
-            return {"success": True, "data": result}
 
-        elif tool_name == "track_confidence":
-            calibration = calculate_calibration(
-                self_confidence=tool_input["self_confidence"],
-                actual_score=tool_input["actual_score"]
-            )
-            feedback = get_calibration_feedback(calibration)
-            return {
-                "success": True,
-                "data": {
-                    "calibration": calibration,
-                    "feedback": feedback
-                }
-            }
+def _handle_get_next_concept(tool_input: Dict[str, Any], course_id: Optional[str]) -> ToolResult:
+    result = get_next_concept(
+        current_concept_id=tool_input["current_concept_id"],
+        course_id=course_id
+    )
+    return {"success": True, "data": {"next_concept": result}}
 
-        elif tool_name == "update_learner_model":
-            result = update_learner_model(
-                learner_id=tool_input["learner_id"],
-                concept_id=tool_input["concept_id"],
-                assessment_data=tool_input["assessment_data"]
-            )
-            return {"success": True, "data": {"message": "Learner model updated successfully"}}
 
-        elif tool_name == "calculate_mastery":
-            result = calculate_mastery(
-                learner_id=tool_input["learner_id"],
-                concept_id=tool_input["concept_id"]
-            )
-            return {"success": True, "data": result}
+# Sources listed in course/concept metadata.json, keyed by file:
+# (mtime_ns, {source_id: source})
+_SOURCE_INDEX_CACHE: Dict[Path, Tuple[int, Dict[str, Dict[str, Any]]]] = {}
 
-        elif tool_name == "get_next_concept":
-            result = get_next_concept(
-                current_concept_id=tool_input["current_concept_id"],
-                course_id=course_id
-            )
-            return {"success": True, "data": {"next_concept": result}}
 
-        elif tool_name == "load_external_source":
-            from .source_extraction import load_full_source_content
-            from .config import config as app_config
-            import json
+def _load_source_index(metadata_file: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Index the sources in a metadata.json by id, reusing the index while its mtime is unchanged.
 
-            # Load metadata to find source URL and type
-            source_id = tool_input["source_id"]
-            concept_id = tool_input.get("concept_id")
+    Args:
+        metadata_file: Path to the course or concept metadata.json
 
-            if concept_id:
-                # Concept-level source
-                concept_dir = app_config.get_concept_dir(concept_id, course_id)
-                metadata_file = concept_dir / "metadata.json"
-            else:
-                # Course-level source
-                course_dir = app_config.get_course_dir(course_id or app_config.DEFAULT_COURSE_ID)
-                metadata_file = course_dir / "metadata.json"
+    Returns:
+        Dictionary mapping source id to source entry (first entry wins on duplicate ids)
 
-            if not metadata_file.exists():
-                return {"success": False, "error": "Metadata file not found"}
+    Raises:
+        FileNotFoundError: If the metadata file doesn't exist
+    """
+    mtime = os.stat(metadata_file).st_mtime_ns
+    cached = _SOURCE_INDEX_CACHE.get(metadata_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    metadata = orjson.loads(metadata_file.read_bytes())
+    index: Dict[str, Dict[str, Any]] = {}
+    for source in metadata.get("sources", []):
+        index.setdefault(source.get("id"), source)
+
+    _SOURCE_INDEX_CACHE[metadata_file] = (mtime, index)
+    return index
+
+
+def _handle_load_external_source(tool_input: Dict[str, Any], course_id: Optional[str]) -> ToolResult:
+    # Load metadata to find source URL and type
+    source_id = tool_input["source_id"]
+    concept_id = tool_input.get("concept_id")
+
+    if concept_id:
+        # Concept-level source
+        concept_dir = config.get_concept_dir(concept_id, course_id)
+        metadata_file = concept_dir / "metadata.json"
+    else:
+        # Course-level source
+        course_dir = config.get_course_dir(course_id or config.DEFAULT_COURSE_ID)
+        metadata_file = course_dir / "metadata.json"
 
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                metadata = json.load(f)
+    try:
+        sources = _load_source_index(metadata_file)
+    except FileNotFoundError:
+        return {"success": False, "error": "Metadata file not found"}
+
+    # Find source
+    source = sources.get(source_id)
+
+    if not source:
+        return {"success": False, "error": f"Source {source_id} not found"}
+
+    # Load full content
+    content_data = load_full_source_content(source["url"], source["type"])
+
+    return {"success": True, "data": content_data}
+
+
+def _handle_generate_contextualized_example(tool_input: Dict[str, Any], course_id: Optional[str]) -> ToolResult:
+    result = generate_contextualized_example(
+        concept_id=tool_input["concept_id"],
+        learner_interests=tool_input["learner_interests"],
+        difficulty=tool_input.get("difficulty", "appropriate"),
+        course_id=course_id
+    )
+    return {"success": True, "data": result}
+
+
+def _handle_break_down_concept_application(tool_input: Dict[str, Any], course_id: Optional[str]) -> ToolResult:
+    result = break_down_concept_application(
+        concept_id=tool_input["concept_id"],
+        student_work=tool_input.get("student_work"),
+        problem_statement=tool_input.get("problem_statement"),
+        course_id=course_id
+    )
+    return {"success": True, "data": result}
+
+
+def _handle_compare_concepts(tool_input: Dict[str, Any], course_id: Optional[str]) -> ToolResult:
+    result = compare_concepts(
+        concept_id_a=tool_input["concept_id_a"],
+        concept_id_b=tool_input["concept_id_b"],
+        course_id=course_id
+    )
+    return {"success": True, "data": result}
+
+
+# Dedicated, bounded pool for blocking tool work (file reads, Claude calls),
+# so tool fan-out cannot exhaust the event loop's default executor
+TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=TOOL_EXECUTOR_MAX_WORKERS, thread_name_prefix="tool")
+
+# Tool name -> handler(tool_input, course_id)
+TOOL_HANDLERS = {
+    "load_resource": _handle_load_resource,
+    "load_assessment": _handle_load_assessment,
+    "load_concept_metadata": _handle_load_concept_metadata,
+    "load_concept_bundle": _handle_load_concept_bundle,
+    "track_confidence": _handle_track_confidence,
+    "update_learner_model": _handle_update_learner_model,
+    "calculate_mastery": _handle_calculate_mastery,
+    "get_next_concept": _handle_get_next_concept,
+    "load_external_source": _handle_load_external_source,
+    "generate_contextualized_example": _handle_generate_contextualized_example,
+    "break_down_concept_application": _handle_break_down_concept_application,
+    "compare_concepts": _handle_compare_concepts
+}
+
+# Tools whose handlers read course content and therefore need the learner's course_id
+COURSE_SCOPED_TOOLS = frozenset({
+    "load_resource",
+    "load_assessment",
+    "load_concept_metadata",
+    "load_concept_bundle",
+    "get_next_concept",
+    "load_external_source",
+    "generate_contextualized_example",
+    "break_down_concept_application",
+    "compare_concepts"
+})
+
+
+def resolve_course_id(learner_id: str) -> Optional[str]:
+    """
+    Look up the learner's current course for course-scoped tools.
 
-            # Find source
-            sources = metadata.get("sources", [])
-            source = next((s for s in sources if s.get("id") == source_id), None)
+    Args:
+        learner_id: Learner identifier
 
-            if not source:
-                return {"success": False, "error": f"Source {source_id} not found"}
+    Returns:
+        Current course ID, or None if the learner model cannot be loaded
+    """
+    try:
+        return load_learner_model(learner_id).get("current_course")
+    except Exception as e:
+        logger.warning("Could not load learner model for %s: %s", learner_id, e)
+        return None
 
-            # Load full content
-            content_data = load_full_source_content(source["url"], source["type"])
 
-            return {"success": True, "data": content_data}
+def execute_tool(tool_name: str, tool_input: Dict[str, Any], learner_id: Optional[str] = None,
+                 course_id: Optional[str] = None) -> ToolResult:
+    """
+    Execute a tool call and return the result.
 
-        elif tool_name == "generate_contextualized_example":
-            result = generate_contextualized_example(
-                concept_id=tool_input["concept_id"],
-                learner_interests=tool_input["learner_interests"],
-                difficulty=tool_input.get("difficulty", "appropriate"),
-                course_id=course_id
-            )
-            return {"success": True, "data": result}
+    Args:
+        tool_name: Name of the tool to execute
+        tool_input: Input parameters for the tool
+        learner_id: Learner ID for course context (optional)
+        course_id: Learner's course, if already resolved by the caller (optional)
 
-        elif tool_name == "break_down_concept_application":
-            result = break_down_concept_application(
-                concept_id=tool_input["concept_id"],
-                student_work=tool_input.get("student_work"),
-                problem_statement=tool_input.get("problem_statement"),
-                course_id=course_id
-            )
-            return {"success": True, "data": result}
+    Returns:
+        Tool execution result
+    """
+    handler = TOOL_HANDLERS.get(tool_name)
+    if handler is None:
+        return {"success": False, "error": f"Unknown tool: {tool_name}"}
 
-        elif tool_name == "compare_concepts":
-            result = compare_concepts(
-                concept_id_a=tool_input["concept_id_a"],
-                concept_id_b=tool_input["concept_id_b"],
-                course_id=course_id
-            )
-            return {"success": True, "data": result}
+    try:
+        # Get course_id from learner model if available (only needed by course-scoped tools)
+        if course_id is None and learner_id and tool_name in COURSE_SCOPED_TOOLS:
+            course_id = resolve_course_id(learner_id)
 
-        else:
-            return {"success": False, "error": f"Unknown tool: {tool_name}"}
+        return handler(tool_input, course_id)
 
     except Exception as e:
-        logger.error(f"Error executing tool {tool_name}: {e}")
+        logger.error("Error executing tool %s: %s", tool_name, e)
         return {"success": False, "error": str(e)}
 
 
@@ -968,30 +1403,405 @@ def execute_tool(tool_name: str, tool_input: Dict[str, Any], learner_id: Optiona
 # Chat Function
 # ============================================================================
 
-def chat(
-    learner_id: str,
-    user_message: str,
-    conversation_history: Optional[List[Dict[str, Any]]] = None
-) -> Dict[str, Any]:
-    """
-    Send a message to Claude and get a response, handling tool use.
+# Tools that write learner state; these never run concurrently with other tools
+MUTATING_TOOLS = frozenset({"update_learner_model"})
 
-    Args:
-        learner_id: Unique identifier for the learner
-        user_message: The user's message
-        conversation_history: Previous conversation messages (optional)
+# Tools that call Claude or fetch external sources get a longer time budget
+TOOL_TIMEOUTS = {
+    "load_external_source": SLOW_TOOL_TIMEOUT_SECONDS,
+    "generate_contextualized_example": SLOW_TOOL_TIMEOUT_SECONDS,
+    "break_down_concept_application": SLOW_TOOL_TIMEOUT_SECONDS,
+    "compare_concepts": SLOW_TOOL_TIMEOUT_SECONDS
+}
 
-    Returns:
-        Dictionary containing response and updated conversation history
-    """
-    try:
-        # Load system prompt with learner context
-        base_prompt = load_system_prompt()
-        system_prompt = inject_learner_context(base_prompt, learner_id)
 
-        # Initialize conversation history if not provided
-        if conversation_history is None:
-            conversation_history = []
+class ToolCallBatch:
+    """
+    Executes the tool calls from one assistant turn.
+
+    Read-only tools run concurrently, each with a timeout; a tool that times
+    out returns an error result so Claude can recover. They can be started
+    with start() while Claude is still streaming the rest of its turn, so
+    tool latency overlaps with generation. Tools that write learner state
+    run in results(), after all readers, one at a time in request order,
+    so they never race each other or the readers. Writers are not timed
+    out, since the worker thread cannot be cancelled and an abandoned write
+    could overlap the next one.
+
+    The learner's course is looked up at most once per batch rather than by
+    every course-scoped tool.
+    """
+
+    def __init__(self, learner_id: Optional[str] = None):
+        self.learner_id = learner_id
+        self._readers: Dict[str, asyncio.Task] = {}
+        self._course_id: Optional[asyncio.Future] = None
+
+    async def _resolve_course_id(self, tool_name: str) -> Optional[str]:
+        if not self.learner_id or tool_name not in COURSE_SCOPED_TOOLS:
+            return None
+        if self._course_id is None:
+            loop = asyncio.get_running_loop()
+            self._course_id = loop.run_in_executor(TOOL_EXECUTOR, resolve_course_id, self.learner_id)
+        return await self._course_id
+
+    async def _run(self, block, timeout: Optional[float]) -> ToolResult:
+        logger.info("Executing tool: %s", block.name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Tool input: %s", block.input)
+        course_id = await self._resolve_course_id(block.name)
+        try:
+            loop = asyncio.get_running_loop()
+            return await asyncio.wait_for(
+                loop.run_in_executor(TOOL_EXECUTOR, execute_tool, block.name, block.input, self.learner_id, course_id),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            logger.error("Tool %s timed out after %ss", block.name, timeout)
+            return {"success": False, "error": f"Tool {block.name} timed out"}
+
+    def start(self, block) -> None:
+        """
+        Start a read-only tool call in the background (writers are deferred).
+
+        Args:
+            block: A completed tool_use content block
+        """
+        if block.name in MUTATING_TOOLS or block.id in self._readers:
+            return
+        timeout = TOOL_TIMEOUTS.get(block.name, TOOL_TIMEOUT_SECONDS)
+        self._readers[block.id] = asyncio.create_task(self._run(block, timeout))
+
+    def cancel(self) -> None:
+        """Cancel readers that are still running (e.g. when the turn fails)."""
+        for task in self._readers.values():
+            task.cancel()
+
+    async def results(self, tool_blocks: List[Any]) -> List[ToolResult]:
+        """
+        Finish every tool call in the turn.
+
+        Args:
+            tool_blocks: tool_use content blocks from Claude's response
+
+        Returns:
+            Tool results in the same order as tool_blocks
+        """
+        for block in tool_blocks:
+            self.start(block)
+
+        await asyncio.gather(*self._readers.values())
+
+        results = []
+        for block in tool_blocks:
+            if block.name in MUTATING_TOOLS:
+                results.append(await self._run(block, None))
+            else:
+                results.append(self._readers[block.id].result())
+        return results
+
+
+async def execute_tool_calls(tool_blocks: List[Any], learner_id: Optional[str] = None) -> List[ToolResult]:
+    """
+    Execute the tool calls from one assistant turn.
+
+    Args:
+        tool_blocks: tool_use content blocks from Claude's response
+        learner_id: Learner identifier (for tools that need it)
+
+    Returns:
+        Tool results in the same order as tool_blocks
+    """
+    return await ToolCallBatch(learner_id).results(tool_blocks)
+
+
+HISTORY_SUMMARY_HEADER = "[Earlier in this conversation the learner said:]"
+
+
+def response_text(response: Any) -> str:
+    """
+    Join the text blocks of a Claude response.
+
+    Args:
+        response: Anthropic API response object
+
+    Returns:
+        The concatenated text of all text blocks
+    """
+    content = response.content
+    if len(content) == 1 and content[0].type == "text":
+        return content[0].text
+    return "".join(block.text for block in content if block.type == "text")
+
+
+def serialize_content_blocks(content: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Convert SDK content blocks into the plain dicts needed to replay them.
+
+    Args:
+        content: Content blocks from a Claude response
+
+    Returns:
+        List of text and tool_use block dictionaries
+    """
+    blocks = []
+    for block in content:
+        if block.type == "text":
+            blocks.append({"type": "text", "text": block.text})
+        elif block.type == "tool_use":
+            blocks.append({"type": "tool_use", "id": block.id, "name": block.name, "input": block.input})
+    return blocks
+
+
+def _summarize_messages(messages: List[Dict[str, Any]]) -> str:
+    """
+    Build a short extractive summary of the learner's side of older messages.
+
+    Summaries from earlier trims are carried forward line by line.
+    """
+    lines = []
+    for message in messages:
+        content = message.get("content")
+        if message.get("role") != "user" or not isinstance(content, str):
+            continue
+
+        if content.startswith(HISTORY_SUMMARY_HEADER):
+            summary, _, content = content.partition("\n\n")
+            lines.extend(summary.splitlines()[1:])
+
+        text = " ".join(content.split())
+        if text:
+            lines.append(f"- {text[:HISTORY_SUMMARY_LINE_CHARS]}")
+
+    return "\n".join([HISTORY_SUMMARY_HEADER] + lines[-HISTORY_SUMMARY_MAX_LINES:])
+
+
+def trim_conversation_history(
+    conversation_history: List[Dict[str, Any]],
+    max_messages: int = MAX_CONVERSATION_HISTORY_MESSAGES
+) -> List[Dict[str, Any]]:
+    """
+    Bound the conversation history to the most recent messages.
+
+    The kept window always opens on a plain user message (never on a tool
+    result, which must follow its tool_use). Dropped messages are collapsed
+    into a summary prepended to that first message.
+
+    Args:
+        conversation_history: Full conversation history
+        max_messages: Maximum number of messages to keep
+
+    Returns:
+        The history unchanged if within bounds, otherwise a new trimmed list
+    """
+    if len(conversation_history) <= max_messages:
+        return conversation_history
+
+    start = len(conversation_history) - max_messages
+    while start < len(conversation_history):
+        message = conversation_history[start]
+        if message.get("role") == "user" and isinstance(message.get("content"), str):
+            break
+        start += 1
+    else:
+        return conversation_history
+
+    summary = _summarize_messages(conversation_history[:start])
+
+    kept = conversation_history[start:]
+    kept[0] = {"role": "user", "content": f"{summary}\n\n{kept[0]['content']}"}
+    return kept
+
+
+def compact_tool_results(
+    conversation_history: List[Dict[str, Any]],
+    keep_turns: int = TOOL_RESULT_KEEP_TURNS
+) -> List[Dict[str, Any]]:
+    """
+    Replace tool results from older turns with one-line placeholders.
+
+    Tool results (often large JSON blobs) are only useful to Claude for the
+    turn that requested them. Results before the last keep_turns user turns
+    are reduced to "[previous <tool> result omitted]"; the tool_result blocks
+    themselves stay so every tool_use keeps its matching result, and
+    assistant text is left verbatim.
+
+    Args:
+        conversation_history: Conversation history
+        keep_turns: Number of most recent user turns whose tool results are kept
+
+    Returns:
+        The history unchanged if nothing needs compacting, otherwise a new list
+    """
+    turn_starts = [
+        i for i, message in enumerate(conversation_history)
+        if message.get("role") == "user" and isinstance(message.get("content"), str)
+    ]
+    if len(turn_starts) <= keep_turns:
+        return conversation_history
+    cutoff = turn_starts[-keep_turns] if keep_turns > 0 else len(conversation_history)
+
+    tool_names = {}
+    compacted = list(conversation_history)
+    for i, message in enumerate(conversation_history[:cutoff]):
+        content = message.get("content")
+        if isinstance(content, str):
+            continue
+
+        if message.get("role") == "assistant":
+            for block in content:
+                if block.get("type") == "tool_use":
+                    tool_names[block.get("id")] = block.get("name", "tool")
+            continue
+
+        blocks = [
+            {
+                **block,
+                "content": f"[previous {tool_names.get(block.get('tool_use_id'), 'tool')} result omitted]"
+            }
+            if block.get("type") == "tool_result" else block
+            for block in content
+        ]
+        compacted[i] = {**message, "content": blocks}
+
+    return compacted
+
+
+# Completed chat turns keyed by chat_response_cache_key()
+_CHAT_RESPONSE_CACHE = TTLCache(maxsize=CHAT_RESPONSE_CACHE_MAX_ENTRIES, ttl=CHAT_RESPONSE_CACHE_TTL_SECONDS)
+
+
+def chat_response_cache_key(
+    learner_id: str,
+    user_message: str,
+    conversation_history: List[Dict[str, Any]]
+) -> Optional[str]:
+    """
+    Build the exact-match cache key for a chat turn.
+
+    The key covers everything that shapes Claude's reply: the learner's saved
+    state (via its updated_at stamp), the conversation so far, and the
+    whitespace/case-normalized message.
+
+    Args:
+        learner_id: Unique identifier for the learner
+        user_message: The user's message
+        conversation_history: Conversation messages before this turn
+
+    Returns:
+        Hex digest key, or None if the learner does not exist
+    """
+    try:
+        model = load_learner_model(learner_id)
+    except FileNotFoundError:
+        return None
+
+    payload = orjson.dumps(
+        [
+            learner_id,
+            model.get("current_concept"),
+            model.get("overall_progress", {}).get("total_assessments"),
+            model.get("updated_at"),
+            " ".join(user_message.lower().split()),
+            conversation_history
+        ],
+        default=str
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+async def _stream_claude_turn(
+    system_prompt: List[Dict[str, Any]],
+    messages: List[Dict[str, Any]],
+    tool_batch: ToolCallBatch
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream one Claude call for a chat turn.
+
+    Each tool_use block is handed to tool_batch as soon as it is complete,
+    so read-only tools run while Claude is still generating the rest of
+    the turn.
+
+    Args:
+        system_prompt: Structured system prompt blocks
+        messages: Conversation so far
+        tool_batch: Batch that will execute this turn's tool calls
+
+    Yields:
+        {"type": "text", "text": ...} for each text delta, then
+        {"type": "message", "message": ...} with the final message
+    """
+    async with get_async_client().messages.stream(
+        model=config.ANTHROPIC_MODEL,
+        max_tokens=4096,
+        system=system_prompt,
+        messages=mark_history_cache_breakpoint(messages),
+        tools=CACHED_TOOL_DEFINITIONS
+    ) as stream:
+        async for event in stream:
+            if event.type == "text":
+                yield {"type": "text", "text": event.text}
+            elif event.type == "content_block_stop" and event.content_block.type == "tool_use":
+                tool_batch.start(event.content_block)
+        yield {"type": "message", "message": await stream.get_final_message()}
+
+
+async def chat_stream(
+    learner_id: str,
+    user_message: str,
+    conversation_history: Optional[List[Dict[str, Any]]] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream a chat turn with Claude, handling tool use.
+
+    Every Claude call (including the intermediate tool-use turns) goes through
+    the streaming API, so text is delivered as soon as it is generated instead
+    of after the whole response is complete.
+
+    Args:
+        learner_id: Unique identifier for the learner
+        user_message: The user's message
+        conversation_history: Previous conversation messages (optional).
+            The list is copied, never mutated; the updated history is
+            returned in the "done"/"error" event.
+
+    Yields:
+        Event dictionaries:
+        - {"type": "text", "text": ...} for each text delta
+        - {"type": "done", "message": ..., "conversation_history": ...} when finished
+        - {"type": "error", "error": ..., "conversation_history": ...} on failure
+    """
+    tool_batch = None
+    try:
+        # Load system prompt; the static part is cached, learner context is not
+        learner_context = build_learner_context(learner_id)
+        if learner_context:
+            learner_context += MASTERY_TOOL_HINT
+        system_prompt = build_cached_system_prompt(load_system_prompt(), learner_context)
+
+        # Work on a copy so the caller's list is never mutated
+        conversation_history = list(conversation_history) if conversation_history else []
+
+        # Keep the request size bounded as conversations grow
+        conversation_history = compact_tool_results(trim_conversation_history(conversation_history))
+
+        # Serve an identical turn (same learner state, history and message) from cache
+        cache_key = chat_response_cache_key(learner_id, user_message, conversation_history)
+        cached_turn = _CHAT_RESPONSE_CACHE.get(cache_key) if cache_key else None
+        if cached_turn is not None:
+            assistant_message, turn_messages = cached_turn
+            logger.info("Chat response cache hit for %s", learner_id)
+            conversation_history.extend(turn_messages)
+            yield {"type": "text", "text": assistant_message}
+            yield {
+                "type": "done",
+                "message": assistant_message,
+                "conversation_history": conversation_history
+            }
+            return
+
+        turn_start = len(conversation_history)
+        used_mutating_tool = False
 
         # Add user message to history
         conversation_history.append({
@@ -1000,43 +1810,36 @@ def chat(
         })
 
         # Make initial API call
-        response = client.messages.create(
-            model=config.ANTHROPIC_MODEL,
-            max_tokens=4096,
-            system=system_prompt,
-            messages=conversation_history,
-            tools=TOOL_DEFINITIONS
-        )
+        tool_batch = ToolCallBatch(learner_id)
+        async for event in _stream_claude_turn(system_prompt, conversation_history, tool_batch):
+            if event["type"] == "message":
+                response = event["message"]
+            else:
+                yield event
 
-        logger.info(f"Claude API call completed. Stop reason: {response.stop_reason}")
+        logger.info("Claude API call completed. Stop reason: %s", response.stop_reason)
 
         # Handle tool use loop
         while response.stop_reason == "tool_use":
             # Add assistant's response to history
             conversation_history.append({
                 "role": "assistant",
-                "content": response.content
+                "content": serialize_content_blocks(response.content)
             })
 
             # Process tool calls
-            tool_results = []
-            for content_block in response.content:
-                if content_block.type == "tool_use":
-                    tool_name = content_block.name
-                    tool_input = content_block.input
-
-                    logger.info(f"Executing tool: {tool_name}")
-                    logger.debug(f"Tool input: {tool_input}")
-
-                    # Execute the tool
-                    tool_result = execute_tool(tool_name, tool_input, learner_id)
-
-                    # Add tool result
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": content_block.id,
-                        "content": json.dumps(tool_result)
-                    })
+            tool_blocks = [block for block in response.content if block.type == "tool_use"]
+            used_mutating_tool = used_mutating_tool or any(block.name in MUTATING_TOOLS for block in tool_blocks)
+            tool_outputs = await tool_batch.results(tool_blocks)
+
+            tool_results = [
+                {
+                    "type": "tool_result",
+                    "tool_use_id": content_block.id,
+                    "content": orjson.dumps(tool_result, option=orjson.OPT_NON_STR_KEYS).decode()
+                }
+                for content_block, tool_result in zip(tool_blocks, tool_outputs)
+            ]
 
             # Add tool results to conversation
             conversation_history.append({
@@ -1045,21 +1848,17 @@ def chat(
             })
 
             # Continue conversation with tool results
-            response = client.messages.create(
-                model=config.ANTHROPIC_MODEL,
-                max_tokens=4096,
-                system=system_prompt,
-                messages=conversation_history,
-                tools=TOOL_DEFINITIONS
-            )
+            tool_batch = ToolCallBatch(learner_id)
+            async for event in _stream_claude_turn(system_prompt, conversation_history, tool_batch):
+                if event["type"] == "message":
+                    response = event["message"]
+                else:
+                    yield event
 
-            logger.info(f"Claude API call (after tool use) completed. Stop reason: {response.stop_reason}")
+            logger.info("Claude API call (after tool use) completed. Stop reason: %s", response.stop_reason)
 
         # Extract final text response
-        assistant_message = ""
-        for content_block in response.content:
-            if hasattr(content_block, "text"):
-                assistant_message += content_block.text
+        assistant_message = response_text(response)
 
         # Add final assistant response to history
         conversation_history.append({
@@ -1067,392 +1866,704 @@ def chat(
             "content": assistant_message
         })
 
-        return {
-            "success": True,
+        # Turns that changed learner state must run again, so only cache read-only turns
+        if cache_key and not used_mutating_tool:
+            _CHAT_RESPONSE_CACHE.set(cache_key, (assistant_message, conversation_history[turn_start:]))
+
+        yield {
+            "type": "done",
             "message": assistant_message,
             "conversation_history": conversation_history
         }
 
     except Exception as e:
-        logger.error(f"Error in chat function: {e}")
-        return {
-            "success": False,
+        logger.error("Error in chat function: %s", e)
+        if tool_batch is not None:
+            tool_batch.cancel()
+        yield {
+            "type": "error",
             "error": str(e),
             "conversation_history": conversation_history
         }
 
 
+async def chat(
+    learner_id: str,
+    user_message: str,
+    conversation_history: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    Send a message to Claude and get a response, handling tool use.
+
+    Claude is called through the async client, and tools (which do blocking
+    file I/O) run in worker threads so the event loop stays free. This drains
+    chat_stream() for callers that want the complete response at once.
+
+    Args:
+        learner_id: Unique identifier for the learner
+        user_message: The user's message
+        conversation_history: Previous conversation messages (optional);
+            not mutated
+
+    Returns:
+        Dictionary containing response and updated conversation history
+    """
+    async for event in chat_stream(learner_id, user_message, conversation_history):
+        if event["type"] == "done":
+            return {
+                "success": True,
+                "message": event["message"],
+                "conversation_history": event["conversation_history"]
+            }
+        if event["type"] == "error":
+            return {
+                "success": False,
+                "error": event["error"],
+                "conversation_history": event["conversation_history"]
+            }
+
+    return {
+        "success": False,
+        "error": "Chat stream ended without a response",
+        "conversation_history": conversation_history
+    }
+
+
 # ============================================================================
 # Content Generation Function
 # ============================================================================
 
-def generate_content(learner_id: str, stage: str = "start", correctness: bool = None,
-                     confidence: int = None, remediation_type: str = None,
-                     question_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+# Guidance for the course's learning taxonomy in the generation prompt
+TAXONOMY_GUIDANCE = {
+    'blooms': "Use Bloom's Taxonomy levels (Remember, Understand, Apply, Analyze, Evaluate, Create) when crafting questions and content.",
+    'solo': "Use SOLO Taxonomy levels (Prestructural, Unistructural, Multistructural, Relational, Extended Abstract) when designing assessments.",
+    'fink': "Use Fink's Taxonomy of Significant Learning (Foundational Knowledge, Application, Integration, Human Dimension, Caring, Learning How to Learn)."
+}
+DEFAULT_TAXONOMY_GUIDANCE = "Apply appropriate cognitive levels in content design."
+
+
+def _build_generation_prompt(learner_id: str, stage: str, confidence: int = None,
+                             remediation_type: str = None,
+                             question_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
-    Generate personalized learning content based on learner profile and current stage.
+    Assemble the system prompt and generation request for generate_content.
+
+    Shared by generate_content and generate_content_async so both build
+    identical requests; only the API call differs.
 
     Args:
         learner_id: Unique identifier for the learner
         stage: Learning stage ("start", "practice", "assess", "remediate", "reinforce")
-        correctness: Whether the previous answer was correct (for adaptive response)
         confidence: Confidence level 1-4 (for adaptive response)
         remediation_type: Type of remediation ("brief", "supportive", "full_calibration")
-        question_context: Optional dict with question details for specific feedback:
-            - scenario: The question scenario text
-            - question: The question text
-            - user_answer: Answer index or text the student selected
-            - options: List of options (for multiple-choice)
-            - correct_answer: The correct answer
+        question_context: Optional dict with question details for specific feedback
 
     Returns:
-        Dictionary containing generated content object
+        Dictionary with "system_prompt", "request", "learner_model", "is_cumulative",
+        "cumulative_concepts" and "external_resources" (a future for remediation
+        and reinforcement stages, else None), or with a ready "result" when a
+        pre-authored teaching moment is served instead of calling the API
     """
+    # Get question history to avoid repetition and load course info
+    try:
+        learner_model = load_learner_model(learner_id)
+        question_history = learner_model.get("question_history", [])
+        concept_id = learner_model.get("current_concept", "concept-001")  # Get current concept for difficulty selection
+        course_id = learner_model.get("current_course", config.DEFAULT_COURSE_ID)  # Get course for content loading
+    except Exception:
+        learner_model = None
+        question_history = []
+        concept_id = "concept-001"  # Default fallback
+        course_id = config.DEFAULT_COURSE_ID
+
+    # Load content generation prompt (course-specific if available)
+    content_prompt = load_content_generation_prompt(course_id)
+
+    # Load course metadata and inject into prompt
     try:
-        # Get question history to avoid repetition and load course info
+        course_dir = config.get_course_dir(course_id)
+        course_metadata_path = course_dir / "metadata.json"
+
         try:
-            from .tools import load_learner_model
-            learner_model = load_learner_model(learner_id)
-            question_history = learner_model.get("question_history", [])
-            concept_id = learner_model.get("current_concept", "concept-001")  # Get current concept for difficulty selection
-            course_id = learner_model.get("current_course", config.DEFAULT_COURSE_ID)  # Get course for content loading
-        except Exception:
-            question_history = []
-            concept_id = "concept-001"  # Default fallback
-            course_id = config.DEFAULT_COURSE_ID
-
-        # Load content generation prompt (course-specific if available)
-        content_prompt = load_content_generation_prompt(course_id)
-
-        # Load course metadata and inject into prompt
+            course_metadata = orjson.loads(read_resource_file(course_metadata_path))
+        except FileNotFoundError:
+            course_metadata = None
+
+        if course_metadata is not None:
+            course_parts = [
+                "\n\n## COURSE CONTEXT\n\n",
+                f"**Course Title**: {course_metadata.get('title', 'Unknown Course')}\n",
+                f"**Domain**: {course_metadata.get('domain', 'General')}\n"
+            ]
+
+            # Add taxonomy if present
+            taxonomy = course_metadata.get('taxonomy', 'blooms')
+            course_parts.append(f"**Learning Taxonomy**: {taxonomy.title()} - {TAXONOMY_GUIDANCE.get(taxonomy, DEFAULT_TAXONOMY_GUIDANCE)}\n")
+
+            if course_metadata.get('course_learning_outcomes'):
+                course_parts.append("**Course Learning Outcomes**:\n")
+                course_parts.extend(f"- {clo}\n" for clo in course_metadata['course_learning_outcomes'])
+            course_parts.append("\n**IMPORTANT**: All content, scenarios, and examples must be relevant to this course's subject matter and learning outcomes.\n")
+        else:
+            course_parts = []
+
+        # Load current concept metadata
+        concept_metadata_path = course_dir / concept_id / "metadata.json"
         try:
-            import json
-            course_dir = config.get_course_dir(course_id)
-            course_metadata_path = course_dir / "metadata.json"
-
-            if course_metadata_path.exists():
-                with open(course_metadata_path, "r", encoding="utf-8") as f:
-                    course_metadata = json.load(f)
-
-                course_context = "\n\n## COURSE CONTEXT\n\n"
-                course_context += f"**Course Title**: {course_metadata.get('title', 'Unknown Course')}\n"
-                course_context += f"**Domain**: {course_metadata.get('domain', 'General')}\n"
-
-                # Add taxonomy if present
-                taxonomy = course_metadata.get('taxonomy', 'blooms')
-                taxonomy_guidance = {
-                    'blooms': "Use Bloom's Taxonomy levels (Remember, Understand, Apply, Analyze, Evaluate, Create) when crafting questions and content.",
-                    'solo': "Use SOLO Taxonomy levels (Prestructural, Unistructural, Multistructural, Relational, Extended Abstract) when designing assessments.",
-                    'fink': "Use Fink's Taxonomy of Significant Learning (Foundational Knowledge, Application, Integration, Human Dimension, Caring, Learning How to Learn)."
-                }
-                course_context += f"**Learning Taxonomy**: {taxonomy.title()} - {taxonomy_guidance.get(taxonomy, 'Apply appropriate cognitive levels in content design.')}\n"
+            concept_metadata = orjson.loads(read_resource_file(concept_metadata_path))
+        except FileNotFoundError:
+            concept_metadata = None
 
-                if course_metadata.get('course_learning_outcomes'):
-                    course_context += f"**Course Learning Outcomes**:\n"
-                    for clo in course_metadata['course_learning_outcomes']:
-                        course_context += f"- {clo}\n"
-                course_context += "\n**IMPORTANT**: All content, scenarios, and examples must be relevant to this course's subject matter and learning outcomes.\n"
-            else:
-                course_context = ""
-
-            # Load current concept metadata
-            concept_metadata_path = course_dir / concept_id / "metadata.json"
-            if concept_metadata_path.exists():
-                with open(concept_metadata_path, "r", encoding="utf-8") as f:
-                    concept_metadata = json.load(f)
-
-                course_context += f"\n### Current Concept: {concept_metadata.get('title', concept_id)}\n\n"
-
-                # Add prerequisites if present
-                if concept_metadata.get('prerequisites'):
-                    prereqs = concept_metadata['prerequisites']
-                    if prereqs:
-                        course_context += f"**Prerequisites**: This concept builds on {', '.join(prereqs)}. Learners should already understand those concepts.\n"
-
-                if concept_metadata.get('module_learning_outcomes'):
-                    course_context += f"**Learning Outcomes for This Concept**:\n"
-                    for mlo in concept_metadata['module_learning_outcomes']:
-                        course_context += f"- {mlo}\n"
-                course_context += "\n**CRITICAL**: Generate content ONLY about this specific concept and its learning outcomes. Use scenarios and examples from this domain.\n"
-        except Exception as e:
-            logger.warning(f"Could not load course metadata: {e}")
-            course_context = ""
+        if concept_metadata is not None:
+            course_parts.append(f"\n### Current Concept: {concept_metadata.get('title', concept_id)}\n\n")
 
-        # Load learner context and question history
-        learner_context = inject_learner_context("", learner_id)
+            # Add prerequisites if present
+            if concept_metadata.get('prerequisites'):
+                prereqs = concept_metadata['prerequisites']
+                if prereqs:
+                    course_parts.append(f"**Prerequisites**: This concept builds on {', '.join(prereqs)}. Learners should already understand those concepts.\n")
 
-        # Combine prompts
-        system_prompt = f"{content_prompt}\n\n{course_context}\n\n{learner_context}"
-
-        # Add question history context if available
-        if question_history:
-            history_text = "\n\nRECENT QUESTIONS ASKED (do NOT repeat these):\n"
-            for i, q in enumerate(question_history[-RECENT_QUESTIONS_DISPLAY_COUNT:], 1):
-                history_text += f"{i}. {q.get('scenario', '')} {q.get('question', '')}\n"
-            system_prompt += history_text
-
-        # Check if cumulative review should be shown (only for practice stage)
-        is_cumulative = False
-        cumulative_concepts = []
-        if stage in [STAGE_START, STAGE_PRACTICE]:
-            try:
-                is_cumulative = should_show_cumulative_review(learner_id)
-                if is_cumulative:
-                    cumulative_concepts = select_concepts_for_cumulative(learner_id, count=CUMULATIVE_REVIEW_CONCEPTS_COUNT)
-                    logger.info(f"Generating cumulative review across concepts: {cumulative_concepts}")
-
-                    # Load metadata for all selected concepts
-                    concepts_metadata = []
-                    for concept_id in cumulative_concepts:
-                        metadata = load_concept_metadata(concept_id, course_id)
-                        concepts_metadata.append({
-                            "concept_id": concept_id,
-                            "title": metadata.get("title", concept_id),
-                            "description": metadata.get("description", "")
-                        })
-
-                    # Add cumulative context to system prompt
-                    cumulative_context = "\n\n=== CUMULATIVE REVIEW MODE ===\n"
-                    cumulative_context += "Generate a question that integrates concepts from MULTIPLE previously learned topics:\n"
-                    for cm in concepts_metadata:
-                        cumulative_context += f"- {cm['concept_id']}: {cm['title']} ({cm['description']})\n"
-                    cumulative_context += "\nThe question should require the learner to apply knowledge from at least 2 of these concepts together.\n"
-                    system_prompt += cumulative_context
-            except ValueError as e:
-                # Not enough concepts for cumulative review yet
-                logger.info(f"Cumulative review not available: {e}")
-                is_cumulative = False
-
-        # Build generation request based on stage
-        if stage == STAGE_PREVIEW:
-            # PREVIEW MODE: Quick conceptual foundation before diagnostic
-            learner_model = load_learner_model(learner_id)
-            learning_style = learner_model.get('profile', {}).get('learningStyle', 'narrative')
-            request = generate_preview_request(learning_style)
-
-        elif stage == STAGE_START:
-            # DIAGNOSTIC-FIRST: Always start with a question
-            # Use adaptive difficulty based on recent performance
-            learner_model = load_learner_model(learner_id)
-            learning_style = learner_model.get('profile', {}).get('learningStyle', 'varied')
-            difficulty = select_question_difficulty(learner_id, concept_id)
-            logger.info(f"Selected difficulty for START stage: {difficulty}, learning style: {learning_style}")
-            request = generate_diagnostic_request(is_cumulative, cumulative_concepts, difficulty, learning_style)
-
-        elif stage == STAGE_PRACTICE:
-            # Generate next diagnostic question
-            # Use adaptive difficulty based on recent performance
-            learner_model = load_learner_model(learner_id)
-            learning_style = learner_model.get('profile', {}).get('learningStyle', 'varied')
-            difficulty = select_question_difficulty(learner_id, concept_id)
-            logger.info(f"Selected difficulty for PRACTICE stage: {difficulty}, learning style: {learning_style}")
-            request = generate_practice_request(is_cumulative, cumulative_concepts, difficulty, learning_style)
-
-        elif stage == STAGE_ASSESS:
-            # Dialogue questions disabled - generate multiple-choice instead
-            # (This stage should not be used, but keeping as fallback to multiple-choice)
-            request = generate_diagnostic_request(is_cumulative=False)
-
-        elif stage == STAGE_REMEDIATE:
-            # Generate remediation content after incorrect answer
-            learner_model = load_learner_model(learner_id)
-            learning_style = learner_model.get('profile', {}).get('learningStyle', 'narrative')
-            request = generate_remediation_request(
-                question_context,
-                confidence,
-                remediation_type,
-                learning_style
-            )
+            if concept_metadata.get('module_learning_outcomes'):
+                course_parts.append("**Learning Outcomes for This Concept**:\n")
+                course_parts.extend(f"- {mlo}\n" for mlo in concept_metadata['module_learning_outcomes'])
+            course_parts.append("\n**CRITICAL**: Generate content ONLY about this specific concept and its learning outcomes. Use scenarios and examples from this domain.\n")
 
-        elif stage == STAGE_REINFORCE:
-            # Generate reinforcement content after correct but uncertain answer
-            learner_model = load_learner_model(learner_id)
-            learning_style = learner_model.get('profile', {}).get('learningStyle', 'narrative')
-            request = generate_reinforcement_request(
-                question_context,
-                confidence,
-                learning_style
-            )
+        course_context = "".join(course_parts)
+    except Exception as e:
+        logger.warning("Could not load course metadata: %s", e)
+        course_context = ""
+
+    # Load learner context and question history
+    learner_context = inject_learner_context("", learner_id)
+
+    # Combine prompts. The content prompt and course context are the same for
+    # every learner on a concept, so they form the cached prefix; the learner
+    # context is cached after it, and per-request additions follow uncached.
+    system_prefix = f"{content_prompt}\n\n{course_context}"
+    dynamic_context = ""
+
+    # Add question history context if available
+    if question_history:
+        # Repeated scenarios only need listing once (dict keeps first-seen order)
+        recent = dict.fromkeys(
+            f"{q.get('scenario', '')} {q.get('question', '')}"
+            for q in question_history[-RECENT_QUESTIONS_DISPLAY_COUNT:]
+        )
+        history_lines = [f"{i}. {text}\n" for i, text in enumerate(recent, 1)]
+        dynamic_context += "\n\nRECENT QUESTIONS ASKED (do NOT repeat these):\n" + "".join(history_lines)
 
-        else:
-            request = "Generate a 'multiple-choice' diagnostic question with scenario. Respond ONLY with the JSON object, no other text."
+    # Check if cumulative review should be shown (only for practice stage)
+    is_cumulative = False
+    cumulative_concepts = []
+    if stage in [STAGE_START, STAGE_PRACTICE]:
+        try:
+            is_cumulative = should_show_cumulative_review(learner_id, model=learner_model)
+            if is_cumulative:
+                cumulative_concepts = select_concepts_for_cumulative(
+                    learner_id, count=CUMULATIVE_REVIEW_CONCEPTS_COUNT, model=learner_model
+                )
+                logger.info("Generating cumulative review across concepts: %s", cumulative_concepts)
 
-        # Handle pre-authored teaching moments (not AI-generated)
-        if request == "USE_TEACHING_MOMENT":
-            from .tools import select_personalized_teaching_moment
-            try:
-                teaching_moment = select_personalized_teaching_moment(
-                    concept_id=concept_id,
-                    learner_id=learner_id,
-                    course_id=course_id
+                # Load metadata for all selected concepts (served from the resource file cache)
+                concepts_metadata = {
+                    cumulative_id: load_concept_metadata(cumulative_id, course_id)
+                    for cumulative_id in cumulative_concepts
+                }
+
+                # Add cumulative context to system prompt
+                cumulative_parts = [
+                    "\n\n=== CUMULATIVE REVIEW MODE ===\n",
+                    "Generate a question that integrates concepts from MULTIPLE previously learned topics:\n"
+                ]
+                cumulative_parts.extend(
+                    f"- {cumulative_id}: {metadata.get('title', cumulative_id)} ({metadata.get('description', '')})\n"
+                    for cumulative_id, metadata in concepts_metadata.items()
                 )
-                logger.info(f"Serving pre-authored teaching moment: {teaching_moment.get('teaching_moment_id')}")
-                return {
+                cumulative_parts.append("\nThe question should require the learner to apply knowledge from at least 2 of these concepts together.\n")
+                dynamic_context += "".join(cumulative_parts)
+        except ValueError as e:
+            # Not enough concepts for cumulative review yet
+            logger.info("Cumulative review not available: %s", e)
+            is_cumulative = False
+
+    # Stages that personalize by learning style need the learner model;
+    # retry the load here so a missing learner still raises as before
+    if learner_model is None and stage in (STAGE_PREVIEW, STAGE_START, STAGE_PRACTICE, STAGE_REMEDIATE, STAGE_REINFORCE):
+        learner_model = load_learner_model(learner_id)
+
+    # Build generation request based on stage
+    if stage == STAGE_PREVIEW:
+        # PREVIEW MODE: Quick conceptual foundation before diagnostic
+        learning_style = learner_model.get('profile', {}).get('learningStyle', 'narrative')
+        request = generate_preview_request(learning_style)
+
+    elif stage == STAGE_START:
+        # DIAGNOSTIC-FIRST: Always start with a question
+        # Use adaptive difficulty based on recent performance
+        learning_style = learner_model.get('profile', {}).get('learningStyle', 'varied')
+        difficulty = select_question_difficulty(learner_id, concept_id, model=learner_model)
+        logger.debug("Selected difficulty for START stage: %s, learning style: %s", difficulty, learning_style)
+        request = generate_diagnostic_request(is_cumulative, cumulative_concepts, difficulty, learning_style)
+
+    elif stage == STAGE_PRACTICE:
+        # Generate next diagnostic question
+        # Use adaptive difficulty based on recent performance
+        learning_style = learner_model.get('profile', {}).get('learningStyle', 'varied')
+        difficulty = select_question_difficulty(learner_id, concept_id, model=learner_model)
+        logger.debug("Selected difficulty for PRACTICE stage: %s, learning style: %s", difficulty, learning_style)
+        request = generate_practice_request(is_cumulative, cumulative_concepts, difficulty, learning_style)
+
+    elif stage == STAGE_ASSESS:
+        # Dialogue questions disabled - generate multiple-choice instead
+        # (This stage should not be used, but keeping as fallback to multiple-choice)
+        request = generate_diagnostic_request(is_cumulative=False)
+
+    elif stage == STAGE_REMEDIATE:
+        # Generate remediation content after incorrect answer
+        learning_style = learner_model.get('profile', {}).get('learningStyle', 'narrative')
+        request = generate_remediation_request(
+            question_context,
+            confidence,
+            remediation_type,
+            learning_style
+        )
+
+    elif stage == STAGE_REINFORCE:
+        # Generate reinforcement content after correct but uncertain answer
+        learning_style = learner_model.get('profile', {}).get('learningStyle', 'narrative')
+        request = generate_reinforcement_request(
+            question_context,
+            confidence,
+            learning_style
+        )
+
+    else:
+        request = DEFAULT_STAGE_REQUEST
+
+    # Handle pre-authored teaching moments (not AI-generated)
+    if request == "USE_TEACHING_MOMENT":
+        try:
+            teaching_moment = select_personalized_teaching_moment(
+                concept_id=concept_id,
+                learner_id=learner_id,
+                course_id=course_id
+            )
+            logger.info("Serving pre-authored teaching moment: %s", teaching_moment.get('teaching_moment_id'))
+            return {
+                "result": {
                     "success": True,
                     "content": teaching_moment,
                     "source": "pre-authored"
                 }
-            except FileNotFoundError as e:
-                # No teaching moments for this concept, fall back to another interactive widget
-                logger.warning(f"No teaching moments available for {concept_id}, falling back to declension-explorer")
-                request = (
-                    "Generate a 'declension-explorer' interactive widget that lets the learner "
-                    "explore noun or verb forms. Include a base word and show how it changes across "
-                    "different cases/forms. Provide interactive elements where the learner can see patterns. "
-                    "Include a brief task asking them to predict or identify a specific form. "
-                    "Respond ONLY with the JSON object, no other text."
-                )
-            except Exception as e:
-                logger.error(f"Error loading teaching moment: {e}")
-                request = (
-                    "Generate a 'declension-explorer' interactive widget that lets the learner "
-                    "explore noun or verb forms. Include a base word and show how it changes across "
-                    "different cases/forms. Respond ONLY with the JSON object, no other text."
-                )
+            }
+        except FileNotFoundError as e:
+            # No teaching moments for this concept, fall back to another interactive widget
+            logger.warning("No teaching moments available for %s, falling back to declension-explorer", concept_id)
+            request = (
+                "Generate a 'declension-explorer' interactive widget that lets the learner "
+                "explore noun or verb forms. Include a base word and show how it changes across "
+                "different cases/forms. Provide interactive elements where the learner can see patterns. "
+                "Include a brief task asking them to predict or identify a specific form. "
+                "Respond ONLY with the JSON object, no other text."
+            )
+        except Exception as e:
+            logger.error("Error loading teaching moment: %s", e)
+            request = (
+                "Generate a 'declension-explorer' interactive widget that lets the learner "
+                "explore noun or verb forms. Include a base word and show how it changes across "
+                "different cases/forms. Respond ONLY with the JSON object, no other text."
+            )
 
-        # Make API call with retry logic
-        response = call_anthropic_with_retry(
-            system_prompt=system_prompt,
-            user_message=request,
-            max_retries=3,
-            timeout=30
+    # Remediation and reinforcement lessons get external resources attached;
+    # they depend only on the learner model, so load them during the API call
+    external_resources = None
+    if stage in (STAGE_REMEDIATE, STAGE_REINFORCE):
+        external_resources = TOOL_EXECUTOR.submit(
+            load_external_resources,
+            learner_model.get('current_concept', 'concept-001'),
+            learner_model.get('profile', {})
         )
 
-        logger.info(f"Content generation API call completed. Stop reason: {response.stop_reason}")
-
-        # Extract text response
-        content_text = ""
-        for content_block in response.content:
-            if hasattr(content_block, "text"):
-                content_text += content_block.text
-
-        # Strip markdown code fences if present
-        content_text = content_text.strip()
-        logger.info(f"Raw content text starts with: {content_text[:50]}")
-
-        if content_text.startswith("```"):
-            logger.info("Stripping markdown code fences from response")
-            # Remove opening fence (```json or ```)
-            lines = content_text.split('\n')
-            if lines[0].startswith("```"):
-                lines = lines[1:]
-            # Remove closing fence
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            content_text = '\n'.join(lines).strip()
-            logger.info(f"After stripping, content starts with: {content_text[:50]}")
-
-        # Parse JSON
-        try:
-            content_obj = json.loads(content_text)
-            content_type = content_obj.get('type', 'unknown')
-
-            # CRITICAL: Ensure content always has a type field
-            if 'type' not in content_obj or not content_obj['type']:
-                logger.warning(f"Content missing type field, inferring from structure...")
-                # Try to infer type from content structure
-                if 'sections' in content_obj:
-                    content_obj['type'] = 'lesson'
-                elif 'forms' in content_obj and 'noun' in content_obj:
-                    content_obj['type'] = 'paradigm-table'
-                elif 'examples' in content_obj:
-                    content_obj['type'] = 'example-set'
-                elif 'options' in content_obj and 'correctAnswer' in content_obj:
-                    content_obj['type'] = 'multiple-choice'
-                elif 'blanks' in content_obj:
-                    content_obj['type'] = 'fill-blank'
-                elif 'scenario' in content_obj and 'part1' in content_obj:
-                    content_obj['type'] = 'teaching-moment'
-                elif 'question' in content_obj and 'options' not in content_obj:
-                    # Dialogue: has question but no options (open-ended)
-                    content_obj['type'] = 'dialogue'
-                else:
-                    content_obj['type'] = 'lesson'  # Default fallback
-                content_type = content_obj['type']
-                logger.info(f"Inferred content type: {content_type}")
-
-            logger.info(f"Successfully generated content type: {content_type}")
-
-            # Validate diagnostic question content
-            is_valid, error_msg = validate_diagnostic_content(content_obj)
-            if not is_valid:
-                logger.error(f"Content validation failed: {error_msg}")
-                logger.error(f"Invalid content: {json.dumps(content_obj, indent=2)}")
-                return {
-                    "success": False,
-                    "error": f"Content validation failed: {error_msg}",
-                    "raw_response": content_text
-                }
+    return {
+        "system_prompt": build_cached_system_prompt(
+            system_prefix,
+            f"\n\n{learner_context}" if learner_context else "",
+            dynamic_context
+        ),
+        "request": request,
+        "learner_model": learner_model,
+        "is_cumulative": is_cumulative,
+        "cumulative_concepts": cumulative_concepts,
+        "external_resources": external_resources
+    }
 
-            # Attach external resources for lesson/example-set content
-            if content_type in ['lesson', 'example-set'] and stage in ['remediate', 'reinforce']:
-                from .tools import load_external_resources, load_learner_model
-                try:
-                    learner_model = load_learner_model(learner_id)
-                    current_concept = learner_model.get('current_concept', 'concept-001')
-                    learner_profile = learner_model.get('profile', {})
-
-                    # Load external resources for this concept
-                    external_resources = load_external_resources(current_concept, learner_profile)
-
-                    if external_resources:
-                        # Add top resources to the content
-                        content_obj['external_resources'] = external_resources[:MAX_EXTERNAL_RESOURCES_TO_ATTACH]
-                        logger.info(f"Attached {len(content_obj['external_resources'])} external resources")
-                except Exception as e:
-                    logger.warning(f"Failed to attach external resources: {e}")
-
-            # Add cumulative review metadata if applicable
-            if is_cumulative:
-                content_obj['is_cumulative'] = True
-                content_obj['cumulative_concepts'] = cumulative_concepts
-                logger.info(f"Marked content as cumulative review across: {cumulative_concepts}")
-
-            # Determine if confidence rating should be shown for this question (adaptive frequency)
-            show_confidence = False
-            if content_type in ['multiple-choice', 'fill-blank', 'dialogue']:  # Only for question types
-                from .tools import should_show_confidence_rating, load_learner_model
-                try:
-                    learner_model = load_learner_model(learner_id)
-                    current_concept = learner_model.get('current_concept', 'concept-001')
-                    show_confidence = should_show_confidence_rating(learner_id, current_concept)
-                    logger.info(f"Confidence rating for this question: {show_confidence}")
-                except Exception as e:
-                    logger.warning(f"Failed to determine confidence rating: {e}, defaulting to True")
-                    show_confidence = True
-
-            content_obj['show_confidence'] = show_confidence
-
-            # Strip any video content before returning (hard enforcement)
-            content_obj = strip_video_content(content_obj)
 
-            return {
-                "success": True,
-                "content": content_obj
-            }
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {e}")
-            logger.error(f"Response text: {content_text}")
-            # Return error content
+# Content generation API responses keyed by generation_cache_key()
+_GENERATION_RESPONSE_CACHE = TTLCache(
+    maxsize=GENERATION_RESPONSE_CACHE_MAX_ENTRIES,
+    ttl=GENERATION_RESPONSE_CACHE_TTL_SECONDS
+)
+
+
+def generation_cache_key(learner_id: str, generation: Dict[str, Any]) -> str:
+    """
+    Build the exact-match cache key for a content generation call.
+
+    The key covers the learner, their saved state (via its updated_at stamp)
+    and the full prompt, so any recorded answer produces a new key.
+
+    Args:
+        learner_id: Unique identifier for the learner
+        generation: Prompt data returned by _build_generation_prompt
+
+    Returns:
+        Hex digest key
+    """
+    learner_model = generation["learner_model"] or {}
+    payload = orjson.dumps(
+        [
+            learner_id,
+            learner_model.get("updated_at"),
+            generation["system_prompt"],
+            generation["request"]
+        ],
+        default=str
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _cancel_external_resources(generation: Optional[Dict[str, Any]]) -> None:
+    """
+    Cancel the external resources load when its result will not be used.
+
+    Frees the shared TOOL_EXECUTOR worker if the load has not started yet;
+    a running or finished load is left alone.
+
+    Args:
+        generation: Prompt data returned by _build_generation_prompt, or None
+    """
+    if generation and generation.get("external_resources") is not None:
+        generation["external_resources"].cancel()
+
+
+def _process_generation_response(response: Any, generation: Dict[str, Any],
+                                 learner_id: str, stage: str) -> Dict[str, Any]:
+    """
+    Parse, validate and annotate a content generation API response.
+
+    Args:
+        response: Anthropic API response object
+        generation: Prompt data returned by _build_generation_prompt
+        learner_id: Unique identifier for the learner
+        stage: Learning stage the content was generated for
+
+    Returns:
+        Dictionary containing generated content object
+    """
+    learner_model = generation["learner_model"]
+    is_cumulative = generation["is_cumulative"]
+    cumulative_concepts = generation["cumulative_concepts"]
+
+    logger.debug("Content generation API call completed. Stop reason: %s", response.stop_reason)
+
+    # Extract text response
+    content_text = response_text(response)
+
+    # Strip markdown code fences if present
+    content_text = content_text.strip()
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Raw content text starts with: %s", content_text[:50])
+
+    if content_text.startswith("```"):
+        logger.debug("Stripping markdown code fences from response")
+        content_text = _CODE_FENCE_RE.sub("", content_text).strip()
+
+    # Parse JSON
+    try:
+        content_obj = orjson.loads(content_text)
+        content_type = content_obj.get('type', 'unknown')
+
+        # CRITICAL: Ensure content always has a type field
+        if 'type' not in content_obj or not content_obj['type']:
+            logger.warning("Content missing type field, inferring from structure...")
+            # Try to infer type from content structure
+            if 'sections' in content_obj:
+                content_obj['type'] = 'lesson'
+            elif 'forms' in content_obj and 'noun' in content_obj:
+                content_obj['type'] = 'paradigm-table'
+            elif 'examples' in content_obj:
+                content_obj['type'] = 'example-set'
+            elif 'options' in content_obj and 'correctAnswer' in content_obj:
+                content_obj['type'] = 'multiple-choice'
+            elif 'blanks' in content_obj:
+                content_obj['type'] = 'fill-blank'
+            elif 'scenario' in content_obj and 'part1' in content_obj:
+                content_obj['type'] = 'teaching-moment'
+            elif 'question' in content_obj and 'options' not in content_obj:
+                # Dialogue: has question but no options (open-ended)
+                content_obj['type'] = 'dialogue'
+            else:
+                content_obj['type'] = 'lesson'  # Default fallback
+            content_type = content_obj['type']
+            logger.info("Inferred content type: %s", content_type)
+
+        logger.info("Successfully generated content type: %s", content_type)
+
+        # Validate diagnostic question content
+        is_valid, error_msg = validate_diagnostic_content(content_obj)
+        if not is_valid:
+            logger.error("Content validation failed: %s", error_msg)
+            logger.error("Invalid content keys: %s", list(content_obj)[:20])
+            _cancel_external_resources(generation)
             return {
                 "success": False,
-                "error": "Failed to parse AI response",
+                "error": f"Content validation failed: {error_msg}",
                 "raw_response": content_text
             }
 
-    except Exception as e:
-        import traceback
-        error_details = {
-            "error_type": type(e).__name__,
-            "error_message": str(e),
-            "stage": stage,
-            "learner_id": learner_id,
-            "traceback": traceback.format_exc()
+        # Attach external resources for lesson/example-set content
+        external_resources_future = generation.get("external_resources")
+        if content_type in ['lesson', 'example-set'] and external_resources_future is not None:
+            try:
+                # Started by _build_generation_prompt before the API call
+                external_resources = external_resources_future.result()
+
+                if external_resources:
+                    # Add top resources to the content
+                    content_obj['external_resources'] = external_resources[:MAX_EXTERNAL_RESOURCES_TO_ATTACH]
+                    logger.debug("Attached %s external resources", len(content_obj['external_resources']))
+            except Exception as e:
+                logger.warning("Failed to attach external resources: %s", e)
+        else:
+            _cancel_external_resources(generation)
+
+        # Add cumulative review metadata if applicable
+        if is_cumulative:
+            content_obj['is_cumulative'] = True
+            content_obj['cumulative_concepts'] = cumulative_concepts
+            logger.debug("Marked content as cumulative review across: %s", cumulative_concepts)
+
+        # Determine if confidence rating should be shown for this question (adaptive frequency);
+        # lessons and other non-question content skip the check entirely
+        show_confidence = False
+        if content_type in VALID_QUESTION_TYPES:
+            try:
+                current_concept = learner_model.get('current_concept', 'concept-001')
+                show_confidence = should_show_confidence_rating(learner_id, current_concept, model=learner_model)
+                logger.debug("Confidence rating for this question: %s", show_confidence)
+            except Exception as e:
+                logger.warning("Failed to determine confidence rating: %s, defaulting to True", e)
+                show_confidence = True
+
+        content_obj['show_confidence'] = show_confidence
+
+        # Strip any video content before returning (hard enforcement)
+        content_obj = strip_video_content(content_obj)
+
+        return {
+            "success": True,
+            "content": content_obj
         }
-        logger.error(f"Error generating content: {error_details['error_type']}: {error_details['error_message']}")
-        logger.error(f"Full traceback:\n{error_details['traceback']}")
+    except orjson.JSONDecodeError as e:
+        logger.error("Failed to parse JSON response: %s", e)
+        logger.error("Response text: %s", content_text)
+        _cancel_external_resources(generation)
+        # Return error content
         return {
             "success": False,
-            "error": f"{error_details['error_type']}: {error_details['error_message']}",
-            "error_details": error_details
+            "error": "Failed to parse AI response",
+            "raw_response": content_text
         }
+
+
+def _generation_error_result(e: Exception, learner_id: str, stage: str) -> Dict[str, Any]:
+    """
+    Log a content generation failure and build the error result.
+
+    Args:
+        e: The exception raised while generating content
+        learner_id: Unique identifier for the learner
+        stage: Learning stage that was being generated
+
+    Returns:
+        Dictionary with success False and error details
+    """
+    error_details = {
+        "error_type": type(e).__name__,
+        "error_message": str(e),
+        "stage": stage,
+        "learner_id": learner_id,
+        "traceback": traceback.format_exc()
+    }
+    logger.error("Error generating content: %s: %s", error_details['error_type'], error_details['error_message'])
+    logger.error("Full traceback:\n%s", error_details['traceback'])
+    return {
+        "success": False,
+        "error": f"{error_details['error_type']}: {error_details['error_message']}",
+        "error_details": error_details
+    }
+
+
+def generate_content(learner_id: str, stage: str = "start", correctness: bool = None,
+                     confidence: int = None, remediation_type: str = None,
+                     question_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Generate personalized learning content based on learner profile and current stage.
+
+    Args:
+        learner_id: Unique identifier for the learner
+        stage: Learning stage ("start", "practice", "assess", "remediate", "reinforce")
+        correctness: Whether the previous answer was correct (for adaptive response)
+        confidence: Confidence level 1-4 (for adaptive response)
+        remediation_type: Type of remediation ("brief", "supportive", "full_calibration")
+        question_context: Optional dict with question details for specific feedback:
+            - scenario: The question scenario text
+            - question: The question text
+            - user_answer: Answer index or text the student selected
+            - options: List of options (for multiple-choice)
+            - correct_answer: The correct answer
+
+    Returns:
+        Dictionary containing generated content object
+    """
+    generation = None
+    try:
+        generation = _build_generation_prompt(learner_id, stage, confidence, remediation_type, question_context)
+        if "result" in generation:
+            return generation["result"]
+
+        cache_key = generation_cache_key(learner_id, generation)
+        response = _GENERATION_RESPONSE_CACHE.get(cache_key)
+        if response is None:
+            # Make API call with retry logic
+            response = call_anthropic_with_retry(
+                system_prompt=generation["system_prompt"],
+                user_message=generation["request"],
+                max_retries=3,
+                timeout=30
+            )
+
+        result = _process_generation_response(response, generation, learner_id, stage)
+        if result["success"]:
+            _GENERATION_RESPONSE_CACHE.set(cache_key, response)
+        return result
+
+    except Exception as e:
+        _cancel_external_resources(generation)
+        return _generation_error_result(e, learner_id, stage)
+
+
+async def generate_content_async(learner_id: str, stage: str = "start", correctness: bool = None,
+                                 confidence: int = None, remediation_type: str = None,
+                                 question_context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Async variant of generate_content for use from request handlers.
+
+    The API call uses the async client, so several pieces of content can be
+    generated concurrently with asyncio.gather; prompt assembly and response
+    processing read learner files and run in a worker thread.
+
+    Args:
+        learner_id: Unique identifier for the learner
+        stage: Learning stage ("start", "practice", "assess", "remediate", "reinforce")
+        correctness: Whether the previous answer was correct (for adaptive response)
+        confidence: Confidence level 1-4 (for adaptive response)
+        remediation_type: Type of remediation ("brief", "supportive", "full_calibration")
+        question_context: Optional dict with question details for specific feedback:
+            - scenario: The question scenario text
+            - question: The question text
+            - user_answer: Answer index or text the student selected
+            - options: List of options (for multiple-choice)
+            - correct_answer: The correct answer
+
+    Returns:
+        Dictionary containing generated content object
+    """
+    generation = None
+    try:
+        generation = await asyncio.to_thread(
+            _build_generation_prompt, learner_id, stage, confidence, remediation_type, question_context
+        )
+        if "result" in generation:
+            return generation["result"]
+
+        cache_key = generation_cache_key(learner_id, generation)
+        response = _GENERATION_RESPONSE_CACHE.get(cache_key)
+        if response is None:
+            response = await call_anthropic_with_retry_async(
+                system_prompt=generation["system_prompt"],
+                user_message=generation["request"],
+                max_retries=3,
+                timeout=30
+            )
+
+        result = await asyncio.to_thread(_process_generation_response, response, generation, learner_id, stage)
+        if result["success"]:
+            _GENERATION_RESPONSE_CACHE.set(cache_key, response)
+        return result
+
+    except Exception as e:
+        _cancel_external_resources(generation)
+        return _generation_error_result(e, learner_id, stage)
+
+
+async def generate_content_stream(learner_id: str, stage: str = "start", correctness: bool = None,
+                                  confidence: int = None, remediation_type: str = None,
+                                  question_context: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream content generation, delivering text as Claude produces it.
+
+    The raw JSON text is forwarded as it arrives so the UI can show progress;
+    the content object is parsed and validated once the stream closes.
+
+    Args:
+        learner_id: Unique identifier for the learner
+        stage: Learning stage ("start", "practice", "assess", "remediate", "reinforce")
+        correctness: Whether the previous answer was correct (for adaptive response)
+        confidence: Confidence level 1-4 (for adaptive response)
+        remediation_type: Type of remediation ("brief", "supportive", "full_calibration")
+        question_context: Optional dict with question details for specific feedback
+
+    Yields:
+        Event dictionaries:
+        - {"type": "text", "text": ...} for each text delta
+        - {"type": "done", **result} with the generate_content result when successful
+        - {"type": "error", **result} with the generate_content result on failure
+    """
+    generation = None
+    try:
+        generation = await asyncio.to_thread(
+            _build_generation_prompt, learner_id, stage, confidence, remediation_type, question_context
+        )
+        if "result" in generation:
+            yield {"type": "done", **generation["result"]}
+            return
+
+        cache_key = generation_cache_key(learner_id, generation)
+        response = _GENERATION_RESPONSE_CACHE.get(cache_key)
+        if response is not None:
+            # Replay the cached text in one event so clients see the same sequence
+            yield {"type": "text", "text": response_text(response)}
+        else:
+            async with get_async_client().messages.stream(
+                model=config.ANTHROPIC_MODEL,
+                max_tokens=4096,
+                system=generation["system_prompt"],
+                messages=[{
+                    "role": "user",
+                    "content": generation["request"]
+                }]
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield {"type": "text", "text": text}
+                response = await stream.get_final_message()
+
+        result = await asyncio.to_thread(_process_generation_response, response, generation, learner_id, stage)
+        if result["success"]:
+            _GENERATION_RESPONSE_CACHE.set(cache_key, response)
+
+    except Exception as e:
+        _cancel_external_resources(generation)
+        result = _generation_error_result(e, learner_id, stage)
+
+    yield {"type": "done" if result["success"] else "error", **result}
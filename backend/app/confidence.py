@@ -102,6 +102,18 @@ def calculate_calibration(self_confidence: int, actual_score: float) -> Dict:
     return result
 
 
+# Feedback for each calibration error (self confidence - expected confidence)
+CALIBRATION_FEEDBACK_TEMPLATES = {
+    0: "Your confidence ({self_conf}/5) matches your understanding perfectly - excellent self-awareness!",
+    1: "You were slightly overconfident (rated {self_conf}/5, performance was {expected}/5 level), but you're close to calibrated. Keep refining your self-assessment.",
+    2: "You rated your confidence as {self_conf}/5, but your performance was at a {expected}/5 level. Let's identify the gap in understanding so you can calibrate better.",
+    3: "I notice you were very confident ({self_conf}/5) but scored {actual:.0%}. This suggests a gap we need to address. Let's review the concept to build accurate understanding.",
+    -1: "You were slightly underconfident (rated {self_conf}/5, but performed at {expected}/5 level). You're doing better than you think!",
+    -2: "You rated {self_conf}/5 confidence, but your performance was {expected}/5 level - quite strong! Trust your understanding more.",
+    -3: "You rated your confidence as {self_conf}/5, but you scored {actual:.0%} - that's excellent! You have stronger understanding than you realize. What made you feel uncertain?"
+}
+
+
 def get_calibration_feedback(calibration_data: Dict) -> str:
     """
     Generate appropriate feedback message based on calibration analysis.
@@ -112,30 +124,14 @@ def get_calibration_feedback(calibration_data: Dict) -> str:
     Returns:
         Feedback string for the student
     """
-    self_conf = calibration_data["self_confidence"]
-    actual = calibration_data["actual_score"]
-    expected = calibration_data["expected_confidence"]
-    error = calibration_data["calibration_error"]
-
-    # Calibrated responses
-    if error == 0:
-        return f"Your confidence ({self_conf}/5) matches your understanding perfectly - excellent self-awareness!"
-
-    # Overconfident responses
-    elif error == 1:
-        return f"You were slightly overconfident (rated {self_conf}/5, performance was {expected}/5 level), but you're close to calibrated. Keep refining your self-assessment."
-    elif error == 2:
-        return f"You rated your confidence as {self_conf}/5, but your performance was at a {expected}/5 level. Let's identify the gap in understanding so you can calibrate better."
-    elif error >= 3:
-        return f"I notice you were very confident ({self_conf}/5) but scored {actual:.0%}. This suggests a gap we need to address. Let's review the concept to build accurate understanding."
-
-    # Underconfident responses
-    elif error == -1:
-        return f"You were slightly underconfident (rated {self_conf}/5, but performed at {expected}/5 level). You're doing better than you think!"
-    elif error == -2:
-        return f"You rated {self_conf}/5 confidence, but your performance was {expected}/5 level - quite strong! Trust your understanding more."
-    else:  # error <= -3
-        return f"You rated your confidence as {self_conf}/5, but you scored {actual:.0%} - that's excellent! You have stronger understanding than you realize. What made you feel uncertain?"
+    # Errors beyond +/-3 share the "significantly miscalibrated" message
+    error = max(-3, min(3, calibration_data["calibration_error"]))
+
+    return CALIBRATION_FEEDBACK_TEMPLATES[error].format(
+        self_conf=calibration_data["self_confidence"],
+        actual=calibration_data["actual_score"],
+        expected=calibration_data["expected_confidence"]
+    )
 
 
 def calculate_overall_calibration(confidence_history: List[Dict]) -> Dict:
@@ -42,6 +42,11 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_API_TIMEOUT_SECONDS = 30
 RETRY_BACKOFF_BASE = 2  # Exponential backoff: 2^attempt seconds
 
+# Chat tool execution timeouts
+TOOL_TIMEOUT_SECONDS = 10  # Local resource and learner model reads
+SLOW_TOOL_TIMEOUT_SECONDS = 60  # Tools that call Claude or fetch external sources
+TOOL_EXECUTOR_MAX_WORKERS = 8  # Threads shared by all concurrent tool calls
+
 # ============================================================================
 # Mastery & Assessment
 # ============================================================================
@@ -258,3 +263,30 @@ MAX_HINTS_PER_QUESTION = 2      # Two-level hints (gentle → direct)
 HINT_LEVEL_GENTLE = "gentle"      # Indirect hint (e.g., "Think about case endings...")
 HINT_LEVEL_DIRECT = "direct"      # Direct hint (e.g., "The -ae ending indicates...")
 HINT_LEVEL_ANSWER = "answer"      # Show answer with explanation
+
+# ============================================================================
+# Response Caching
+# ============================================================================
+
+# Exact-match cache for chat turns (same learner state, history, and message)
+CHAT_RESPONSE_CACHE_TTL_SECONDS = 60 * 60  # 1 hour
+CHAT_RESPONSE_CACHE_MAX_ENTRIES = 1024
+
+# Short-lived cache for content generation, so a retried or double-clicked
+# request reuses the response instead of calling the API again
+GENERATION_RESPONSE_CACHE_TTL_SECONDS = 30
+GENERATION_RESPONSE_CACHE_MAX_ENTRIES = 256
+
+# ============================================================================
+# Conversation History
+# ============================================================================
+
+# Messages kept verbatim in the chat history sent to Claude; older turns are
+# collapsed into a short extractive summary
+MAX_CONVERSATION_HISTORY_MESSAGES = 20
+HISTORY_SUMMARY_MAX_LINES = 10
+HISTORY_SUMMARY_LINE_CHARS = 150
+
+# Tool results from turns older than this many user turns are replaced with a
+# one-line placeholder; their tool_use/tool_result pairing is preserved
+TOOL_RESULT_KEEP_TURNS = 2
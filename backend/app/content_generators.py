@@ -58,6 +58,61 @@ def sanitize_user_input(text: str, max_length: int = 1000) -> str:
     return text
 
 
+# Preview requests are fixed per learning style (and, for 'varied', per the
+# randomly chosen content type), so they are built once at import
+_PREVIEW_LESSON_REQUEST = (
+    f"Generate a brief 'lesson' preview ({PREVIEW_READ_TIME_SECONDS}-second read) explaining "
+    "the core concept. Keep it short - this is just a quick preview before assessment. "
+    "Respond ONLY with the JSON object, no other text."
+)
+
+VARIED_PREVIEW_REQUESTS = {
+    'paradigm-table': (
+        f"Generate a brief 'paradigm-table' preview ({PREVIEW_READ_TIME_SECONDS}-second scan) "
+        "showing the key patterns for this concept. Include a very short explanation "
+        "(2-3 sentences max). This is a quick preview before assessment. Respond ONLY with the "
+        "JSON object, no other text."
+    ),
+    'declension-explorer': (
+        "Generate a 'declension-explorer' interactive widget preview for quick exploration of "
+        "the concept. Show a relevant example with brief explanation. This is a quick "
+        "interactive preview before assessment. Respond ONLY with the JSON object, no other text."
+    ),
+    'example-set': (
+        "Generate a brief 'example-set' preview showing the concept through varied examples. "
+        "Keep it short - this is just a quick preview before assessment. Respond ONLY with the "
+        "JSON object, no other text."
+    ),
+    'lesson': _PREVIEW_LESSON_REQUEST,
+}
+
+# Fallback request for stages without a dedicated builder
+DEFAULT_STAGE_REQUEST = (
+    "Generate a 'multiple-choice' diagnostic question with scenario. "
+    "Respond ONLY with the JSON object, no other text."
+)
+
+PREVIEW_REQUESTS = {
+    'narrative': (
+        f"Generate a brief 'example-set' preview ({PREVIEW_READ_TIME_SECONDS}-second read) "
+        "showing the concept through story-based examples. Keep it short - this is just a "
+        "quick preview before assessment. Respond ONLY with the JSON object, no other text."
+    ),
+    'dialogue': (
+        f"Generate a brief Socratic-style 'lesson' preview ({PREVIEW_READ_TIME_SECONDS}-second read) "
+        "that poses questions to guide discovery of the concept. Use a conversational tone. "
+        "Keep it short - this is just an engaging preview before assessment. "
+        "Respond ONLY with the JSON object, no other text."
+    ),
+}
+
+DEFAULT_PREVIEW_REQUEST = (
+    f"Generate a brief 'lesson' preview ({PREVIEW_READ_TIME_SECONDS}-second read) explaining "
+    "the core concept. Keep it short - this is just a conceptual foundation before assessment. "
+    "Respond ONLY with the JSON object, no other text."
+)
+
+
 def generate_preview_request(learning_style: str) -> str:
     """
     Generate request for preview content based on learner's learning style.
@@ -68,58 +123,73 @@ def generate_preview_request(learning_style: str) -> str:
     Returns:
         Prompt string for Claude
     """
-    if learning_style == 'narrative':
-        return (
-            f"Generate a brief 'example-set' preview ({PREVIEW_READ_TIME_SECONDS}-second read) "
-            "showing the concept through story-based examples. Keep it short - this is just a "
-            "quick preview before assessment. Respond ONLY with the JSON object, no other text."
-        )
-
-    elif learning_style == 'varied':
+    if learning_style == 'varied':
         # Vary preview format including interactive widgets
         preview_type = random.choice(PREVIEW_CONTENT_TYPES)
         logger.info(f"Varied learning style - preview with: {preview_type}")
+        return VARIED_PREVIEW_REQUESTS.get(preview_type, _PREVIEW_LESSON_REQUEST)
+
+    return PREVIEW_REQUESTS.get(learning_style, DEFAULT_PREVIEW_REQUEST)
+
+
+# Difficulty guidance appended to diagnostic and practice requests
+DIAGNOSTIC_DIFFICULTY_INSTRUCTIONS = {
+    "easier": (
+        "Use FUNDAMENTAL vocabulary and the most BASIC forms. "
+        "Provide clearer context clues. Focus on recognition over production. "
+        "Make distractors obviously wrong. "
+    ),
+    "appropriate": "",
+    "harder": (
+        "Use more complex vocabulary and varied forms. "
+        "Require deeper analysis. Include subtle distractors. "
+        "Challenge the learner with authentic examples. "
+    )
+}
+
+PRACTICE_DIFFICULTY_INSTRUCTIONS = {
+    "easier": DIAGNOSTIC_DIFFICULTY_INSTRUCTIONS["easier"],
+    "appropriate": "Increase difficulty slightly. ",
+    "harder": DIAGNOSTIC_DIFFICULTY_INSTRUCTIONS["harder"] + "Significantly increase difficulty. "
+}
+
+# Question formats drawn from for each learning style
+NARRATIVE_QUESTION_TYPES = ("multiple-choice", "fill-blank")  # Story-based formats
+INTERACTIVE_QUESTION_TYPES = (
+    "paradigm-table",          # Visual table with comprehension check
+    "declension-explorer",     # Interactive exploration widget
+    "word-order-manipulator",  # Drag-and-drop word arrangement
+    "teaching-moment"          # 2-stage interactive misconception correction
+)
+VARIED_QUESTION_TYPES = (
+    "multiple-choice",
+    "fill-blank",
+    "dialogue",
+    "paradigm-table",          # Visual table with comprehension check
+    "declension-explorer",     # Interactive widget
+    "teaching-moment"          # Pre-authored misconception correction (2-stage)
+)
 
-        if preview_type == 'paradigm-table':
-            return (
-                f"Generate a brief 'paradigm-table' preview ({PREVIEW_READ_TIME_SECONDS}-second scan) "
-                "showing the key patterns for this concept. Include a very short explanation "
-                "(2-3 sentences max). This is a quick preview before assessment. Respond ONLY with the "
-                "JSON object, no other text."
-            )
-        elif preview_type == 'declension-explorer':
-            return (
-                "Generate a 'declension-explorer' interactive widget preview for quick exploration of "
-                "the concept. Show a relevant example with brief explanation. This is a quick "
-                "interactive preview before assessment. Respond ONLY with the JSON object, no other text."
-            )
-        elif preview_type == 'example-set':
-            return (
-                "Generate a brief 'example-set' preview showing the concept through varied examples. "
-                "Keep it short - this is just a quick preview before assessment. Respond ONLY with the "
-                "JSON object, no other text."
-            )
-        else:  # lesson
-            return (
-                f"Generate a brief 'lesson' preview ({PREVIEW_READ_TIME_SECONDS}-second read) explaining "
-                "the core concept. Keep it short - this is just a quick preview before assessment. "
-                "Respond ONLY with the JSON object, no other text."
-            )
 
-    elif learning_style == 'dialogue':
-        return (
-            f"Generate a brief Socratic-style 'lesson' preview ({PREVIEW_READ_TIME_SECONDS}-second read) "
-            "that poses questions to guide discovery of the concept. Use a conversational tone. "
-            "Keep it short - this is just an engaging preview before assessment. "
-            "Respond ONLY with the JSON object, no other text."
-        )
+def _select_question_type(learning_style: str) -> str:
+    """
+    Pick the question format for a diagnostic or practice request.
 
-    else:
-        return (
-            f"Generate a brief 'lesson' preview ({PREVIEW_READ_TIME_SECONDS}-second read) explaining "
-            "the core concept. Keep it short - this is just a conceptual foundation before assessment. "
-            "Respond ONLY with the JSON object, no other text."
-        )
+    Args:
+        learning_style: Learner's preferred learning style
+
+    Returns:
+        Content type to request
+    """
+    if learning_style == "dialogue":
+        return "dialogue"
+    if learning_style == "narrative":
+        return random.choice(NARRATIVE_QUESTION_TYPES)
+    if learning_style == "interactive":
+        # Hands-on widgets only - no traditional questions
+        return random.choice(INTERACTIVE_QUESTION_TYPES)
+    # "varied" - include visual/interactive content, not just questions
+    return random.choice(VARIED_QUESTION_TYPES)
 
 
 def generate_diagnostic_request(
@@ -140,47 +210,10 @@ def generate_diagnostic_request(
     Returns:
         Prompt string for Claude
     """
-    import random
-
-    # Build difficulty instruction
-    difficulty_instructions = {
-        "easier": (
-            "Use FUNDAMENTAL vocabulary and the most BASIC forms. "
-            "Provide clearer context clues. Focus on recognition over production. "
-            "Make distractors obviously wrong. "
-        ),
-        "appropriate": "",
-        "harder": (
-            "Use more complex vocabulary and varied forms. "
-            "Require deeper analysis. Include subtle distractors. "
-            "Challenge the learner with authentic examples. "
-        )
-    }
-
-    difficulty_instruction = difficulty_instructions.get(difficulty, "")
+    difficulty_instruction = DIAGNOSTIC_DIFFICULTY_INSTRUCTIONS.get(difficulty, "")
 
     # Determine content type based on learning style
-    if learning_style == "dialogue":
-        content_type = "dialogue"
-    elif learning_style == "narrative":
-        content_type = random.choice(["multiple-choice", "fill-blank"])  # Story-based formats
-    elif learning_style == "interactive":
-        # Hands-on widgets only - no traditional questions
-        content_type = random.choice([
-            "paradigm-table",      # Visual table with comprehension check
-            "declension-explorer", # Interactive exploration widget
-            "word-order-manipulator",  # Drag-and-drop word arrangement
-            "teaching-moment"      # 2-stage interactive misconception correction
-        ])
-    else:  # "varied" - include visual/interactive content, not just questions
-        content_type = random.choice([
-            "multiple-choice",
-            "fill-blank",
-            "dialogue",
-            "paradigm-table",      # Visual table with comprehension check
-            "declension-explorer", # Interactive widget
-            "teaching-moment"      # Pre-authored misconception correction (2-stage)
-        ])
+    content_type = _select_question_type(learning_style)
 
     # Build prompt based on content type
     if content_type == "teaching-moment":
@@ -301,48 +334,10 @@ def generate_practice_request(
     Returns:
         Prompt string for Claude
     """
-    import random
-
-    # Build difficulty instruction
-    difficulty_instructions = {
-        "easier": (
-            "Use FUNDAMENTAL vocabulary and the most BASIC forms. "
-            "Provide clearer context clues. Focus on recognition over production. "
-            "Make distractors obviously wrong. "
-        ),
-        "appropriate": "Increase difficulty slightly. ",
-        "harder": (
-            "Use more complex vocabulary and varied forms. "
-            "Require deeper analysis. Include subtle distractors. "
-            "Challenge the learner with authentic examples. "
-            "Significantly increase difficulty. "
-        )
-    }
-
-    difficulty_instruction = difficulty_instructions.get(difficulty, "Increase difficulty slightly. ")
+    difficulty_instruction = PRACTICE_DIFFICULTY_INSTRUCTIONS.get(difficulty, "Increase difficulty slightly. ")
 
     # Determine content type based on learning style
-    if learning_style == "dialogue":
-        content_type = "dialogue"
-    elif learning_style == "narrative":
-        content_type = random.choice(["multiple-choice", "fill-blank"])  # Story-based formats
-    elif learning_style == "interactive":
-        # Hands-on widgets only - no traditional questions
-        content_type = random.choice([
-            "paradigm-table",      # Visual table with comprehension check
-            "declension-explorer", # Interactive exploration widget
-            "word-order-manipulator",  # Drag-and-drop word arrangement
-            "teaching-moment"      # 2-stage interactive misconception correction
-        ])
-    else:  # "varied" - include visual/interactive content, not just questions
-        content_type = random.choice([
-            "multiple-choice",
-            "fill-blank",
-            "dialogue",
-            "paradigm-table",      # Visual table with comprehension check
-            "declension-explorer", # Interactive widget
-            "teaching-moment"      # Pre-authored misconception correction (2-stage)
-        ])
+    content_type = _select_question_type(learning_style)
 
     # Build prompt based on content type
     if content_type == "teaching-moment":
@@ -444,6 +439,22 @@ def generate_practice_request(
             )
 
 
+def _answer_text(answer: Any, sanitized_options: List[str]) -> str:
+    """
+    Resolve an answer index to its option text.
+
+    Args:
+        answer: Option index, or a free-text answer
+        sanitized_options: The question's options, already sanitized
+
+    Returns:
+        The option text for a valid index, otherwise the answer as a string
+    """
+    if isinstance(answer, int) and 0 <= answer < len(sanitized_options):
+        return sanitized_options[answer]
+    return str(answer)
+
+
 def build_question_context_string(question_context: Optional[Dict[str, Any]]) -> str:
     """
     Build a formatted string describing the question they just answered.
@@ -457,41 +468,117 @@ def build_question_context_string(question_context: Optional[Dict[str, Any]]) ->
     if not question_context:
         return ""
 
-    # Sanitize all user-facing content
+    # Sanitize all user-facing content; each option is sanitized once and
+    # reused for the chosen/correct answer text and the option list
     scenario = sanitize_user_input(question_context.get('scenario', ''))
     question = sanitize_user_input(question_context.get('question', ''))
     user_ans_idx = question_context.get('user_answer', 'unknown')
     correct_ans_idx = question_context.get('correct_answer', 'unknown')
-    options = question_context.get('options', [])
+    options = [sanitize_user_input(opt) for opt in question_context.get('options', [])]
 
     # Get the actual text of what they chose vs correct answer
-    user_answer_text = (
-        sanitize_user_input(options[user_ans_idx])
-        if isinstance(user_ans_idx, int) and options and user_ans_idx < len(options)
-        else str(user_ans_idx)
-    )
-    correct_answer_text = (
-        sanitize_user_input(options[correct_ans_idx])
-        if isinstance(correct_ans_idx, int) and options and correct_ans_idx < len(options)
-        else str(correct_ans_idx)
-    )
+    user_answer_text = _answer_text(user_ans_idx, options)
+    correct_answer_text = _answer_text(correct_ans_idx, options)
 
-    context = (
+    option_lines = [
+        f"{i}. {opt} {'✓ CORRECT' if i == correct_ans_idx else ('✗ THEY CHOSE THIS' if i == user_ans_idx else '')}\n"
+        for i, opt in enumerate(options)
+    ]
+
+    return (
         f"\n\n=== THE QUESTION THEY JUST ANSWERED INCORRECTLY ===\n\n"
         f"Scenario: {scenario}\n\n"
         f"Question: {question}\n\n"
         f"THEY CHOSE: '{user_answer_text}' (Option {user_ans_idx})\n\n"
         f"CORRECT ANSWER: '{correct_answer_text}' (Option {correct_ans_idx})\n\n"
         f"All Options:\n"
+        f"{''.join(option_lines)}\n"
     )
 
-    for i, opt in enumerate(options):
-        marker = "✓ CORRECT" if i == correct_ans_idx else ("✗ THEY CHOSE THIS" if i == user_ans_idx else "")
-        sanitized_opt = sanitize_user_input(opt)
-        context += f"{i}. {sanitized_opt} {marker}\n"
 
-    context += "\n"
-    return context
+_FULL_CALIBRATION_INTRO = (
+    "The student answered incorrectly with {confidence}/4 confidence (overconfident).{context}"
+)
+_SUPPORTIVE_INTRO = (
+    "The student answered incorrectly with {confidence}/4 confidence (aware of uncertainty).{context}"
+)
+
+# Remediation request templates keyed by (remediation_type, content_type).
+# Each remediation type has a 'lesson' entry used for any other content type.
+REMEDIATION_TEMPLATES = {
+    # Full calibration (overconfident learner)
+    ("full_calibration", "paradigm-table"): (
+        _FULL_CALIBRATION_INTRO +
+        "Generate a 'paradigm-table' that: 1) Shows a complete structured table "
+        "of all variations/forms for the concept they missed, 2) Highlights the specific item they should have chosen, "
+        "3) Includes explanation text that STARTS with: 'You chose [their answer], but looking at the "
+        "complete table, the correct answer is [correct answer] because...' 4) Uses their interests "
+        "in the explanation. 5) Use appropriate headers for the subject matter (not Latin-specific terms). "
+        "Respond ONLY with the JSON object, no other text."
+    ),
+    ("full_calibration", "declension-explorer"): (
+        _FULL_CALIBRATION_INTRO +
+        "Generate a 'declension-explorer' interactive widget that: 1) Shows all forms "
+        "relevant to their mistake, 2) Highlights the specific form they got wrong, 3) Includes "
+        "explanation text that STARTS with: 'You chose [their answer], but let's explore the complete "
+        "set of variations. The correct answer is [correct answer] because...' "
+        "Respond ONLY with the JSON object, no other text."
+    ),
+    ("full_calibration", "example-set"): (
+        _FULL_CALIBRATION_INTRO +
+        "Generate an 'example-set' (NOT a lesson, NOT a table) that: 1) Shows 3-4 "
+        "contextual examples demonstrating the correct concept, 2) Each example includes "
+        "source material, explanation/translation, and notes explaining why it's correct, 3) Uses their interests from "
+        "the Learner Profile in the examples, 4) Addresses their specific misconception. "
+        "CRITICAL: type must be 'example-set'. Respond ONLY with the JSON object, no other text."
+    ),
+    ("full_calibration", "lesson"): (
+        _FULL_CALIBRATION_INTRO +
+        "Generate a 'lesson' (NOT a table) that: 1) STARTS with: 'You chose [their answer], "
+        "which suggests [what misconception this reveals]. However, the correct answer is [correct answer] "
+        "because...' 2) Explains the SPECIFIC concept they misunderstood, 3) Provides 2-3 "
+        "examples using their interests (see Learner Profile above - ACTUALLY use those topics in your "
+        "examples, not generic ones!), 4) Includes calibration feedback about recognizing when to be "
+        "less certain. CRITICAL: The examples MUST relate to the specific interests mentioned in the "
+        "Learner Profile. Respond ONLY with the JSON object, no other text."
+    ),
+    # Supportive (aware of uncertainty)
+    ("supportive", "paradigm-table"): (
+        _SUPPORTIVE_INTRO +
+        "Generate a supportive 'paradigm-table' with: 1) Complete reference table, "
+        "2) Encouraging explanation that validates their awareness of difficulty, 3) Clear marking "
+        "of the correct answer. Be gentle. Respond ONLY with the JSON object, no other text."
+    ),
+    ("supportive", "example-set"): (
+        _SUPPORTIVE_INTRO +
+        "Generate a supportive 'example-set' (NOT a table) with: 1) 3-4 encouraging "
+        "examples using their interests, 2) Each example shows correct usage with source material, explanation, "
+        "and notes, 3) Validates their awareness of difficulty. CRITICAL: type must be 'example-set'. "
+        "Be gentle. Respond ONLY with the JSON object, no other text."
+    ),
+    ("supportive", "lesson"): (
+        _SUPPORTIVE_INTRO +
+        "Generate a supportive 'lesson' (NOT a table) that: 1) Explains: 'You chose "
+        "[their answer], but the correct answer is [correct answer] because...' 2) Directly addresses "
+        "why their specific choice was wrong, 3) Provides 2-3 encouraging examples using their interests "
+        "from the Learner Profile (ACTUALLY use those topics!). CRITICAL: type must be 'lesson'. "
+        "Be gentle and encouraging. Respond ONLY with the JSON object, no other text."
+    ),
+    # Default remediation
+    ("default", "example-set"): (
+        "Generate an 'example-set' (NOT a table) to reinforce the concept from the most recent "
+        "question.{context}Show 3-4 examples using their interests. Each example has source material, "
+        "explanation, and notes. CRITICAL: type must be 'example-set'. Respond ONLY with the "
+        "JSON object, no other text."
+    ),
+    ("default", "lesson"): (
+        "Generate a brief 'lesson' (NOT a table) to clarify the concept tested in the most recent "
+        "question.{context}Start by explaining: 'You chose [their answer], but the correct answer "
+        "is [correct answer].' Then briefly explain the specific concept and provide 1-2 examples "
+        "using their interests (see Learner Profile). CRITICAL: type must be 'lesson'. Respond "
+        "ONLY with the JSON object, no other text."
+    ),
+}
 
 
 def generate_remediation_request(
@@ -518,24 +605,13 @@ def generate_remediation_request(
     # Determine preferred content format based on learner style
     preferred_content_type = _select_remediation_content_type(learning_style)
 
-    # Generate request based on remediation type and content preference
-    if remediation_type == "full_calibration":
-        return _build_full_calibration_request(
-            last_question_context,
-            confidence,
-            preferred_content_type
-        )
-    elif remediation_type == "supportive":
-        return _build_supportive_request(
-            last_question_context,
-            confidence,
-            preferred_content_type
-        )
-    else:
-        return _build_default_remediation_request(
-            last_question_context,
-            preferred_content_type
-        )
+    if remediation_type not in ("full_calibration", "supportive"):
+        remediation_type = "default"
+    template = (
+        REMEDIATION_TEMPLATES.get((remediation_type, preferred_content_type))
+        or REMEDIATION_TEMPLATES[(remediation_type, "lesson")]
+    )
+    return template.format_map({"context": last_question_context, "confidence": confidence})
 
 
 def _select_remediation_content_type(learning_style: str) -> str:
@@ -556,101 +632,6 @@ def _select_remediation_content_type(learning_style: str) -> str:
         return 'lesson'
 
 
-def _build_full_calibration_request(
-    context: str,
-    confidence: Optional[int],
-    content_type: str
-) -> str:
-    """Build request for full calibration remediation (overconfident learner)."""
-    base_intro = f"The student answered incorrectly with {confidence}/4 confidence (overconfident).{context}"
-
-    if content_type == 'paradigm-table':
-        return (
-            f"{base_intro}Generate a 'paradigm-table' that: 1) Shows a complete structured table "
-            f"of all variations/forms for the concept they missed, 2) Highlights the specific item they should have chosen, "
-            f"3) Includes explanation text that STARTS with: 'You chose [their answer], but looking at the "
-            f"complete table, the correct answer is [correct answer] because...' 4) Uses their interests "
-            f"in the explanation. 5) Use appropriate headers for the subject matter (not Latin-specific terms). "
-            f"Respond ONLY with the JSON object, no other text."
-        )
-    elif content_type == 'declension-explorer':
-        return (
-            f"{base_intro}Generate a 'declension-explorer' interactive widget that: 1) Shows all forms "
-            f"relevant to their mistake, 2) Highlights the specific form they got wrong, 3) Includes "
-            f"explanation text that STARTS with: 'You chose [their answer], but let's explore the complete "
-            f"set of variations. The correct answer is [correct answer] because...' "
-            f"Respond ONLY with the JSON object, no other text."
-        )
-    elif content_type == 'example-set':
-        return (
-            f"{base_intro}Generate an 'example-set' (NOT a lesson, NOT a table) that: 1) Shows 3-4 "
-            f"contextual examples demonstrating the correct concept, 2) Each example includes "
-            f"source material, explanation/translation, and notes explaining why it's correct, 3) Uses their interests from "
-            f"the Learner Profile in the examples, 4) Addresses their specific misconception. "
-            f"CRITICAL: type must be 'example-set'. Respond ONLY with the JSON object, no other text."
-        )
-    else:  # lesson or other
-        return (
-            f"{base_intro}Generate a 'lesson' (NOT a table) that: 1) STARTS with: 'You chose [their answer], "
-            f"which suggests [what misconception this reveals]. However, the correct answer is [correct answer] "
-            f"because...' 2) Explains the SPECIFIC concept they misunderstood, 3) Provides 2-3 "
-            f"examples using their interests (see Learner Profile above - ACTUALLY use those topics in your "
-            f"examples, not generic ones!), 4) Includes calibration feedback about recognizing when to be "
-            f"less certain. CRITICAL: The examples MUST relate to the specific interests mentioned in the "
-            f"Learner Profile. Respond ONLY with the JSON object, no other text."
-        )
-
-
-def _build_supportive_request(
-    context: str,
-    confidence: Optional[int],
-    content_type: str
-) -> str:
-    """Build request for supportive remediation (aware of uncertainty)."""
-    base_intro = f"The student answered incorrectly with {confidence}/4 confidence (aware of uncertainty).{context}"
-
-    if content_type == 'paradigm-table':
-        return (
-            f"{base_intro}Generate a supportive 'paradigm-table' with: 1) Complete reference table, "
-            f"2) Encouraging explanation that validates their awareness of difficulty, 3) Clear marking "
-            f"of the correct answer. Be gentle. Respond ONLY with the JSON object, no other text."
-        )
-    elif content_type == 'example-set':
-        return (
-            f"{base_intro}Generate a supportive 'example-set' (NOT a table) with: 1) 3-4 encouraging "
-            f"examples using their interests, 2) Each example shows correct usage with source material, explanation, "
-            f"and notes, 3) Validates their awareness of difficulty. CRITICAL: type must be 'example-set'. "
-            f"Be gentle. Respond ONLY with the JSON object, no other text."
-        )
-    else:  # lesson or other
-        return (
-            f"{base_intro}Generate a supportive 'lesson' (NOT a table) that: 1) Explains: 'You chose "
-            f"[their answer], but the correct answer is [correct answer] because...' 2) Directly addresses "
-            f"why their specific choice was wrong, 3) Provides 2-3 encouraging examples using their interests "
-            f"from the Learner Profile (ACTUALLY use those topics!). CRITICAL: type must be 'lesson'. "
-            f"Be gentle and encouraging. Respond ONLY with the JSON object, no other text."
-        )
-
-
-def _build_default_remediation_request(context: str, content_type: str) -> str:
-    """Build request for default remediation."""
-    if content_type == 'example-set':
-        return (
-            f"Generate an 'example-set' (NOT a table) to reinforce the concept from the most recent "
-            f"question.{context}Show 3-4 examples using their interests. Each example has source material, "
-            f"explanation, and notes. CRITICAL: type must be 'example-set'. Respond ONLY with the "
-            f"JSON object, no other text."
-        )
-    else:  # lesson or other
-        return (
-            f"Generate a brief 'lesson' (NOT a table) to clarify the concept tested in the most recent "
-            f"question.{context}Start by explaining: 'You chose [their answer], but the correct answer "
-            f"is [correct answer].' Then briefly explain the specific concept and provide 1-2 examples "
-            f"using their interests (see Learner Profile). CRITICAL: type must be 'lesson'. Respond "
-            f"ONLY with the JSON object, no other text."
-        )
-
-
 def generate_reinforcement_request(
     question_context: Optional[Dict[str, Any]],
     confidence: Optional[int],
@@ -674,12 +655,10 @@ def generate_reinforcement_request(
         question = sanitize_user_input(question_context.get('question', ''))
         correct_ans_idx = question_context.get('correct_answer', 'unknown')
         options = question_context.get('options', [])
-
-        correct_answer_text = (
-            sanitize_user_input(options[correct_ans_idx])
-            if isinstance(correct_ans_idx, int) and options and correct_ans_idx < len(options)
-            else str(correct_ans_idx)
-        )
+        if isinstance(correct_ans_idx, int) and 0 <= correct_ans_idx < len(options):
+            correct_answer_text = sanitize_user_input(options[correct_ans_idx])
+        else:
+            correct_answer_text = str(correct_ans_idx)
 
         last_question_context = (
             f"\n\n=== THE QUESTION THEY JUST ANSWERED CORRECTLY (but with low confidence) ===\n\n"
@@ -73,6 +73,10 @@ async def startup_event():
             logger.warning(f"⚠️  Content cache initialization failed: {e}")
             logger.warning("⚠️  Content caching will not be available")
 
+        # Build the system prompt once up front so the first chat turn doesn't pay for it
+        from .agent import load_system_prompt
+        load_system_prompt()
+
         # Log directory status for debugging
         logger.info(f"Learner models directory: {config.LEARNER_MODELS_DIR}")
         logger.info(f"Directory exists: {config.LEARNER_MODELS_DIR.exists()}")
@@ -1,5 +1,8 @@
 from fastapi import APIRouter, HTTPException, status, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from typing import Optional, List, Dict, Any
+import json
 import logging
 
 from .. import config
@@ -14,7 +17,7 @@ from ..schemas import (
     StruggleDetectionResponse,
     ScenariosListResponse
 )
-from ..agent import chat
+from ..agent import chat, chat_stream
 from ..tutor_agent import start_tutor_conversation, continue_tutor_conversation
 from ..roman_agent import start_roman_conversation, continue_roman_conversation, load_scenarios
 from ..conversations import (
@@ -36,7 +39,7 @@ async def chat_endpoint(request_obj: Request, request: ChatRequest):
     tool use for resource loading and progress tracking.
     """
     try:
-        result = chat(
+        result = await chat(
             learner_id=request.learner_id,
             user_message=request.message,
             conversation_history=request.conversation_history
@@ -66,6 +69,25 @@ async def chat_endpoint(request_obj: Request, request: ChatRequest):
             detail=f"Chat failed: {str(e)}"
         )
 
+@router.post("/chat/stream")
+async def chat_stream_endpoint(request_obj: Request, request: ChatRequest):
+    """
+    Send a message to the AI tutor and stream the response as Server-Sent Events.
+
+    Each event is a JSON object: "text" events carry incremental text, and the
+    stream ends with a "done" event (final message and conversation history)
+    or an "error" event.
+    """
+    async def event_source():
+        async for event in chat_stream(
+            learner_id=request.learner_id,
+            user_message=request.message,
+            conversation_history=request.conversation_history
+        ):
+            yield f"data: {json.dumps(jsonable_encoder(event))}\n\n"
+
+    return StreamingResponse(event_source(), media_type="text/event-stream")
+
 @router.post("/tutor/conversation", response_model=TutorConversationResponse)
 async def tutor_conversation(request: TutorConversationRequest):
     """
@@ -1,5 +1,9 @@
 from fastapi import APIRouter, HTTPException, status, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from typing import Optional, List, Dict, Any
+import asyncio
+import json
 import logging
 from datetime import datetime
 
@@ -22,7 +26,7 @@ from ..tools import (
     detect_struggle,
     detect_celebration_milestones
 )
-from ..agent import generate_content, call_anthropic_with_retry
+from ..agent import generate_content_async, generate_content_stream, call_anthropic_with_retry_async, response_text
 from ..content_generators import generate_hint_request
 from ..constants import (
     HINTS_ENABLED_IN_PRACTICE,
@@ -161,7 +165,7 @@ async def generate_content_endpoint(request: Request, learner_id: str, stage: st
     Uses learner profile to create customized lessons, examples, and assessments.
     """
     try:
-        result = generate_content(learner_id, stage)
+        result = await generate_content_async(learner_id, stage)
 
         if not result["success"]:
             raise HTTPException(
@@ -183,6 +187,20 @@ async def generate_content_endpoint(request: Request, learner_id: str, stage: st
             detail=f"Failed to generate content: {str(e)}"
         )
 
+@router.post("/generate-content/stream")
+async def generate_content_stream_endpoint(request: Request, learner_id: str, stage: str = "start"):
+    """
+    Generate personalized learning content and stream it as Server-Sent Events.
+
+    "text" events carry the raw generated text as it arrives; the stream ends
+    with a "done" event holding the parsed content or an "error" event.
+    """
+    async def event_source():
+        async for event in generate_content_stream(learner_id, stage):
+            yield f"data: {json.dumps(jsonable_encoder(event))}\n\n"
+
+    return StreamingResponse(event_source(), media_type="text/event-stream")
+
 @router.post("/submit-response", response_model=EvaluationResponse)
 async def submit_response(request: Request, body: SubmitResponseRequest):
     """
@@ -213,7 +231,8 @@ async def submit_response(request: Request, body: SubmitResponseRequest):
             # Use AI to evaluate open-ended dialogue responses with rubric-based explanation
             from ..agent import evaluate_dialogue_response
 
-            evaluation = evaluate_dialogue_response(
+            evaluation = await asyncio.to_thread(
+                evaluate_dialogue_response,
                 question=body.question_text,
                 context=body.scenario_text or "",
                 student_answer=body.user_answer,
@@ -300,7 +319,7 @@ async def submit_response(request: Request, body: SubmitResponseRequest):
             logger.info(f"Passing question context to AI for {stage} feedback")
 
         # Generate next content using the AI
-        result = generate_content(
+        result = await generate_content_async(
             body.learner_id,
             stage,
             correctness=is_correct,
@@ -458,7 +477,8 @@ async def evaluate_dialogue(body: DialogueEvaluationRequest):
 
         logger.info(f"Evaluating dialogue for learner {body.learner_id}, exchange #{body.exchange_count + 1}")
 
-        evaluation = evaluate_dialogue_response(
+        evaluation = await asyncio.to_thread(
+            evaluate_dialogue_response,
             question=body.question,
             context=body.context or "",
             student_answer=body.answer,
@@ -530,18 +550,13 @@ async def request_hint(request: Request, body: dict):
         hint_prompt = generate_hint_request(question_context, hint_level, concept_id)
 
         # Call Claude API for hint
-        response = call_anthropic_with_retry(
+        response = await call_anthropic_with_retry_async(
             system_prompt="You are a patient Latin tutor providing hints to a struggling student in practice mode. Be encouraging and educational.",
-            user_message=hint_prompt,
-            # model=config.CLAUDE_MODEL, # call_anthropic_with_retry uses config.ANTHROPIC_MODEL internally
-            # max_tokens=500  # call_anthropic_with_retry uses fixed max_tokens or we need to update it to accept kwargs if needed.
-            # Checking agent.py definition: def call_anthropic_with_retry(system_prompt: str, user_message: str, max_retries: int = DEFAULT_MAX_RETRIES, timeout: int = DEFAULT_API_TIMEOUT_SECONDS) -> Any:
-            # It does NOT accept model or max_tokens as arguments. It uses config.ANTHROPIC_MODEL and hardcoded 4096.
-            # So I should remove model and max_tokens arguments.
+            user_message=hint_prompt
         )
 
         # Extract hint text (response should be plain text, not JSON)
-        hint_text = response.get("content", [{}])[0].get("text", "")
+        hint_text = response_text(response)
 
         if not hint_text:
             raise HTTPException(
@@ -5,6 +5,7 @@ API Routers for Learner-related endpoints
 from fastapi import APIRouter, Depends, HTTPException, status, Request
 from slowapi import Limiter
 from slowapi.util import get_remote_address
+import asyncio
 import logging
 
 
@@ -18,7 +19,7 @@ from ..schemas import (
     EvaluationResponse,
 )
 from ..auth import get_current_user, validate_learner_exists
-from ..agent import chat, generate_content
+from ..agent import chat, generate_content_async
 from ..tools import create_learner_model, load_learner_model, calculate_mastery, get_due_reviews, get_review_stats
 from ..config import config
 
@@ -152,7 +153,8 @@ async def submit_response(request: Request, body: SubmitResponseRequest):
             else:
                 is_correct = user_answer_normalized == body.correct_answer.lower().strip()
         elif body.question_type == "dialogue":
-            evaluation = evaluate_dialogue_response(
+            evaluation = await asyncio.to_thread(
+                evaluate_dialogue_response,
                 question=body.question_text,
                 context=body.scenario_text or "",
                 student_answer=body.user_answer,
@@ -193,7 +195,7 @@ async def submit_response(request: Request, body: SubmitResponseRequest):
             "options": body.options or []
         } if stage in ["remediate", "reinforce"] else None
 
-        result = generate_content(
+        result = await generate_content_async(
             body.learner_id,
             stage,
             correctness=is_correct,
@@ -251,7 +253,7 @@ async def generate_content_endpoint(request: Request, learner_id: str, stage: st
     """
     Generate personalized learning content using AI.
     """
-    result = generate_content(learner_id, stage)
+    result = await generate_content_async(learner_id, stage)
     if not result["success"]:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=result.get("error", "Content generation failed"))
     return result
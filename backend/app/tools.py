@@ -7,8 +7,9 @@ and managing learner models (progress tracking).
 
 import json
 import logging
+import orjson
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from .config import config
 from .spaced_repetition import (
@@ -26,6 +27,47 @@ logging.basicConfig(level=getattr(logging, config.LOG_LEVEL))
 logger = logging.getLogger(__name__)
 
 
+# Raw learner model file contents keyed by path: (mtime_ns, size), text
+_LEARNER_MODEL_CACHE: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+
+# Raw resource bank file contents keyed by path: (mtime_ns, size), text
+_RESOURCE_FILE_CACHE: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+
+
+def _file_signature(path: Path) -> Tuple[int, int]:
+    """Return the (mtime_ns, size) pair used to detect file changes."""
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def read_resource_file(path: Path) -> str:
+    """
+    Read a resource bank file, reusing the cached text while it is unchanged.
+
+    Many learners work on the same concepts, so resource, assessment and
+    metadata files are read once and served from memory until their mtime
+    or size changes (e.g. when a course is edited).
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        File contents
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    signature = _file_signature(path)
+    cached = _RESOURCE_FILE_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    _RESOURCE_FILE_CACHE[path] = (signature, text)
+    return text
+
+
 # ============================================================================
 # Resource Loading Functions
 # ============================================================================
@@ -51,13 +93,12 @@ def load_resource(concept_id: str, resource_type: str, course_id: Optional[str]
 
         if resource_type == "text-explainer":
             resource_path = concept_dir / "resources" / "text-explainer.md"
-            if not resource_path.exists():
+            try:
+                content = read_resource_file(resource_path)
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Text explainer not found for {concept_id}")
 
-            with open(resource_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            logger.info(f"Loaded text-explainer for {concept_id}")
+            logger.info("Loaded text-explainer for %s", concept_id)
             return {
                 "type": "text",
                 "concept_id": concept_id,
@@ -66,13 +107,12 @@ def load_resource(concept_id: str, resource_type: str, course_id: Optional[str]
 
         elif resource_type == "examples":
             resource_path = concept_dir / "resources" / "examples.json"
-            if not resource_path.exists():
+            try:
+                data = json.loads(read_resource_file(resource_path))
+            except FileNotFoundError:
                 raise FileNotFoundError(f"Examples not found for {concept_id}")
 
-            with open(resource_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            logger.info(f"Loaded examples for {concept_id}")
+            logger.info("Loaded examples for %s", concept_id)
             return {
                 "type": "examples",
                 "concept_id": concept_id,
@@ -83,7 +123,7 @@ def load_resource(concept_id: str, resource_type: str, course_id: Optional[str]
             raise ValueError(f"Invalid resource_type: {resource_type}. Must be 'text-explainer' or 'examples'")
 
     except Exception as e:
-        logger.error(f"Error loading resource {resource_type} for {concept_id}: {e}")
+        logger.error("Error loading resource %s for %s: %s", resource_type, concept_id, e)
         raise
 
 
@@ -112,17 +152,16 @@ def load_assessment(concept_id: str, assessment_type: str, course_id: Optional[s
         assessment_file = f"{assessment_type}-prompts.json" if assessment_type in ["dialogue", "written"] else "applied-tasks.json"
         assessment_path = concept_dir / "assessments" / assessment_file
 
-        if not assessment_path.exists():
+        try:
+            data = json.loads(read_resource_file(assessment_path))
+        except FileNotFoundError:
             raise FileNotFoundError(f"Assessment {assessment_type} not found for {concept_id}")
 
-        with open(assessment_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        logger.info(f"Loaded {assessment_type} assessment for {concept_id}")
+        logger.info("Loaded %s assessment for %s", assessment_type, concept_id)
         return data
 
     except Exception as e:
-        logger.error(f"Error loading assessment {assessment_type} for {concept_id}: {e}")
+        logger.error("Error loading assessment %s for %s: %s", assessment_type, concept_id, e)
         raise
 
 
@@ -144,20 +183,48 @@ def load_concept_metadata(concept_id: str, course_id: Optional[str] = None) -> D
         concept_dir = config.get_concept_dir(concept_id, course_id)
         metadata_path = concept_dir / "metadata.json"
 
-        if not metadata_path.exists():
+        try:
+            metadata = json.loads(read_resource_file(metadata_path))
+        except FileNotFoundError:
             raise FileNotFoundError(f"Metadata not found for {concept_id}")
 
-        with open(metadata_path, "r", encoding="utf-8") as f:
-            metadata = json.load(f)
-
-        logger.info(f"Loaded metadata for {concept_id}")
+        logger.info("Loaded metadata for %s", concept_id)
         return metadata
 
     except Exception as e:
-        logger.error(f"Error loading metadata for {concept_id}: {e}")
+        logger.error("Error loading metadata for %s: %s", concept_id, e)
         raise
 
 
+def load_concept_bundle(concept_id: str, course_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load a concept's metadata together with its text explainer and examples.
+
+    Saves the agent separate tool round-trips when it needs all three at a
+    concept transition.
+
+    Args:
+        concept_id: Concept identifier (e.g., "concept-001")
+        course_id: Course identifier (defaults to DEFAULT_COURSE_ID)
+
+    Returns:
+        Dictionary with "metadata", "text_explainer" and "examples"; a missing
+        resource is returned as None
+
+    Raises:
+        FileNotFoundError: If the concept metadata doesn't exist
+    """
+    bundle = {"metadata": load_concept_metadata(concept_id, course_id)}
+
+    for key, resource_type in (("text_explainer", "text-explainer"), ("examples", "examples")):
+        try:
+            bundle[key] = load_resource(concept_id, resource_type, course_id)
+        except FileNotFoundError:
+            bundle[key] = None
+
+    return bundle
+
+
 # ============================================================================
 # Learner Model Management Functions
 # ============================================================================
@@ -214,18 +281,41 @@ def create_learner_model(
         # Save to disk
         save_learner_model(learner_id, learner_model)
 
-        logger.info(f"Created new learner model for {learner_id} with course {learner_model['current_course']}")
+        logger.info("Created new learner model for %s with course %s", learner_id, learner_model['current_course'])
         return learner_model
 
     except Exception as e:
-        logger.error(f"Error creating learner model for {learner_id}: {e}")
+        logger.error("Error creating learner model for %s: %s", learner_id, e)
         raise
 
 
+def get_learner_model_signature(learner_id: str) -> Tuple[int, int]:
+    """
+    Get a cheap version stamp for a learner model file.
+
+    The signature changes whenever the model is saved, so it can be used to
+    key caches of values derived from the model.
+
+    Args:
+        learner_id: Unique identifier for the learner
+
+    Returns:
+        Tuple of (mtime_ns, size) for the learner file
+
+    Raises:
+        FileNotFoundError: If learner doesn't exist
+    """
+    return _file_signature(config.get_learner_file(learner_id))
+
+
 def load_learner_model(learner_id: str) -> Dict[str, Any]:
     """
     Load an existing learner model.
 
+    The raw file contents are cached keyed on the file's mtime and size, so
+    repeated loads of an unchanged learner skip the disk read. Every call
+    decodes a fresh dictionary, so callers are free to mutate the result.
+
     Args:
         learner_id: Unique identifier for the learner
 
@@ -238,17 +328,30 @@ def load_learner_model(learner_id: str) -> Dict[str, Any]:
     try:
         learner_file = config.get_learner_file(learner_id)
 
-        if not learner_file.exists():
+        try:
+            signature = _file_signature(learner_file)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Learner {learner_id} not found")
 
-        with open(learner_file, "r", encoding="utf-8") as f:
-            learner_model = json.load(f)
+        cached = _LEARNER_MODEL_CACHE.get(learner_file)
+        if cached is not None and cached[0] == signature:
+            raw = cached[1]
+        else:
+            with open(learner_file, "r", encoding="utf-8") as f:
+                raw = f.read()
+            _LEARNER_MODEL_CACHE[learner_file] = (signature, raw)
 
-        logger.info(f"Loaded learner model for {learner_id}")
+        try:
+            learner_model = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Files written by the json module may contain NaN/Infinity, which orjson rejects
+            learner_model = json.loads(raw)
+
+        logger.info("Loaded learner model for %s", learner_id)
         return learner_model
 
     except Exception as e:
-        logger.error(f"Error loading learner model for {learner_id}: {e}")
+        logger.error("Error loading learner model for %s: %s", learner_id, e)
         raise
 
 
@@ -273,16 +376,45 @@ def save_learner_model(learner_id: str, model: Dict[str, Any]) -> None:
         model["updated_at"] = datetime.now().isoformat()
 
         # Save to disk
+        raw = orjson.dumps(model, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
         with open(learner_file, "w", encoding="utf-8") as f:
-            json.dump(model, f, indent=2, ensure_ascii=False)
+            f.write(raw)
+
+        # Write through to the cache so the next load skips the disk read
+        _LEARNER_MODEL_CACHE[learner_file] = (_file_signature(learner_file), raw)
 
-        logger.info(f"Saved learner model for {learner_id}")
+        logger.info("Saved learner model for %s", learner_id)
 
     except Exception as e:
-        logger.error(f"Error saving learner model for {learner_id}: {e}")
+        logger.error("Error saving learner model for %s: %s", learner_id, e)
         raise
 
 
+def get_concept_calibration(concept_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Get overall calibration metrics for a concept, reusing the stored result.
+
+    Metrics are stored on the concept as "calibration_cache" together with
+    the history length they were computed from, and recomputed only when
+    new confidence records have been added.
+
+    Args:
+        concept_data: Concept entry from a learner model (updated in place)
+
+    Returns:
+        Overall calibration metrics (see calculate_overall_calibration)
+    """
+    history = concept_data.get("confidence_history", [])
+    cache = concept_data.get("calibration_cache")
+    if cache is None or cache.get("history_length") != len(history):
+        cache = {
+            "history_length": len(history),
+            "metrics": calculate_overall_calibration(history)
+        }
+        concept_data["calibration_cache"] = cache
+    return cache["metrics"]
+
+
 def update_learner_model(
     learner_id: str,
     concept_id: str,
@@ -304,14 +436,14 @@ def update_learner_model(
     """
     try:
         # Load existing model
-        logger.info(f"🔍 update_learner_model called for learner={learner_id}, concept={concept_id}")
-        logger.info(f"📊 Assessment data: type={assessment_data.get('type')}, score={assessment_data.get('score')}, confidence={assessment_data.get('self_confidence')}")
+        logger.info("🔍 update_learner_model called for learner=%s, concept=%s", learner_id, concept_id)
+        logger.info("📊 Assessment data: type=%s, score=%s, confidence=%s", assessment_data.get('type'), assessment_data.get('score'), assessment_data.get('self_confidence'))
 
         model = load_learner_model(learner_id)
 
         # Initialize concept tracking if not exists
         if concept_id not in model["concepts"]:
-            logger.info(f"🆕 Initializing new concept entry for {concept_id}")
+            logger.info("🆕 Initializing new concept entry for %s", concept_id)
             model["concepts"][concept_id] = {
                 "concept_id": concept_id,
                 "status": "in_progress",
@@ -322,7 +454,7 @@ def update_learner_model(
                 "review_data": initialize_review_data(concept_id)
             }
         else:
-            logger.info(f"📝 Updating existing concept entry for {concept_id}")
+            logger.info("📝 Updating existing concept entry for %s", concept_id)
 
         concept_data = model["concepts"][concept_id]
 
@@ -336,7 +468,7 @@ def update_learner_model(
             "prompt_id": assessment_data.get("prompt_id")
         }
         concept_data["assessments"].append(assessment_record)
-        logger.info(f"✅ Added assessment record. Total assessments for {concept_id}: {len(concept_data['assessments'])}")
+        logger.info("✅ Added assessment record. Total assessments for %s: %s", concept_id, len(concept_data['assessments']))
 
         # Add confidence tracking if present
         if "calibration" in assessment_data:
@@ -349,6 +481,7 @@ def update_learner_model(
                 "calibration": assessment_data["calibration"].get("calibration")
             }
             concept_data["confidence_history"].append(confidence_record)
+            get_concept_calibration(concept_data)
 
         # Update mastery score (average of all assessments)
         if concept_data["assessments"]:
@@ -374,17 +507,17 @@ def update_learner_model(
         model["overall_progress"]["total_assessments"] = sum(
             len(c["assessments"]) for c in model["concepts"].values()
         )
-        logger.info(f"📈 Updated total_assessments count: {model['overall_progress']['total_assessments']}")
+        logger.info("📈 Updated total_assessments count: %s", model['overall_progress']['total_assessments'])
 
         # Save updated model
         save_learner_model(learner_id, model)
 
-        logger.info(f"💾 Saved learner model for {learner_id}, concept {concept_id}")
-        logger.info(f"✨ Summary: {len(model['concepts'])} concepts tracked, {model['overall_progress']['total_assessments']} total assessments")
+        logger.info("💾 Saved learner model for %s, concept %s", learner_id, concept_id)
+        logger.info("✨ Summary: %s concepts tracked, %s total assessments", len(model['concepts']), model['overall_progress']['total_assessments'])
         return model
 
     except Exception as e:
-        logger.error(f"Error updating learner model for {learner_id}: {e}")
+        logger.error("Error updating learner model for %s: %s", learner_id, e)
         raise
 
 
@@ -413,14 +546,14 @@ def record_assessment_and_check_completion(
     """
 
     try:
-        logger.info(f"🎯 record_assessment_and_check_completion called: learner={learner_id}, concept={concept_id}, correct={is_correct}, confidence={confidence}, type={question_type}, practice={practice_mode}")
+        logger.info("🎯 record_assessment_and_check_completion called: learner=%s, concept=%s, correct=%s, confidence=%s, type=%s, practice=%s", learner_id, concept_id, is_correct, confidence, question_type, practice_mode)
 
         # Translate correctness into a mastery score contribution
         score = 1.0 if is_correct else 0.0
 
         # In practice mode, don't record or update mastery
         if practice_mode:
-            logger.info(f"⏸️ Practice mode: Not recording assessment for {learner_id}, {concept_id}")
+            logger.info("⏸️ Practice mode: Not recording assessment for %s, %s", learner_id, concept_id)
             return {
                 "concept_completed": False,
                 "concepts_completed_total": 0,
@@ -437,7 +570,7 @@ def record_assessment_and_check_completion(
             "score": score,
             "self_confidence": confidence,
         }
-        logger.info(f"📦 Built assessment_data: {assessment_data}")
+        logger.debug("📦 Built assessment_data: %s", assessment_data)
 
         calibration_data = None
         if confidence is not None:
@@ -521,116 +654,129 @@ def record_assessment_and_check_completion(
         raise
 
 
-def calculate_mastery(learner_id: str, concept_id: str) -> Dict[str, Any]:
+def compute_mastery(concept_id: str, concept_data: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Calculate mastery level for a concept.
+    Calculate mastery level from a concept's assessment history.
 
     Args:
-        learner_id: Unique identifier for the learner
-        concept_id: Concept to check mastery for
+        concept_id: Concept identifier
+        concept_data: Concept entry from a learner model
 
     Returns:
         Dictionary with mastery analysis
-
-    Raises:
-        FileNotFoundError: If learner doesn't exist
-        ValueError: If concept not started
     """
-    try:
-        model = load_learner_model(learner_id)
+    assessments = concept_data["assessments"]
 
-        if concept_id not in model["concepts"]:
-            raise ValueError(f"Concept {concept_id} not started for learner {learner_id}")
+    if not assessments:
+        return {
+            "concept_id": concept_id,
+            "mastery_achieved": False,
+            "mastery_score": 0.0,
+            "assessments_completed": 0,
+            "recommendation": "continue",
+            "reason": "No assessments completed yet"
+        }
 
-        concept_data = model["concepts"][concept_id]
-        assessments = concept_data["assessments"]
+    # Calculate metrics with spaced repetition forgiveness
+    from .constants import LEARNING_PHASE_QUESTIONS, LEARNING_PHASE_WEIGHT, MASTERY_PHASE_WEIGHT
 
-        if not assessments:
-            return {
-                "concept_id": concept_id,
-                "mastery_achieved": False,
-                "mastery_score": 0.0,
-                "assessments_completed": 0,
-                "recommendation": "continue",
-                "reason": "No assessments completed yet"
-            }
+    scores = [a["score"] for a in assessments]
+    num_assessments = len(assessments)
 
-        # Calculate metrics with spaced repetition forgiveness
-        from .constants import LEARNING_PHASE_QUESTIONS, LEARNING_PHASE_WEIGHT, MASTERY_PHASE_WEIGHT
+    # Apply forgiveness weighting: early questions (learning phase) weighted less
+    # This prevents early mistakes from permanently hurting mastery score
+    weighted_scores = []
+    total_weight = 0
 
-        scores = [a["score"] for a in assessments]
-        num_assessments = len(assessments)
+    for i, score in enumerate(scores):
+        # First N questions are "learning phase" with reduced weight
+        if i < LEARNING_PHASE_QUESTIONS:
+            weight = LEARNING_PHASE_WEIGHT  # 50% weight
+        else:
+            weight = MASTERY_PHASE_WEIGHT   # 100% weight
 
-        # Apply forgiveness weighting: early questions (learning phase) weighted less
-        # This prevents early mistakes from permanently hurting mastery score
-        weighted_scores = []
-        total_weight = 0
+        weighted_scores.append(score * weight)
+        total_weight += weight
 
-        for i, score in enumerate(scores):
-            # First N questions are "learning phase" with reduced weight
-            if i < LEARNING_PHASE_QUESTIONS:
-                weight = LEARNING_PHASE_WEIGHT  # 50% weight
-            else:
-                weight = MASTERY_PHASE_WEIGHT   # 100% weight
+    # Calculate weighted average
+    weighted_avg = sum(weighted_scores) / total_weight if total_weight > 0 else 0.0
 
-            weighted_scores.append(score * weight)
-            total_weight += weight
+    # Use sliding window for recent performance (with weighting applied)
+    window_size = config.MASTERY_WINDOW_SIZE
+    recent_scores = scores[-window_size:] if len(scores) > window_size else scores
 
-        # Calculate weighted average
-        weighted_avg = sum(weighted_scores) / total_weight if total_weight > 0 else 0.0
+    # Also calculate recent weighted average for display
+    recent_weighted = []
+    recent_weight = 0
+    for i, score in enumerate(scores[-window_size:]):
+        actual_index = len(scores) - window_size + i if len(scores) > window_size else i
+        if actual_index < LEARNING_PHASE_QUESTIONS:
+            weight = LEARNING_PHASE_WEIGHT
+        else:
+            weight = MASTERY_PHASE_WEIGHT
+        recent_weighted.append(score * weight)
+        recent_weight += weight
+
+    avg_score = sum(recent_weighted) / recent_weight if recent_weight > 0 else 0.0
+
+    logger.info("Mastery calculation for %s: %s recent assessments, weighted_avg=%.2f, overall_weighted=%.2f", concept_id, len(recent_scores), avg_score, weighted_avg)
+
+    # Check mastery criteria
+    mastery_achieved = (
+        avg_score >= config.MASTERY_THRESHOLD and
+        num_assessments >= config.MIN_ASSESSMENTS_FOR_MASTERY
+    )
+
+    # Determine recommendation
+    if mastery_achieved:
+        recommendation = "progress"
+        reason = f"Mastery achieved: {avg_score:.2f} average over last {len(recent_scores)} assessments"
+    elif avg_score >= config.CONTINUE_THRESHOLD:
+        recommendation = "continue"
+        reason = f"Good progress ({avg_score:.2f}), continue practicing"
+    else:
+        recommendation = "support"
+        reason = f"Needs support ({avg_score:.2f}), consider different approach or review prerequisites"
+
+    return {
+        "concept_id": concept_id,
+        "mastery_achieved": mastery_achieved,
+        "mastery_score": avg_score,
+        "assessments_completed": num_assessments,
+        "recommendation": recommendation,
+        "reason": reason,
+        "recent_scores": scores[-3:] if len(scores) >= 3 else scores
+    }
 
-        # Use sliding window for recent performance (with weighting applied)
-        window_size = config.MASTERY_WINDOW_SIZE
-        recent_scores = scores[-window_size:] if len(scores) > window_size else scores
 
-        # Also calculate recent weighted average for display
-        recent_weighted = []
-        recent_weight = 0
-        for i, score in enumerate(scores[-window_size:]):
-            actual_index = len(scores) - window_size + i if len(scores) > window_size else i
-            if actual_index < LEARNING_PHASE_QUESTIONS:
-                weight = LEARNING_PHASE_WEIGHT
-            else:
-                weight = MASTERY_PHASE_WEIGHT
-            recent_weighted.append(score * weight)
-            recent_weight += weight
+def calculate_mastery(learner_id: str, concept_id: str) -> Dict[str, Any]:
+    """
+    Calculate mastery level for a concept.
 
-        avg_score = sum(recent_weighted) / recent_weight if recent_weight > 0 else 0.0
+    Args:
+        learner_id: Unique identifier for the learner
+        concept_id: Concept to check mastery for
 
-        logger.info(f"Mastery calculation for {concept_id}: {len(recent_scores)} recent assessments, weighted_avg={avg_score:.2f}, overall_weighted={weighted_avg:.2f}")
+    Returns:
+        Dictionary with mastery analysis
 
-        # Check mastery criteria
-        mastery_achieved = (
-            avg_score >= config.MASTERY_THRESHOLD and
-            num_assessments >= config.MIN_ASSESSMENTS_FOR_MASTERY
-        )
+    Raises:
+        FileNotFoundError: If learner doesn't exist
+        ValueError: If concept not started
+    """
+    try:
+        model = load_learner_model(learner_id)
 
-        # Determine recommendation
-        if mastery_achieved:
-            recommendation = "progress"
-            reason = f"Mastery achieved: {avg_score:.2f} average over last {len(recent_scores)} assessments"
-        elif avg_score >= config.CONTINUE_THRESHOLD:
-            recommendation = "continue"
-            reason = f"Good progress ({avg_score:.2f}), continue practicing"
-        else:
-            recommendation = "support"
-            reason = f"Needs support ({avg_score:.2f}), consider different approach or review prerequisites"
+        if concept_id not in model["concepts"]:
+            raise ValueError(f"Concept {concept_id} not started for learner {learner_id}")
 
-        result = {
-            "concept_id": concept_id,
-            "mastery_achieved": mastery_achieved,
-            "mastery_score": avg_score,
-            "assessments_completed": num_assessments,
-            "recommendation": recommendation,
-            "reason": reason,
-            "recent_scores": scores[-3:] if len(scores) >= 3 else scores
-        }
+        result = compute_mastery(concept_id, model["concepts"][concept_id])
 
-        logger.info(f"Calculated mastery for {learner_id}, {concept_id}: {avg_score:.2f}")
+        logger.info("Calculated mastery for %s, %s: %.2f", learner_id, concept_id, result['mastery_score'])
         return result
 
     except Exception as e:
-        logger.error(f"Error calculating mastery for {learner_id}, {concept_id}: {e}")
+        logger.error("Error calculating mastery for %s, %s: %s", learner_id, concept_id, e)
         raise
 
 
@@ -653,7 +799,7 @@ def validate_concept_completeness(concept_id: str, course_id: Optional[str] = No
 
         # Check that concept directory exists
         if not concept_dir.exists():
-            logger.warning(f"Concept directory does not exist: {concept_id}")
+            logger.warning("Concept directory does not exist: %s", concept_id)
             return False
 
         # Define required files with minimum size requirements
@@ -666,19 +812,19 @@ def validate_concept_completeness(concept_id: str, course_id: Optional[str] = No
         # Validate each required file
         for file_path, min_size in required_files:
             if not file_path.exists():
-                logger.warning(f"Required file missing for {concept_id}: {file_path.name}")
+                logger.warning("Required file missing for %s: %s", concept_id, file_path.name)
                 return False
 
             # Check file has content (not empty scaffold)
             if file_path.stat().st_size < min_size:
-                logger.warning(f"Required file too small for {concept_id}: {file_path.name} ({file_path.stat().st_size} bytes < {min_size} bytes)")
+                logger.warning("Required file too small for %s: %s (%s bytes < %s bytes)", concept_id, file_path.name, file_path.stat().st_size, min_size)
                 return False
 
-        logger.info(f"Concept {concept_id} validation passed - all required resources present")
+        logger.info("Concept %s validation passed - all required resources present", concept_id)
         return True
 
     except Exception as e:
-        logger.error(f"Error validating concept completeness for {concept_id}: {e}")
+        logger.error("Error validating concept completeness for %s: %s", concept_id, e)
         return False
 
 
@@ -706,17 +852,17 @@ def get_next_concept(current_concept_id: str, course_id: Optional[str] = None) -
             # (Based on peer review: prevent crashes from empty concept directories)
             next_concept_dir = config.get_concept_dir(next_concept_id, course_id)
             if next_concept_dir.exists() and validate_concept_completeness(next_concept_id, course_id):
-                logger.info(f"Next concept after {current_concept_id} is {next_concept_id}")
+                logger.info("Next concept after %s is %s", current_concept_id, next_concept_id)
                 return next_concept_id
             else:
-                logger.warning(f"Concept {next_concept_id} exists but is incomplete - no content to progress to")
+                logger.warning("Concept %s exists but is incomplete - no content to progress to", next_concept_id)
                 return None
 
-        logger.info(f"No next concept after {current_concept_id} - reached end of learning path")
+        logger.info("No next concept after %s - reached end of learning path", current_concept_id)
         return None
 
     except Exception as e:
-        logger.error(f"Error determining next concept after {current_concept_id}: {e}")
+        logger.error("Error determining next concept after %s: %s", current_concept_id, e)
         return None
 
 
@@ -1235,13 +1381,15 @@ def load_external_resources(concept_id: str = None, learner_profile: Dict[str, A
 # Cumulative Review Functions
 # ============================================================================
 
-def get_eligible_concepts_for_cumulative(learner_id: str, min_mastery: float = 0.6) -> List[str]:
+def get_eligible_concepts_for_cumulative(learner_id: str, min_mastery: float = 0.6,
+                                         model: Optional[Dict[str, Any]] = None) -> List[str]:
     """
     Get concepts eligible for cumulative review (those with sufficient mastery).
 
     Args:
         learner_id: Unique identifier for the learner
         min_mastery: Minimum mastery score to be eligible for cumulative review (default 0.6)
+        model: Already-loaded learner model, to avoid reloading it (optional)
 
     Returns:
         List of concept IDs eligible for cumulative review
@@ -1250,7 +1398,8 @@ def get_eligible_concepts_for_cumulative(learner_id: str, min_mastery: float = 0
         FileNotFoundError: If learner doesn't exist
     """
     try:
-        model = load_learner_model(learner_id)
+        if model is None:
+            model = load_learner_model(learner_id)
 
         eligible_concepts = []
         for concept_id, concept_data in model["concepts"].items():
@@ -1266,13 +1415,15 @@ def get_eligible_concepts_for_cumulative(learner_id: str, min_mastery: float = 0
         raise
 
 
-def select_concepts_for_cumulative(learner_id: str, count: int = 3) -> List[str]:
+def select_concepts_for_cumulative(learner_id: str, count: int = 3,
+                                   model: Optional[Dict[str, Any]] = None) -> List[str]:
     """
     Select random concepts for cumulative review questions.
 
     Args:
         learner_id: Unique identifier for the learner
         count: Number of concepts to select (default 3, will select min of count or available)
+        model: Already-loaded learner model, to avoid reloading it (optional)
 
     Returns:
         List of concept IDs for cumulative review
@@ -1282,7 +1433,7 @@ def select_concepts_for_cumulative(learner_id: str, count: int = 3) -> List[str]
         ValueError: If no eligible concepts available
     """
     try:
-        eligible = get_eligible_concepts_for_cumulative(learner_id)
+        eligible = get_eligible_concepts_for_cumulative(learner_id, model=model)
 
         if not eligible:
             raise ValueError(f"No eligible concepts for cumulative review (none with mastery >= 0.6)")
@@ -1299,7 +1450,7 @@ def select_concepts_for_cumulative(learner_id: str, count: int = 3) -> List[str]
         raise
 
 
-def should_show_cumulative_review(learner_id: str) -> bool:
+def should_show_cumulative_review(learner_id: str, model: Optional[Dict[str, Any]] = None) -> bool:
     """
     Determine if cumulative review should be shown based on learner progress.
 
@@ -1310,6 +1461,7 @@ def should_show_cumulative_review(learner_id: str) -> bool:
 
     Args:
         learner_id: Unique identifier for the learner
+        model: Already-loaded learner model, to avoid reloading it (optional)
 
     Returns:
         True if cumulative review should be shown
@@ -1318,10 +1470,11 @@ def should_show_cumulative_review(learner_id: str) -> bool:
         FileNotFoundError: If learner doesn't exist
     """
     try:
-        model = load_learner_model(learner_id)
+        if model is None:
+            model = load_learner_model(learner_id)
 
         # Check if at least 3 concepts are eligible
-        eligible = get_eligible_concepts_for_cumulative(learner_id)
+        eligible = get_eligible_concepts_for_cumulative(learner_id, model=model)
         if len(eligible) < 3:
             logger.info(f"Not enough eligible concepts for cumulative review: {len(eligible)}/3")
             return False
@@ -1344,7 +1497,8 @@ def should_show_cumulative_review(learner_id: str) -> bool:
         return False
 
 
-def should_show_confidence_rating(learner_id: str, current_concept_id: str) -> bool:
+def should_show_confidence_rating(learner_id: str, current_concept_id: str,
+                                  model: Optional[Dict[str, Any]] = None) -> bool:
     """
     Determine if confidence rating should be shown based on learner performance.
 
@@ -1356,6 +1510,7 @@ def should_show_confidence_rating(learner_id: str, current_concept_id: str) -> b
     Args:
         learner_id: Unique identifier for the learner
         current_concept_id: Current concept being practiced
+        model: Already-loaded learner model, to avoid reloading it (optional)
 
     Returns:
         True if confidence rating should be shown
@@ -1364,7 +1519,8 @@ def should_show_confidence_rating(learner_id: str, current_concept_id: str) -> b
         FileNotFoundError: If learner doesn't exist
     """
     try:
-        model = load_learner_model(learner_id)
+        if model is None:
+            model = load_learner_model(learner_id)
 
         # Get current concept data
         concept_data = model.get("concepts", {}).get(current_concept_id, {})
@@ -1408,7 +1564,8 @@ def should_show_confidence_rating(learner_id: str, current_concept_id: str) -> b
 # Adaptive Scaffolding & Difficulty Adjustment
 # ============================================================================
 
-def calculate_recent_performance(learner_id: str, concept_id: str, window_size: int = 5) -> float:
+def calculate_recent_performance(learner_id: str, concept_id: str, window_size: int = 5,
+                                 model: Optional[Dict[str, Any]] = None) -> float:
     """
     Calculate learner's performance over recent questions.
 
@@ -1416,6 +1573,7 @@ def calculate_recent_performance(learner_id: str, concept_id: str, window_size:
         learner_id: Unique identifier for the learner
         concept_id: Current concept being practiced
         window_size: Number of recent questions to consider (default 5)
+        model: Already-loaded learner model, to avoid reloading it (optional)
 
     Returns:
         Performance ratio (0.0 to 1.0) representing proportion of correct answers
@@ -1426,7 +1584,8 @@ def calculate_recent_performance(learner_id: str, concept_id: str, window_size:
     try:
         from .constants import DIFFICULTY_ASSESSMENT_WINDOW
 
-        model = load_learner_model(learner_id)
+        if model is None:
+            model = load_learner_model(learner_id)
         concept_data = model.get("concepts", {}).get(concept_id, {})
         assessments = concept_data.get("assessments", [])
 
@@ -1450,7 +1609,8 @@ def calculate_recent_performance(learner_id: str, concept_id: str, window_size:
         return 0.5  # Return neutral on error
 
 
-def select_question_difficulty(learner_id: str, concept_id: str) -> str:
+def select_question_difficulty(learner_id: str, concept_id: str,
+                               model: Optional[Dict[str, Any]] = None) -> str:
     """
     Determine appropriate question difficulty based on recent performance.
 
@@ -1462,6 +1622,7 @@ def select_question_difficulty(learner_id: str, concept_id: str) -> str:
     Args:
         learner_id: Unique identifier for the learner
         concept_id: Current concept being practiced
+        model: Already-loaded learner model, to avoid reloading it (optional)
 
     Returns:
         Difficulty level string: "easier", "appropriate", or "harder"
@@ -1478,7 +1639,7 @@ def select_question_difficulty(learner_id: str, concept_id: str) -> str:
             DIFFICULTY_HARDER
         )
 
-        recent_performance = calculate_recent_performance(learner_id, concept_id)
+        recent_performance = calculate_recent_performance(learner_id, concept_id, model=model)
 
         if recent_performance < DIFFICULTY_DOWN_THRESHOLD:
             difficulty = DIFFICULTY_EASIER
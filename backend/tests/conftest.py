@@ -12,6 +12,24 @@ from pathlib import Path
 backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
+from app import tools
+from app.config import config
+
+
+@pytest.fixture
+def learner_dir(tmp_path, monkeypatch):
+    """Fixture pointing learner model storage at an empty temporary directory."""
+    monkeypatch.setattr(type(config), "LEARNER_MODELS_DIR", tmp_path)
+    monkeypatch.setattr(tools, "_LEARNER_MODEL_CACHE", {})
+    return tmp_path
+
+
+@pytest.fixture
+def learner(learner_dir):
+    """Fixture creating a fresh learner in the temporary learner directory."""
+    tools.create_learner_model("test-learner", "Test Learner")
+    return "test-learner"
+
 
 @pytest.fixture
 def sample_learner_profile():
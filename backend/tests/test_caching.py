@@ -0,0 +1,124 @@
+"""
+Tests for in-process caching utilities
+
+These tests cover expiry and eviction in TTLCache and the chat and
+content generation response caches.
+"""
+
+from concurrent.futures import Future
+
+from app import agent, caching, tools
+from app.caching import TTLCache
+
+
+class TestTTLCache:
+    """Tests for the TTL + LRU cache."""
+
+    def test_get_returns_stored_value(self):
+        """Test that a stored value is returned before it expires."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+
+    def test_entries_expire(self, monkeypatch):
+        """Test that entries are dropped once their TTL has passed."""
+        now = [1000.0]
+        monkeypatch.setattr(caching.time, "monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+
+        now[0] += 11
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+
+class TestChatResponseCacheKey:
+    """Tests for chat_response_cache_key()."""
+
+    def test_normalizes_message(self, learner):
+        """Test that case and whitespace differences share a key."""
+        assert agent.chat_response_cache_key(learner, "What is  my progress?", []) == \
+            agent.chat_response_cache_key(learner, "what is my progress?", [])
+
+    def test_key_depends_on_history_and_state(self, learner):
+        """Test that history or learner state changes produce a new key."""
+        key = agent.chat_response_cache_key(learner, "hi", [])
+        assert key != agent.chat_response_cache_key(learner, "hi", [{"role": "user", "content": "salve"}])
+
+        model = tools.load_learner_model(learner)
+        model["current_concept"] = "concept-002"
+        tools.save_learner_model(learner, model)
+        assert key != agent.chat_response_cache_key(learner, "hi", [])
+
+    def test_unknown_learner_has_no_key(self, learner):
+        """Test that missing learners are never cached."""
+        assert agent.chat_response_cache_key("nobody", "hi", []) is None
+
+
+class TestGenerationResponseCache:
+    """Tests for the short-lived content generation response cache."""
+
+    def _generation(self, request="Generate a question", updated_at="t1"):
+        return {
+            "system_prompt": [{"type": "text", "text": "system"}],
+            "request": request,
+            "learner_model": {"updated_at": updated_at},
+            "is_cumulative": False,
+            "cumulative_concepts": [],
+            "external_resources": None
+        }
+
+    def test_key_depends_on_prompt_and_state(self):
+        """Test that prompt or learner state changes produce a new key."""
+        key = agent.generation_cache_key("learner", self._generation())
+        assert key == agent.generation_cache_key("learner", self._generation())
+        assert key != agent.generation_cache_key("other", self._generation())
+        assert key != agent.generation_cache_key("learner", self._generation(request="Generate a lesson"))
+        assert key != agent.generation_cache_key("learner", self._generation(updated_at="t2"))
+
+    def test_retry_reuses_successful_response(self, monkeypatch):
+        """Test that a repeated generation does not call the API again."""
+        calls = []
+        monkeypatch.setattr(agent, "_GENERATION_RESPONSE_CACHE", TTLCache(maxsize=4, ttl=60))
+        monkeypatch.setattr(agent, "_build_generation_prompt", lambda *args: self._generation())
+        monkeypatch.setattr(agent, "call_anthropic_with_retry", lambda **kwargs: calls.append(1) or "response")
+        monkeypatch.setattr(
+            agent, "_process_generation_response",
+            lambda response, generation, learner_id, stage: {"success": True, "content": response}
+        )
+
+        first = agent.generate_content("learner", "practice")
+        second = agent.generate_content("learner", "practice")
+
+        assert first == second == {"success": True, "content": "response"}
+        assert len(calls) == 1
+
+    def test_api_error_cancels_external_resources(self, monkeypatch):
+        """Test that a failed generation cancels the pending resources load."""
+        future = Future()
+        generation = dict(self._generation(), external_resources=future)
+        monkeypatch.setattr(agent, "_GENERATION_RESPONSE_CACHE", TTLCache(maxsize=4, ttl=60))
+        monkeypatch.setattr(agent, "_build_generation_prompt", lambda *args: generation)
+
+        def fail(**kwargs):
+            raise RuntimeError("API unavailable")
+
+        monkeypatch.setattr(agent, "call_anthropic_with_retry", fail)
+
+        result = agent.generate_content("learner", "remediate")
+
+        assert result["success"] is False
+        assert future.cancelled()
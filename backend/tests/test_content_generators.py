@@ -10,6 +10,7 @@ from app.content_generators import (
     generate_preview_request,
     generate_diagnostic_request,
     generate_practice_request,
+    generate_remediation_request,
     build_question_context_string
 )
 
@@ -82,6 +83,34 @@ class TestPracticeGeneration:
         assert 'is_cumulative: true' in request
 
 
+class TestRemediationGeneration:
+    """Tests for remediation content request generation."""
+
+    def test_full_calibration_example_set(self):
+        """Test overconfident remediation for narrative learners."""
+        request = generate_remediation_request(None, 4, 'full_calibration', 'narrative')
+        assert request.startswith('The student answered incorrectly with 4/4 confidence (overconfident).')
+        assert "type must be 'example-set'" in request
+
+    def test_unknown_type_uses_default(self):
+        """Test that unrecognized remediation types fall back to the default lesson."""
+        request = generate_remediation_request(None, 2, 'something-else', 'adaptive')
+        assert request.startswith("Generate a brief 'lesson'")
+
+    def test_default_paradigm_table_falls_back_to_lesson(self, monkeypatch):
+        """Test that content types without a template use the lesson template."""
+        from app import content_generators
+        monkeypatch.setattr(content_generators, '_select_remediation_content_type', lambda style: 'paradigm-table')
+        request = generate_remediation_request(None, 2, 'default', 'varied')
+        assert "type must be 'lesson'" in request
+
+    def test_context_braces_are_not_formatted(self):
+        """Test that braces in learner-supplied context pass through unchanged."""
+        question_context = {'scenario': 'Use {confidence} here', 'question': 'Q?', 'options': []}
+        request = generate_remediation_request(question_context, 1, 'supportive', 'dialogue')
+        assert 'Use {confidence} here' in request
+
+
 class TestQuestionContextBuilder:
     """Tests for question context string builder."""
 
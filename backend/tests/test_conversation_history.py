@@ -0,0 +1,112 @@
+"""
+Tests for conversation history handling in the chat loop
+
+These tests ensure long conversations are trimmed to a bounded window
+without breaking tool_use/tool_result pairing.
+"""
+
+from types import SimpleNamespace
+
+from app import agent
+
+
+def make_history(turns):
+    """Build a simple alternating user/assistant history."""
+    history = []
+    for i in range(turns):
+        history.append({"role": "user", "content": f"question {i}"})
+        history.append({"role": "assistant", "content": f"answer {i}"})
+    return history
+
+
+class TestTrimConversationHistory:
+    """Tests for trim_conversation_history()."""
+
+    def test_short_history_unchanged(self):
+        """Test that histories within the limit are returned as-is."""
+        history = make_history(3)
+        assert agent.trim_conversation_history(history, max_messages=10) is history
+
+    def test_trims_and_summarizes(self):
+        """Test that older messages are dropped and summarized."""
+        history = make_history(6)
+        trimmed = agent.trim_conversation_history(history, max_messages=4)
+
+        assert len(trimmed) == 4
+        assert trimmed[0]["role"] == "user"
+        assert trimmed[0]["content"].startswith(agent.HISTORY_SUMMARY_HEADER)
+        assert "- question 0" in trimmed[0]["content"]
+        assert trimmed[0]["content"].endswith("question 4")
+        assert history[8] == {"role": "user", "content": "question 4"}
+
+    def test_window_never_starts_on_tool_result(self):
+        """Test that the window skips forward past tool results."""
+        history = make_history(2) + [
+            {"role": "user", "content": "check my progress"},
+            {"role": "assistant", "content": [{"type": "tool_use", "id": "t1", "name": "calculate_mastery", "input": {}}]},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t1", "content": "{}"}]},
+            {"role": "assistant", "content": "done"},
+            {"role": "user", "content": "next"},
+        ]
+        trimmed = agent.trim_conversation_history(history, max_messages=3)
+
+        assert len(trimmed) == 1
+        assert trimmed[0]["content"].endswith("next")
+
+    def test_summary_carries_forward(self):
+        """Test that repeated trimming keeps earlier summary lines."""
+        trimmed = agent.trim_conversation_history(make_history(6), max_messages=4)
+        trimmed += [{"role": "user", "content": "question 6"}, {"role": "assistant", "content": "answer 6"}]
+        trimmed = agent.trim_conversation_history(trimmed, max_messages=4)
+
+        assert "- question 0" in trimmed[0]["content"]
+        assert "- question 4" in trimmed[0]["content"]
+        assert trimmed[0]["content"].count(agent.HISTORY_SUMMARY_HEADER) == 1
+
+
+class TestCompactToolResults:
+    """Tests for compact_tool_results()."""
+
+    def tool_turn(self, question, tool_id):
+        """Build one user turn that used a tool."""
+        return [
+            {"role": "user", "content": question},
+            {"role": "assistant", "content": [
+                {"type": "text", "text": "Let me look."},
+                {"type": "tool_use", "id": tool_id, "name": "load_resource", "input": {}}
+            ]},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": tool_id, "content": '{"data": "long"}'}]},
+            {"role": "assistant", "content": "Here it is."},
+        ]
+
+    def test_recent_turns_unchanged(self):
+        """Test that histories with few turns are returned as-is."""
+        history = self.tool_turn("q1", "t1") + self.tool_turn("q2", "t2")
+        assert agent.compact_tool_results(history, keep_turns=2) is history
+
+    def test_compacts_older_tool_results(self):
+        """Test that old results become placeholders and recent ones are kept."""
+        history = self.tool_turn("q1", "t1") + self.tool_turn("q2", "t2")
+        compacted = agent.compact_tool_results(history, keep_turns=1)
+
+        assert compacted[2]["content"] == [
+            {"type": "tool_result", "tool_use_id": "t1", "content": "[previous load_resource result omitted]"}
+        ]
+        assert compacted[1] == history[1]
+        assert compacted[6] == history[6]
+        assert history[2]["content"][0]["content"] == '{"data": "long"}'
+
+
+class TestSerializeContentBlocks:
+    """Tests for serialize_content_blocks()."""
+
+    def test_keeps_only_replay_fields(self):
+        """Test that SDK blocks become plain text/tool_use dicts."""
+        content = [
+            SimpleNamespace(type="text", text="Let me check.", citations=None),
+            SimpleNamespace(type="tool_use", id="t1", name="load_resource", input={"concept_id": "concept-001"}),
+        ]
+        assert agent.serialize_content_blocks(content) == [
+            {"type": "text", "text": "Let me check."},
+            {"type": "tool_use", "id": "t1", "name": "load_resource", "input": {"concept_id": "concept-001"}},
+        ]
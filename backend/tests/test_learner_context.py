@@ -0,0 +1,67 @@
+"""
+Tests for the learner context section of the tutor system prompt
+"""
+
+import pytest
+from app import agent, tools
+
+
+@pytest.fixture
+def learner(learner, monkeypatch):
+    """Fixture seeding the shared learner with a few assessments on the current concept."""
+    monkeypatch.setattr(agent, "_LEARNER_CONTEXT_CACHE", {})
+    model = tools.load_learner_model(learner)
+    model["profile"] = {"learningStyle": "narrative"}
+    model["concepts"]["concept-001"] = {
+        "status": "in_progress",
+        "assessments": [{"score": 1.0}, {"score": 1.0}, {"score": 0.0}, {"score": 1.0}],
+        "confidence_history": [],
+        "mastery_score": 0.75
+    }
+    tools.save_learner_model(learner, model)
+    return learner
+
+
+class TestBuildLearnerContext:
+    """Tests for build_learner_context()."""
+
+    def test_includes_profile_and_progress(self, learner):
+        """Test that profile guidance and progress are rendered."""
+        context = agent.build_learner_context(learner)
+
+        assert f"**Learner ID**: {learner}" in context
+        assert context.count("**Content Format Preference**: Generate 'example-set'") == 1
+        assert "**Current Concept**: concept-001" in context
+        assert "**Current Mastery Score**: 0.75" in context
+
+    def test_includes_precomputed_mastery(self, learner):
+        """Test that the mastery analysis matches calculate_mastery()."""
+        mastery = tools.calculate_mastery(learner, "concept-001")
+        context = agent.build_learner_context(learner)
+
+        assert f"**Mastery Status**: {mastery['recommendation']} - {mastery['reason']}" in context
+
+    def test_omits_tool_hint(self, learner):
+        """Test that the shared context has no tool hint, since generation sends no tools."""
+        assert "calculate_mastery" not in agent.build_learner_context(learner)
+
+    def test_unknown_learner_returns_empty(self, learner):
+        """Test that a missing learner yields no context instead of raising."""
+        assert agent.build_learner_context("nobody") == ""
+
+    def test_reuses_context_until_model_saved(self, learner, monkeypatch):
+        """Test that the rendered context is cached until the model changes."""
+        loads = []
+        real_load = agent.load_learner_model
+        monkeypatch.setattr(agent, "load_learner_model", lambda learner_id: loads.append(learner_id) or real_load(learner_id))
+
+        first = agent.build_learner_context(learner)
+        assert agent.build_learner_context(learner) is first
+        assert len(loads) == 1
+
+        model = tools.load_learner_model(learner)
+        model["current_concept"] = "concept-002"
+        tools.save_learner_model(learner, model)
+
+        assert "**Current Concept**: concept-002" in agent.build_learner_context(learner)
+        assert len(loads) == 2
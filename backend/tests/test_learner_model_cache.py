@@ -0,0 +1,138 @@
+"""
+Tests for learner model caching
+
+These tests ensure cached learner models stay consistent with the
+files on disk and are safe for callers to mutate.
+"""
+
+import os
+import pytest
+from app import tools
+from app.config import config
+
+
+class TestLearnerModelCache:
+    """Tests for the mtime-keyed learner model cache."""
+
+    def test_returns_independent_copies(self, learner):
+        """Test that mutating a loaded model does not leak into later loads."""
+        model = tools.load_learner_model(learner)
+        model["current_concept"] = "concept-999"
+
+        assert tools.load_learner_model(learner)["current_concept"] == "concept-001"
+
+    def test_save_writes_through(self, learner):
+        """Test that a saved model is returned by the next load."""
+        model = tools.load_learner_model(learner)
+        model["current_concept"] = "concept-002"
+        tools.save_learner_model(learner, model)
+
+        assert tools.load_learner_model(learner)["current_concept"] == "concept-002"
+
+    def test_reloads_external_changes(self, learner_dir, learner):
+        """Test that edits made outside save_learner_model are picked up."""
+        tools.load_learner_model(learner)
+
+        learner_file = learner_dir / f"{learner}.json"
+        learner_file.write_text(
+            learner_file.read_text(encoding="utf-8").replace("concept-001", "concept-003"),
+            encoding="utf-8"
+        )
+        stat = os.stat(learner_file)
+        os.utime(learner_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert tools.load_learner_model(learner)["current_concept"] == "concept-003"
+
+    def test_missing_learner_raises(self, learner_dir):
+        """Test that loading an unknown learner raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            tools.load_learner_model("does-not-exist")
+
+    def test_loads_legacy_non_finite_values(self, learner_dir, learner):
+        """Test that files containing NaN (written by the json module) still load."""
+        learner_file = learner_dir / f"{learner}.json"
+        learner_file.write_text('{"current_concept": "concept-001", "score": NaN}', encoding="utf-8")
+        stat = os.stat(learner_file)
+        os.utime(learner_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        model = tools.load_learner_model(learner)
+        assert model["current_concept"] == "concept-001"
+        assert model["score"] != model["score"]
+
+
+class TestPreloadedModel:
+    """Tests for helpers that accept an already-loaded learner model."""
+
+    def test_helpers_skip_reload(self, learner, monkeypatch):
+        """Test that passing the model avoids loading it from disk again."""
+        model = tools.load_learner_model(learner)
+        model["concepts"]["concept-001"] = {"mastery_score": 0.9}
+        monkeypatch.setattr(tools, "load_learner_model", lambda learner_id: pytest.fail("model reloaded"))
+
+        tools.should_show_cumulative_review(learner, model=model)
+        assert tools.select_concepts_for_cumulative(learner, model=model) == ["concept-001"]
+        tools.select_question_difficulty(learner, "concept-001", model=model)
+        tools.should_show_confidence_rating(learner, "concept-001", model=model)
+
+
+class TestConceptCalibrationCache:
+    """Tests for the stored per-concept calibration metrics."""
+
+    def test_reuses_stored_metrics(self, monkeypatch):
+        """Test that metrics are not recomputed while the history is unchanged."""
+        calls = []
+        real = tools.calculate_overall_calibration
+        monkeypatch.setattr(tools, "calculate_overall_calibration", lambda h: calls.append(1) or real(h))
+        concept_data = {"confidence_history": [{"error": 0}, {"error": 1}]}
+
+        first = tools.get_concept_calibration(concept_data)
+        second = tools.get_concept_calibration(concept_data)
+
+        assert first == second == real(concept_data["confidence_history"])
+        assert len(calls) == 1
+
+    def test_recomputes_after_new_record(self):
+        """Test that appending a confidence record refreshes the metrics."""
+        concept_data = {"confidence_history": [{"error": 0}]}
+        assert tools.get_concept_calibration(concept_data)["total_assessments"] == 1
+
+        concept_data["confidence_history"].append({"error": 2})
+        assert tools.get_concept_calibration(concept_data)["total_assessments"] == 2
+
+
+class TestResourceFileCache:
+    """Tests for the mtime-keyed resource bank file cache."""
+
+    @pytest.fixture
+    def concept_dir(self, tmp_path, monkeypatch):
+        """Fixture pointing concept lookups at a temporary directory."""
+        monkeypatch.setattr(config, "get_concept_dir", lambda concept_id, course_id=None: tmp_path)
+        monkeypatch.setattr(tools, "_RESOURCE_FILE_CACHE", {})
+        (tmp_path / "metadata.json").write_text('{"title": "First Declension"}', encoding="utf-8")
+        return tmp_path
+
+    def test_reuses_unchanged_file(self, concept_dir):
+        """Test that a second load is served from the cache."""
+        tools.load_concept_metadata("concept-001")
+        assert concept_dir / "metadata.json" in tools._RESOURCE_FILE_CACHE
+
+        metadata = tools.load_concept_metadata("concept-001")
+        metadata["title"] = "Mutated"
+
+        assert tools.load_concept_metadata("concept-001")["title"] == "First Declension"
+
+    def test_reloads_when_file_changes(self, concept_dir):
+        """Test that editing a resource file invalidates the cache."""
+        metadata_file = concept_dir / "metadata.json"
+        tools.load_concept_metadata("concept-001")
+
+        metadata_file.write_text('{"title": "Second Declension"}', encoding="utf-8")
+        stat = os.stat(metadata_file)
+        os.utime(metadata_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert tools.load_concept_metadata("concept-001")["title"] == "Second Declension"
+
+    def test_missing_file_raises(self, concept_dir):
+        """Test that a missing resource still raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="Text explainer not found"):
+            tools.load_resource("concept-001", "text-explainer")
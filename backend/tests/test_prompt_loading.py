@@ -0,0 +1,151 @@
+"""
+Tests for system prompt loading and caching
+
+These tests ensure that prompt files are only re-read from disk
+when they change.
+"""
+
+import os
+import pytest
+from app import agent
+from app.config import config
+
+
+@pytest.fixture
+def prompt_files(tmp_path, monkeypatch):
+    """Fixture pointing the system prompt config at temporary files."""
+    main_file = tmp_path / "system.md"
+    confidence_file = tmp_path / "confidence.md"
+    main_file.write_text("Main prompt", encoding="utf-8")
+    confidence_file.write_text("Confidence addendum", encoding="utf-8")
+
+    monkeypatch.setattr(config, "SYSTEM_PROMPT_FILE", main_file)
+    monkeypatch.setattr(config, "CONFIDENCE_PROMPT_FILE", confidence_file)
+    monkeypatch.setattr(agent, "_PROMPT_FILE_CACHE", {})
+    monkeypatch.setattr(agent, "_SYSTEM_PROMPT_CACHE", None)
+    return main_file, confidence_file
+
+
+class TestSystemPromptCache:
+    """Tests for mtime-based system prompt caching."""
+
+    def test_combines_prompt_files(self, prompt_files):
+        """Test that the main prompt and addendum are combined."""
+        assert agent.load_system_prompt() == "Main prompt\n\nConfidence addendum"
+
+    def test_reuses_cached_prompt(self, prompt_files):
+        """Test that repeated loads return the cached string."""
+        first = agent.load_system_prompt()
+        second = agent.load_system_prompt()
+        assert first is second
+
+    def test_reloads_when_file_changes(self, prompt_files):
+        """Test that editing a prompt file invalidates the cache."""
+        main_file, _ = prompt_files
+        agent.load_system_prompt()
+
+        main_file.write_text("Edited prompt", encoding="utf-8")
+        stat = os.stat(main_file)
+        os.utime(main_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert agent.load_system_prompt().startswith("Edited prompt")
+
+    def test_reload_prompts_clears_cache(self, prompt_files):
+        """Test that reload_prompts() forces the next load to rebuild."""
+        first = agent.load_system_prompt()
+        agent.reload_prompts()
+        second = agent.load_system_prompt()
+
+        assert first == second
+        assert first is not second
+
+    def test_production_skips_file_checks(self, prompt_files, monkeypatch):
+        """Test that production reuses the built prompt without re-reading files."""
+        main_file, _ = prompt_files
+        monkeypatch.setattr(config, "ENVIRONMENT", "production")
+        first = agent.load_system_prompt()
+
+        main_file.unlink()
+
+        assert agent.load_system_prompt() is first
+
+
+class TestCachedSystemPrompt:
+    """Tests for the prompt-caching system prompt structure."""
+
+    def test_marks_base_prompt_for_caching(self):
+        """Test that only the static base prompt carries cache_control."""
+        blocks = agent.build_cached_system_prompt("Base", "\n\nLearner")
+        assert blocks[0] == {"type": "text", "text": "Base", "cache_control": {"type": "ephemeral"}}
+        assert blocks[1] == {"type": "text", "text": "\n\nLearner"}
+
+    def test_omits_empty_learner_context(self):
+        """Test that an empty learner context adds no block."""
+        assert len(agent.build_cached_system_prompt("Base", "")) == 1
+
+    def test_caches_learner_context_before_dynamic_context(self):
+        """Test that a dynamic tail moves the second breakpoint onto the learner context."""
+        blocks = agent.build_cached_system_prompt("Base", "\n\nLearner", "\n\nRecent questions")
+        assert [block.get("cache_control") for block in blocks] == [
+            {"type": "ephemeral"},
+            {"type": "ephemeral"},
+            None
+        ]
+        assert blocks[2]["text"] == "\n\nRecent questions"
+
+    def test_history_breakpoint_on_last_message(self):
+        """Test that only the final message is marked, without touching the history."""
+        history = [
+            {"role": "user", "content": "Salve"},
+            {"role": "assistant", "content": [{"type": "text", "text": "Salve!"}]},
+            {"role": "user", "content": "Quid agis?"},
+        ]
+
+        marked = agent.mark_history_cache_breakpoint(history)
+
+        assert marked[:2] == history[:2]
+        assert marked[2] == {
+            "role": "user",
+            "content": [{"type": "text", "text": "Quid agis?", "cache_control": {"type": "ephemeral"}}]
+        }
+        assert history[2] == {"role": "user", "content": "Quid agis?"}
+
+    def test_tool_block_cached_at_last_tool(self):
+        """Test that only the last tool definition is marked for caching."""
+        tools = agent.CACHED_TOOL_DEFINITIONS
+        assert "cache_control" in tools[-1]
+        assert all("cache_control" not in tool for tool in tools[:-1])
+        assert "cache_control" not in agent.TOOL_DEFINITIONS[-1]
+
+    def test_tool_definitions_are_read_only(self):
+        """Test that shared tool definitions cannot be mutated by a request."""
+        with pytest.raises(TypeError):
+            agent.TOOL_DEFINITIONS[0]["name"] = "changed"
+        with pytest.raises(TypeError):
+            agent.CACHED_TOOL_DEFINITIONS[-1]["cache_control"]["type"] = "changed"
+
+
+class TestContentGenerationPromptCache:
+    """Tests for content generation prompt loading."""
+
+    @pytest.fixture
+    def content_prompt(self, tmp_path, monkeypatch):
+        """Fixture pointing the default and course prompts at temporary files."""
+        default_file = tmp_path / "content.md"
+        default_file.write_text("Default content prompt", encoding="utf-8")
+        course_dir = tmp_path / "course"
+        course_dir.mkdir()
+
+        monkeypatch.setattr(config, "CONTENT_GENERATION_PROMPT_FILE", default_file)
+        monkeypatch.setattr(config, "get_course_dir", lambda course_id: course_dir)
+        monkeypatch.setattr(agent, "_PROMPT_FILE_CACHE", {})
+        return course_dir
+
+    def test_falls_back_to_default_prompt(self, content_prompt):
+        """Test that a course without an addendum uses the default prompt."""
+        assert agent.load_content_generation_prompt("some-course") == "Default content prompt"
+
+    def test_prefers_course_prompt(self, content_prompt):
+        """Test that a course-specific addendum replaces the default prompt."""
+        (content_prompt / "content-generation-addendum.md").write_text("Course prompt", encoding="utf-8")
+        assert agent.load_content_generation_prompt("some-course") == "Course prompt"
@@ -0,0 +1,201 @@
+"""
+Tests for tool call execution in the chat loop
+
+These tests ensure tool calls from one assistant turn return results
+in request order and that learner-state writers never overlap readers.
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from app import agent
+
+
+def tool_block(name, block_id):
+    """Build a minimal stand-in for a tool_use content block."""
+    return SimpleNamespace(type="tool_use", name=name, id=block_id, input={"id": block_id})
+
+
+class TestExecuteToolCalls:
+    """Tests for execute_tool_calls()."""
+
+    def test_results_follow_request_order(self, monkeypatch):
+        """Test that results line up with their tool blocks."""
+        def fake_execute_tool(tool_name, tool_input, learner_id=None, course_id=None):
+            # Earlier blocks finish later to shuffle completion order
+            time.sleep(0.05 if tool_input["id"] == "a" else 0)
+            return {"success": True, "data": tool_input["id"]}
+
+        monkeypatch.setattr(agent, "execute_tool", fake_execute_tool)
+        blocks = [tool_block("load_resource", "a"), tool_block("load_assessment", "b")]
+
+        results = asyncio.run(agent.execute_tool_calls(blocks, "learner"))
+
+        assert [r["data"] for r in results] == ["a", "b"]
+
+    def test_writers_run_after_readers(self, monkeypatch):
+        """Test that update_learner_model runs only once readers are done."""
+        events = []
+
+        def fake_execute_tool(tool_name, tool_input, learner_id=None, course_id=None):
+            events.append(("start", tool_input["id"]))
+            time.sleep(0.02)
+            events.append(("end", tool_input["id"]))
+            return {"success": True, "data": tool_input["id"]}
+
+        monkeypatch.setattr(agent, "execute_tool", fake_execute_tool)
+        blocks = [
+            tool_block("update_learner_model", "w1"),
+            tool_block("calculate_mastery", "r1"),
+            tool_block("update_learner_model", "w2"),
+            tool_block("load_resource", "r2"),
+        ]
+
+        results = asyncio.run(agent.execute_tool_calls(blocks, "learner"))
+
+        assert [r["data"] for r in results] == ["w1", "r1", "w2", "r2"]
+        writer_events = [e for e in events if e[1].startswith("w")]
+        assert events[-4:] == writer_events == [("start", "w1"), ("end", "w1"), ("start", "w2"), ("end", "w2")]
+
+    def test_timed_out_tool_returns_error(self, monkeypatch):
+        """Test that a slow reader yields an error result instead of hanging."""
+        def fake_execute_tool(tool_name, tool_input, learner_id=None, course_id=None):
+            time.sleep(0.2 if tool_input["id"] == "slow" else 0)
+            return {"success": True, "data": tool_input["id"]}
+
+        monkeypatch.setattr(agent, "execute_tool", fake_execute_tool)
+        monkeypatch.setattr(agent, "TOOL_TIMEOUT_SECONDS", 0.05)
+        blocks = [tool_block("load_resource", "slow"), tool_block("load_assessment", "fast")]
+
+        results = asyncio.run(agent.execute_tool_calls(blocks, "learner"))
+
+        assert results[0] == {"success": False, "error": "Tool load_resource timed out"}
+        assert results[1] == {"success": True, "data": "fast"}
+
+    def test_runs_on_tool_executor(self, monkeypatch):
+        """Test that tools run on the dedicated tool thread pool."""
+        def fake_execute_tool(tool_name, tool_input, learner_id=None, course_id=None):
+            return {"success": True, "data": threading.current_thread().name}
+
+        monkeypatch.setattr(agent, "execute_tool", fake_execute_tool)
+        blocks = [tool_block("load_resource", "a"), tool_block("update_learner_model", "w")]
+
+        results = asyncio.run(agent.execute_tool_calls(blocks, "learner"))
+
+        assert all(r["data"].startswith("tool") for r in results)
+
+    def test_resolves_course_once_per_turn(self, monkeypatch):
+        """Test that course-scoped tools share one learner model lookup."""
+        loads = []
+        monkeypatch.setattr(agent, "load_learner_model", lambda learner_id: loads.append(learner_id) or {"current_course": "c"})
+
+        def fake_execute_tool(tool_name, tool_input, learner_id=None, course_id=None):
+            return {"success": True, "data": course_id}
+
+        monkeypatch.setattr(agent, "execute_tool", fake_execute_tool)
+        blocks = [tool_block("load_resource", "a"), tool_block("load_assessment", "b")]
+
+        results = asyncio.run(agent.execute_tool_calls(blocks, "learner"))
+
+        assert loads == ["learner"]
+        assert [r["data"] for r in results] == ["c", "c"]
+
+
+class TestToolCallBatch:
+    """Tests for starting tool calls while Claude is still streaming."""
+
+    def test_started_reader_runs_once(self, monkeypatch):
+        """Test that a reader started early is reused rather than re-run."""
+        calls = []
+
+        def fake_execute_tool(tool_name, tool_input, learner_id=None, course_id=None):
+            calls.append(tool_input["id"])
+            return {"success": True, "data": tool_input["id"]}
+
+        monkeypatch.setattr(agent, "execute_tool", fake_execute_tool)
+        blocks = [tool_block("load_resource", "a"), tool_block("update_learner_model", "w")]
+
+        async def run_turn():
+            batch = agent.ToolCallBatch("learner")
+            for block in blocks:
+                batch.start(block)
+            await asyncio.sleep(0.01)
+            early = list(calls)
+            return early, await batch.results(blocks)
+
+        early, results = asyncio.run(run_turn())
+
+        assert early == ["a"]
+        assert calls == ["a", "w"]
+        assert [r["data"] for r in results] == ["a", "w"]
+
+
+class TestExecuteTool:
+    """Tests for execute_tool() dispatch."""
+
+    def test_every_defined_tool_has_handler(self):
+        """Test that each tool offered to Claude can be dispatched."""
+        assert {tool["name"] for tool in agent.TOOL_DEFINITIONS} == set(agent.TOOL_HANDLERS)
+
+    def test_unknown_tool(self):
+        """Test that unknown tools return an error result."""
+        assert agent.execute_tool("not_a_tool", {}) == {"success": False, "error": "Unknown tool: not_a_tool"}
+
+    def test_dispatches_to_handler(self):
+        """Test that a known tool is routed to its handler."""
+        result = agent.execute_tool("track_confidence", {"self_confidence": 3, "actual_score": 0.5})
+        assert result["success"] is True
+        assert "calibration" in result["data"]
+
+    def test_skips_learner_lookup_for_tools_without_course(self, monkeypatch):
+        """Test that only course-scoped tools load the learner model."""
+        loads = []
+        monkeypatch.setattr(agent, "load_learner_model", lambda learner_id: loads.append(learner_id) or {"current_course": "c"})
+
+        agent.execute_tool("track_confidence", {"self_confidence": 3, "actual_score": 0.5}, "learner")
+        assert loads == []
+
+        monkeypatch.setattr(agent, "get_next_concept", lambda current_concept_id, course_id: course_id)
+        result = agent.execute_tool("get_next_concept", {"current_concept_id": "concept-001"}, "learner")
+        assert loads == ["learner"]
+        assert result["data"]["next_concept"] == "c"
+
+    def test_concept_bundle_tolerates_missing_resources(self, tmp_path, monkeypatch):
+        """Test that the bundle tool returns metadata and None for missing resources."""
+        from app.config import config
+
+        (tmp_path / "resources").mkdir()
+        (tmp_path / "metadata.json").write_text('{"title": "First Declension"}', encoding="utf-8")
+        (tmp_path / "resources" / "text-explainer.md").write_text("Explainer", encoding="utf-8")
+        monkeypatch.setattr(config, "get_concept_dir", lambda concept_id, course_id=None: tmp_path)
+
+        result = agent.execute_tool("load_concept_bundle", {"concept_id": "concept-001"})
+
+        assert result["success"] is True
+        assert result["data"]["metadata"]["title"] == "First Declension"
+        assert result["data"]["text_explainer"]["content"] == "Explainer"
+        assert result["data"]["examples"] is None
+
+    def test_external_source_uses_cached_index(self, tmp_path, monkeypatch):
+        """Test that sources are looked up by id and metadata is parsed once."""
+        from app.config import config
+
+        (tmp_path / "metadata.json").write_text(
+            '{"sources": [{"id": "s1", "url": "u1", "type": "web"}, {"id": "s2", "url": "u2", "type": "pdf"}]}',
+            encoding="utf-8"
+        )
+        monkeypatch.setattr(config, "get_concept_dir", lambda concept_id, course_id=None: tmp_path)
+        monkeypatch.setattr(agent, "_SOURCE_INDEX_CACHE", {})
+        monkeypatch.setattr(agent, "load_full_source_content", lambda url, source_type: {"url": url})
+        parses = []
+        real_loads = agent.orjson.loads
+        monkeypatch.setattr(agent.orjson, "loads", lambda data: parses.append(1) or real_loads(data))
+
+        first = agent.execute_tool("load_external_source", {"source_id": "s2", "concept_id": "concept-001"})
+        missing = agent.execute_tool("load_external_source", {"source_id": "s3", "concept_id": "concept-001"})
+
+        assert first == {"success": True, "data": {"url": "u2"}}
+        assert missing == {"success": False, "error": "Source s3 not found"}
+        assert len(parses) == 1
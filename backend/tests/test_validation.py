@@ -6,7 +6,7 @@ before being sent to learners.
 """
 
 import pytest
-from app.agent import validate_diagnostic_content
+from app.agent import strip_video_content, validate_diagnostic_content
 
 
 class TestMultipleChoiceValidation:
@@ -156,3 +156,26 @@ class TestNonDiagnosticContent:
         is_valid, error = validate_diagnostic_content(content)
         assert is_valid == True
         assert error == ""
+
+
+class TestStripVideoContent:
+    """Tests for removing video resources from generated content."""
+
+    def test_keeps_resources_without_videos(self):
+        """Test that a list with no videos is left as-is."""
+        resources = [{"type": "article"}, {"type": "website"}]
+        content = strip_video_content({"type": "lesson", "external_resources": resources})
+        assert content["external_resources"] is resources
+
+    def test_removes_videos(self):
+        """Test that video resources are filtered out."""
+        content = strip_video_content({
+            "type": "lesson",
+            "external_resources": [{"type": "video"}, {"type": "article"}]
+        })
+        assert content["external_resources"] == [{"type": "article"}]
+
+    def test_drops_field_when_only_videos(self):
+        """Test that the field is removed when every resource was a video."""
+        content = strip_video_content({"type": "lesson", "external_resources": [{"type": "video"}]})
+        assert "external_resources" not in content